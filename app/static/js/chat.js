@@ -3,8 +3,40 @@
 // API 기본 URL - 환경변수에서 가져오거나 기본값 사용
 const API_BASE = window.API_BASE_URL || window.location.origin;
 
+// 출생지 자동완성 후보 조회 (입력이 멈춘 뒤 한 번만 요청)
+function setupPlaceAutocomplete() {
+    const input = document.getElementById('birthPlace');
+    const options = document.getElementById('birthPlaceOptions');
+    let timer = null;
+    
+    input.addEventListener('input', () => {
+        clearTimeout(timer);
+        const query = input.value.trim();
+        if (!query) {
+            options.innerHTML = '';
+            return;
+        }
+        timer = setTimeout(async () => {
+            try {
+                const response = await fetch(`${API_BASE}/saju/places?${new URLSearchParams({ q: query })}`);
+                const data = await response.json();
+                options.innerHTML = '';
+                for (const place of data.places || []) {
+                    const option = document.createElement('option');
+                    option.value = place.name;
+                    options.appendChild(option);
+                }
+            } catch (error) {
+                // 자동완성 실패 시 직접 입력한 값 사용
+            }
+        }, 150);
+    });
+}
+
 // DOM이 완전히 로드된 후 실행
 document.addEventListener('DOMContentLoaded', function() {
+    setupPlaceAutocomplete();
+    
     // 오행 계산 폼 이벤트 리스너
     document.getElementById('form-saju-analysis').addEventListener('submit', async (e) => {
     e.preventDefault();
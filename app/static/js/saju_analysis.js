@@ -32,6 +32,9 @@ class SajuAnalysis {
             '금': 'bg-yellow-50 border-yellow-200 text-yellow-700',
             '물': 'bg-blue-50 border-blue-200 text-blue-700'
         };
+
+        // /saju/interpret에 보낼 출생 정보 (URL로 분석했을 때만 설정)
+        this.birthInput = null;
     }
 
     async loadAnalysisFromURL() {
@@ -60,6 +63,13 @@ class SajuAnalysis {
 
                 const data = await response.json();
                 if (data.status === 'success') {
+                    // AI 해석은 서버가 출생 정보로 다시 계산하므로 원래 입력을 보관
+                    this.birthInput = {
+                        birth_date: birthDate,
+                        birth_time: birthTime,
+                        gender: gender,
+                        birth_place: birthPlace
+                    };
                     this.updateAnalysis(data);
                 } else {
                     this.showError(data.error);
@@ -111,6 +121,66 @@ class SajuAnalysis {
 
         // 팁 업데이트
         this.updateTip(fiveElement, dayBranch);
+
+        // AI 해석 스트리밍 (출생 정보가 있을 때만, 예시 데이터는 제외)
+        if (this.birthInput) {
+            this.streamInterpretation(this.birthInput);
+        }
+    }
+
+    async streamInterpretation(birthInput) {
+        // /saju/interpret의 SSE 응답을 받아 도착하는 대로 표시
+        const section = document.getElementById('ai_interpretation');
+        const content = document.getElementById('ai-interpretation-content');
+        if (!section || !content) {
+            return;
+        }
+
+        try {
+            const API_BASE = window.API_BASE_URL || window.location.origin;
+            const response = await fetch(`${API_BASE}/saju/interpret`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify(birthInput)
+            });
+            const contentType = response.headers.get('Content-Type') || '';
+            if (!response.ok || !response.body || !contentType.startsWith('text/event-stream')) {
+                return;
+            }
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            section.classList.remove('hidden');
+
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) {
+                    break;
+                }
+                buffer += decoder.decode(value, { stream: true });
+
+                // 이벤트는 빈 줄로 구분됨
+                const events = buffer.split('\n\n');
+                buffer = events.pop();
+                for (const event of events) {
+                    const dataLine = event.split('\n').find(line => line.startsWith('data: '));
+                    if (!dataLine || dataLine === 'data: [DONE]') {
+                        continue;
+                    }
+                    const data = JSON.parse(dataLine.slice(6));
+                    if (event.startsWith('event: error')) {
+                        section.classList.add('hidden');
+                        return;
+                    }
+                    content.textContent += data.delta;
+                }
+            }
+        } catch (error) {
+            section.classList.add('hidden');
+        }
     }
 
     updateSajuChart(sajuData) {
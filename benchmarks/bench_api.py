@@ -0,0 +1,158 @@
+# API 인프로세스 부하 테스트
+# ASGI 앱을 httpx ASGITransport로 직접 호출해 /saju/analyze, /saju/detailed의
+# p50/p95/p99 지연 시간과 초당 요청 수를 측정한다 (네트워크/서버 프로세스 없음).
+# - hot: 같은 입력 반복 (응답 캐시 적중 경로)
+# - sweep: 매번 다른 입력 (계산 경로)
+# - contended: 큰 /saju/batch 요청을 처리하는 동안의 /saju/analyze 지연 시간 (다른 사용자 요청이 밀리는지)
+# - burst: 적은 수의 고유 입력을 섞어 반복하는 /saju/detailed (공유 링크 폭주, 앱에서 처리한 요청 수 handled/합쳐진 요청 수 coalesced 포함)
+# 속도 제한은 끄고 측정한다 (모든 요청이 같은 클라이언트 주소).
+# 실행: python benchmarks/bench_api.py [--requests 2000] [--concurrency 32] [--batch-rows 50000] [--output result.json]
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from common import ROOT_DIR, emit, environment_info, summarize_latencies
+
+ENDPOINTS = ('/saju/analyze', '/saju/detailed')
+
+# burst 시나리오 고유 입력 수
+BURST_UNIQUE = 50
+
+
+def make_payloads(count, unique, seed=42):
+    """요청 본문 목록 (unique면 날짜/시각을 무작위로, 아니면 같은 입력 반복)"""
+    if not unique:
+        return [{'birth_date': '1997-05-07', 'birth_time': '21:00', 'gender': '남', 'birth_place': '서울'}] * count
+    rng = random.Random(seed)
+    return [
+        {
+            'birth_date': f"{rng.randint(1930, 2020)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            'birth_time': f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+            'gender': rng.choice(('남', '여')),
+            'birth_place': '서울'
+        }
+        for _ in range(count)
+    ]
+
+
+async def load_test(client, path, payloads, concurrency):
+    """동시 요청 concurrency개로 payloads를 모두 보내고 지연 시간 요약 반환"""
+    queue = asyncio.Queue()
+    for payload in payloads:
+        queue.put_nowait(payload)
+    latencies = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        while True:
+            try:
+                payload = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            response = await client.post(path, json=payload)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200 or b'"status":"success"' not in response.content:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {**summarize_latencies(latencies, elapsed), 'errors': errors}
+
+
+def make_batch(rows, seed=7):
+    """/saju/batch 요청 본문 (rows명)"""
+    payloads = make_payloads(rows, True, seed)
+    return {
+        'birth_dates': [payload['birth_date'] for payload in payloads],
+        'birth_times': [payload['birth_time'] for payload in payloads]
+    }
+
+
+async def contention_test(client, payloads, concurrency, batch_rows):
+    """큰 배치 요청과 동시에 /saju/analyze 부하를 걸어 (분석 요청 지연 요약, 배치 처리 요약) 반환"""
+    batch = make_batch(batch_rows)
+
+    async def run_batch():
+        start = time.perf_counter()
+        response = await client.post('/saju/batch', json=batch)
+        elapsed = time.perf_counter() - start
+        lines = response.content.count(b'\n')
+        return {
+            'rows': lines,
+            'rows_per_s': round(lines / elapsed, 1),
+            'elapsed_ms': round(elapsed * 1000, 3),
+            'errors': int(response.status_code != 200 or lines != batch_rows)
+        }
+
+    # 워밍업 (프로세스 풀 기동 등 첫 배치 비용 제외)
+    await run_batch()
+    batch_task = asyncio.create_task(run_batch())
+    # 배치 요청이 계산을 시작한 뒤 분석 요청 시작
+    await asyncio.sleep(0.05)
+    analyze = await load_test(client, '/saju/analyze', payloads, concurrency)
+    return analyze, await batch_task
+
+
+async def run(requests=2000, concurrency=32, batch_rows=50000):
+    import httpx
+
+    # 앱은 저장소 루트 기준 상대 경로(app/static)를 사용
+    os.chdir(ROOT_DIR)
+    # 이전 실행의 차트 저장소가 결과에 섞이지 않도록 임시 파일 사용
+    store_dir = tempfile.mkdtemp(prefix='bench_charts_')
+    os.environ.setdefault('CHART_STORE_PATH', os.path.join(store_dir, 'charts.sqlite3'))
+    os.environ.setdefault('RATE_LIMIT_RATE', '0')
+    import main
+
+    results = {}
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        for scenario, unique in (('hot', False), ('sweep', True)):
+            payloads = make_payloads(requests, unique)
+            for path in ENDPOINTS:
+                main.result_cache.clear()
+                # 워밍업
+                await load_test(client, path, payloads[:100], concurrency)
+                results[f"{scenario} {path}"] = await load_test(client, path, payloads, concurrency)
+
+        main.result_cache.clear()
+        payloads = make_payloads(BURST_UNIQUE, True, seed=23) * max(1, requests // BURST_UNIQUE)
+        random.Random(23).shuffle(payloads)
+        before = main.request_coalescer.stats()
+        burst = await load_test(client, '/saju/detailed', payloads, concurrency)
+        after = main.request_coalescer.stats()
+        results['burst /saju/detailed'] = {
+            **burst,
+            'unique_inputs': BURST_UNIQUE,
+            'handled': after['leaders'] - before['leaders'],
+            'coalesced': after['followers'] - before['followers']
+        }
+
+        main.result_cache.clear()
+        payloads = make_payloads(requests, True, seed=11)
+        analyze, batch = await contention_test(client, payloads, concurrency, batch_rows)
+        results['contended /saju/analyze'] = analyze
+        results[f'contended /saju/batch ({batch_rows} rows)'] = batch
+    return {'benchmark': 'api', 'concurrency': concurrency, 'results': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='API 인프로세스 부하 테스트')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--batch-rows', type=int, default=50000)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+    result = asyncio.run(run(args.requests, args.concurrency, args.batch_rows))
+    emit({'environment': environment_info(), **result}, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# 계산기 마이크로 벤치마크
+# 한 세기(1924~2023년) 전체 날짜에 대해 calculate_four_pillars, calculate_saju,
+# calculate_ten_god, calculate_branch_ten_god, 오행 세력 분포(element_profile, 응답 딕셔너리 포함)의 호출당 시간(μs)과
+# 궁합 후보 MATCH_CANDIDATES명 순위 계산(MatchScorer 생성 포함) 시간(ms)을 측정한다.
+# 실행: python benchmarks/bench_calculator.py [--output result.json]
+
+import argparse
+import itertools
+
+from common import century_sweep, emit, environment_info, time_per_call
+
+from compatibility import ChartFeatures, MatchScorer  # noqa: E402
+from saju_calculator import EARTHLY_BRANCHES, HEAVENLY_STEMS, SajuCalculator  # noqa: E402
+
+# 날짜마다 섞어 쓸 출생 시각 (시지가 골고루 나오도록)
+HOURS = ((0, 30), (5, 10), (9, 45), (13, 0), (17, 20), (21, 55))
+
+# 궁합 순위 계산 후보 수 / 기준 인물 수
+MATCH_CANDIDATES = 5000
+MATCH_QUERIES = 20
+
+
+def run(repeat=3):
+    calculator = SajuCalculator()
+    dates = century_sweep()
+    moments = [
+        (year, month, day, *HOURS[i % len(HOURS)])
+        for i, (year, month, day) in enumerate(dates)
+    ]
+
+    # 절기 캐시를 미리 채워 두고 정상 상태(steady state)를 측정
+    for args in moments:
+        calculator.calculate_four_pillars(*args)
+
+    # 십성은 일간 × 대상 전체 조합을 날짜 수만큼 반복
+    stem_pairs = list(itertools.islice(
+        itertools.cycle(itertools.product(HEAVENLY_STEMS, HEAVENLY_STEMS)), len(dates)))
+    branch_pairs = list(itertools.islice(
+        itertools.cycle(itertools.product(HEAVENLY_STEMS, EARTHLY_BRANCHES)), len(dates)))
+
+    # 궁합 순위: 날짜 순서대로 앞 MATCH_CANDIDATES명을 후보로, 전체에서 고르게 뽑은 기준 인물마다 순위 계산
+    charts = [(calculator.calculate_four_pillars(*args),) for args in moments]
+    packed = [ChartFeatures.from_four_pillars(four_pillars).pack() for four_pillars, in charts]
+    candidates = list(enumerate(packed[:MATCH_CANDIDATES]))
+    queries = [(ChartFeatures.unpack(value),) for value in packed[::len(packed) // MATCH_QUERIES][:MATCH_QUERIES]]
+
+    return {
+        'benchmark': 'calculator',
+        'dates': len(dates),
+        'per_call_us': {
+            'calculate_four_pillars': time_per_call(calculator.calculate_four_pillars, moments, repeat),
+            'calculate_saju': time_per_call(calculator.calculate_saju, moments, repeat),
+            'calculate_ten_god': time_per_call(calculator.calculate_ten_god, stem_pairs, repeat),
+            'calculate_branch_ten_god': time_per_call(calculator.calculate_branch_ten_god, branch_pairs, repeat),
+            'element_profile': time_per_call(
+                lambda four_pillars: four_pillars.element_profile.to_dict(), charts, repeat)
+        },
+        'match_rank_ms': round(time_per_call(
+            lambda features: MatchScorer(features).rank(candidates), queries, repeat) / 1000, 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사주 계산기 마이크로 벤치마크')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+    emit({'environment': environment_info(), **run(args.repeat)}, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# 절기 엔진 벤치마크
+# 연도별 절기 계산이 프로세스당 1회만 발생하고 요청당 비용이 일정하게 유지되는지 확인한다.
+# 실행: python benchmarks/bench_solar_terms.py [--output result.json]
+
+import argparse
+import time
+
+from common import emit, environment_info
+
+import solar_terms  # noqa: E402
+from saju_calculator import SajuCalculator  # noqa: E402
+
+YEARS = range(1900, 2101)
+# 절입일 근처(입춘/경칩)와 일반 날짜를 섞어서 측정
+DATES = ((2, 4, 17, 30), (3, 5, 23, 50), (7, 15, 12, 0), (11, 20, 6, 10))
+
+
+def run_pass(calculator):
+    """전 연도 × 샘플 날짜를 한 바퀴 계산하고 요청당 평균 시간(μs) 반환"""
+    count = 0
+    start = time.perf_counter()
+    for year in YEARS:
+        for month, day, hour, minute in DATES:
+            calculator.calculate_four_pillars(year, month, day, hour, minute)
+            count += 1
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def run(passes=5):
+    solar_terms.solar_terms.cache_clear()
+    calculator = SajuCalculator()
+
+    # 연도별 24절기 1회 계산 비용 (테이블 범위 밖 연도 기준)
+    start = time.perf_counter()
+    solar_terms.compute_solar_terms(2024)
+    year_cost_ms = (time.perf_counter() - start) * 1000
+
+    per_pass = [run_pass(calculator) for _ in range(passes)]
+    cache = solar_terms.solar_terms.cache_info()
+
+    return {
+        'benchmark': 'solar_terms',
+        'year_terms_cost_ms': round(year_cost_ms, 3),
+        'per_request_us_by_pass': [round(p, 2) for p in per_pass],
+        'cache_hits': cache.hits,
+        'cache_misses': cache.misses
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='절기 엔진 벤치마크')
+    parser.add_argument('--passes', type=int, default=5)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+    emit({'environment': environment_info(), **run(args.passes)}, args.output)
+
+
+if __name__ == "__main__":
+    main()
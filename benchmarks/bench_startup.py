@@ -0,0 +1,137 @@
+# 콜드 스타트 벤치마크
+# - imports: python -X importtime으로 main이 직접 불러오는 모듈별 누적 import 시간(ms)과 main 전체
+# - cold_start: uvicorn 프로세스를 새로 띄워 /ready가 응답할 때(listen, 준비 중이면 503), 200일 때(ready),
+#   그 직후 첫 /saju/detailed 요청(first_request_ms)과 두 번째 요청(second_request_ms)의 시간을 runs회 측정해 중앙값을 낸다
+# 오토스케일링으로 새 인스턴스가 트래픽을 받기까지의 시간과 첫 요청이 떠안는 초기화 비용을 본다.
+# 실행: python benchmarks/bench_startup.py [--runs 5] [--port 8931] [--output result.json]
+
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from common import ROOT_DIR, SRC_DIR, emit, environment_info
+
+PAYLOADS = (
+    {'birth_date': '1990-05-15', 'birth_time': '14:30', 'gender': '남', 'birth_place': '서울'},
+    {'birth_date': '1991-06-16', 'birth_time': '09:10', 'gender': '여', 'birth_place': '부산'}
+)
+
+# 기동 대기 한도 (초)
+STARTUP_TIMEOUT = 30.0
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def _env(store_path):
+    return dict(os.environ, PYTHONPATH=SRC_DIR, CHART_STORE_PATH=store_path)
+
+
+def import_times(store_path):
+    """main과 main이 직접 불러오는 모듈의 누적 import 시간(ms), 큰 순서"""
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import main'],
+        cwd=ROOT_DIR, env=_env(store_path), capture_output=True, text=True, check=True
+    ).stderr
+    lines = [IMPORT_LINE.match(line) for line in output.splitlines()]
+    lines = [match for match in lines if match]
+    main_index = next(i for i, match in enumerate(lines) if match.group(4) == 'main')
+    main_depth = len(lines[main_index].group(3))
+    # importtime은 하위 모듈을 부모보다 먼저 출력하므로 main 바로 앞 구간에서 한 단계 아래만 모음
+    start = main_index
+    while start > 0 and len(lines[start - 1].group(3)) > main_depth:
+        start -= 1
+    direct = {
+        match.group(4): round(int(match.group(2)) / 1000, 3)
+        for match in lines[start:main_index]
+        if len(match.group(3)) == main_depth + 2
+    }
+    result = dict(sorted(direct.items(), key=lambda item: item[1], reverse=True))
+    result['main'] = round(int(lines[main_index].group(2)) / 1000, 3)
+    return result
+
+
+def _wait(client, url, deadline, expect_ok):
+    """url이 응답할 때까지(expect_ok면 200일 때까지) 대기"""
+    while time.perf_counter() < deadline:
+        try:
+            response = client.get(url)
+            if not expect_ok or response.status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.002)
+    raise TimeoutError(f'{url} 응답 없음')
+
+
+def cold_start_once(port, store_path):
+    base_url = f'http://127.0.0.1:{port}'
+    with httpx.Client(timeout=2.0) as client:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'uvicorn', 'main:app', '--port', str(port), '--log-level', 'warning'],
+            cwd=ROOT_DIR, env=_env(store_path)
+        )
+        try:
+            deadline = start + STARTUP_TIMEOUT
+            _wait(client, f'{base_url}/ready', deadline, expect_ok=False)
+            listen = time.perf_counter() - start
+            _wait(client, f'{base_url}/ready', deadline, expect_ok=True)
+            ready = time.perf_counter() - start
+            timings = []
+            for payload in PAYLOADS:
+                request_start = time.perf_counter()
+                client.post(f'{base_url}/saju/detailed', json=payload).raise_for_status()
+                timings.append(time.perf_counter() - request_start)
+        finally:
+            process.terminate()
+            process.wait()
+    return {
+        'listen_ms': listen * 1000,
+        'ready_ms': ready * 1000,
+        'first_request_ms': timings[0] * 1000,
+        'second_request_ms': timings[1] * 1000
+    }
+
+
+def _free_port(port):
+    with socket.socket() as sock:
+        if sock.connect_ex(('127.0.0.1', port)) == 0:
+            raise RuntimeError(f'포트 {port}가 이미 사용 중입니다.')
+
+
+def run(runs=5, port=8931):
+    _free_port(port)
+    with tempfile.TemporaryDirectory() as directory:
+        store_path = os.path.join(directory, 'charts.sqlite3')
+        samples = [cold_start_once(port, store_path) for _ in range(runs)]
+        imports = import_times(store_path)
+    return {
+        'benchmark': 'startup',
+        'runs': runs,
+        'imports': imports,
+        'cold_start': {
+            key: round(statistics.median(sample[key] for sample in samples), 3)
+            for key in samples[0]
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='콜드 스타트 벤치마크')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--port', type=int, default=8931)
+    parser.add_argument('--output')
+    args = parser.parse_args()
+    emit({'environment': environment_info(), **run(args.runs, args.port)}, args.output)
+
+
+if __name__ == "__main__":
+    main()
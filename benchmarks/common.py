@@ -0,0 +1,88 @@
+# 벤치마크 공통 유틸리티
+# src 경로 설정, 시간 측정, 백분위 계산, JSON 결과 출력
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+def century_sweep(start_year=1924, years=100):
+    """한 세기 동안의 모든 날짜 (년, 월, 일) 목록"""
+    from saju_calendar import days_in_month
+
+    return [
+        (year, month, day)
+        for year in range(start_year, start_year + years)
+        for month in range(1, 13)
+        for day in range(1, days_in_month(year, month) + 1)
+    ]
+
+
+def percentile(sorted_values, fraction):
+    """정렬된 값 목록의 백분위 (최근접 순위 방식)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize_latencies(latencies, elapsed):
+    """지연 시간(초) 목록을 ms 단위 p50/p95/p99와 초당 요청 수로 요약"""
+    values = sorted(latencies)
+    return {
+        'requests': len(values),
+        'rps': round(len(values) / elapsed, 1) if elapsed else 0.0,
+        'mean_ms': round(statistics.fmean(values) * 1000, 3) if values else 0.0,
+        'p50_ms': round(percentile(values, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(values, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(values, 0.99) * 1000, 3),
+        'max_ms': round(values[-1] * 1000, 3) if values else 0.0
+    }
+
+
+def time_per_call(func, args_list, repeat=3):
+    """args_list 전체를 repeat번 돌려 가장 빠른 회차의 호출당 시간(μs) 반환"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in args_list:
+            func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best / len(args_list) * 1e6, 3)
+
+
+def environment_info():
+    """결과 비교용 실행 환경 정보 (커밋, 파이썬 버전, 플랫폼)"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z')
+    }
+
+
+def emit(result, output=None):
+    """결과를 JSON으로 출력하고, output 경로가 있으면 파일에도 저장"""
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    print(text)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
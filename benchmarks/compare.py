@@ -0,0 +1,61 @@
+# 벤치마크 결과 비교
+# run_all.py가 저장한 두 JSON 파일의 수치 항목을 비교해 변화율을 출력한다.
+# 지연 시간/호출 시간은 증가, 초당 요청 수(rps)는 감소가 회귀이며 threshold(%)를 넘으면 종료 코드 1.
+# 실행: python benchmarks/compare.py base.json new.json [--threshold 10]
+
+import argparse
+import json
+import sys
+
+# 값이 클수록 좋은 항목
+HIGHER_IS_BETTER = ('rps', 'rows_per_s')
+# 비교하지 않는 항목
+SKIPPED_KEYS = ('environment', 'requests', 'rows', 'errors', 'dates', 'concurrency', 'cache_hits', 'cache_misses', 'runs', 'imports',
+                'unique_inputs', 'handled', 'coalesced')
+
+
+def flatten(data, prefix=''):
+    """중첩 dict의 수치 항목을 '경로 → 값'으로 펼침"""
+    items = {}
+    for key, value in data.items():
+        if key in SKIPPED_KEYS:
+            continue
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            items.update(flatten(value, path))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            items[path] = value
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description='벤치마크 결과 비교')
+    parser.add_argument('base')
+    parser.add_argument('new')
+    parser.add_argument('--threshold', type=float, default=10.0, help='회귀로 판단할 변화율(%%)')
+    args = parser.parse_args()
+
+    with open(args.base, encoding='utf-8') as f:
+        base = flatten(json.load(f))
+    with open(args.new, encoding='utf-8') as f:
+        new = flatten(json.load(f))
+
+    regressions = 0
+    for path in sorted(base.keys() & new.keys()):
+        before, after = base[path], new[path]
+        if not before:
+            continue
+        change = (after - before) / before * 100
+        worse = -change if path.rsplit('.', 1)[-1] in HIGHER_IS_BETTER else change
+        marker = ''
+        if worse > args.threshold:
+            marker = '  ← 회귀'
+            regressions += 1
+        print(f"{path:60s} {before:>12.3f} → {after:>12.3f} ({change:+7.1f}%){marker}")
+
+    print(f"\n회귀 {regressions}건 (기준 {args.threshold}%)")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
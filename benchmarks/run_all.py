@@ -0,0 +1,37 @@
+# 전체 벤치마크 실행
+# 계산기/절기 엔진/API/콜드 스타트 벤치마크를 차례로 실행해 하나의 JSON으로 저장한다.
+# 실행: python benchmarks/run_all.py --output bench_output.json
+# 비교: python benchmarks/compare.py base.json new.json
+
+import argparse
+import asyncio
+
+from common import emit, environment_info
+
+import bench_api
+import bench_calculator
+import bench_solar_terms
+import bench_startup
+
+
+def main():
+    parser = argparse.ArgumentParser(description='전체 벤치마크 실행')
+    parser.add_argument('--requests', type=int, default=2000, help='API 시나리오별 요청 수')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--batch-rows', type=int, default=50000, help='contended 시나리오 배치 크기')
+    parser.add_argument('--startup-runs', type=int, default=5, help='콜드 스타트 측정 횟수')
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    result = {
+        'environment': environment_info(),
+        'calculator': bench_calculator.run(),
+        'solar_terms': bench_solar_terms.run(),
+        'api': asyncio.run(bench_api.run(args.requests, args.concurrency, args.batch_rows)),
+        'startup': bench_startup.run(args.startup_runs)
+    }
+    emit(result, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# 운영 배포용 gunicorn 설정 (uvicorn 워커 N개)
+# 실행: ./scripts/run_prod.sh  (또는 gunicorn -c gunicorn.conf.py main:app)
+#
+# - preload_app: 마스터가 앱(만세력/절기 mmap 테이블, 조회 표)을 한 번만 로드한 뒤 fork
+#   → 워커는 같은 메모리 페이지를 공유하고 기동 시 추가 작업이 없음
+# - when_ready: fork 전에 마스터에서 준비 작업(정적 파일 빌드, 만세력 페이지, 출생지 색인, 계산 경로)을 실행해 워커가 데워진 상태를 물려받음
+# - HUP: 설정 재로드 + 워커 순차 교체, 코드 배포는 USR2(새 마스터) → 이전 마스터 TERM (run_prod.sh reload)
+
+import multiprocessing
+import os
+import time
+
+from dotenv import load_dotenv
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+# PORT 등 .env 값을 바인드 설정에도 반영
+load_dotenv(os.path.join(ROOT_DIR, ".env"))
+
+# 기본 차트 저장소 경로(data/charts.sqlite3)가 상대 경로이므로 저장소 루트에서 실행
+chdir = ROOT_DIR
+pythonpath = os.path.join(ROOT_DIR, "src")
+wsgi_app = "main:app"
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8001')}"
+# 계산은 CPU 위주라 코어 수만큼 (WEB_CONCURRENCY로 조정)
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# 요청 처리 중인 워커는 graceful_timeout 동안 마무리 후 종료
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+keepalive = 5
+# 메모리 누수 대비 주기적 워커 교체 (지터로 동시 재시작 방지, 0이면 사용 안 함)
+max_requests = int(os.getenv("MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+
+pidfile = os.getenv("GUNICORN_PIDFILE", os.path.join(ROOT_DIR, "gunicorn.pid"))
+
+# 워커 기동 시간 예산 (초, 초과하면 경고 로그)
+WORKER_STARTUP_BUDGET = float(os.getenv("WORKER_STARTUP_BUDGET", "1.0"))
+
+
+def when_ready(server):
+    import main
+
+    main.warmup.run(per_process=False)
+    server.log.info("준비 작업 완료 %s", main.warmup.status()["tasks"])
+
+
+def post_fork(server, worker):
+    worker.started_at = time.monotonic()
+
+
+def post_worker_init(worker):
+    elapsed = time.monotonic() - worker.started_at
+    if elapsed > WORKER_STARTUP_BUDGET:
+        worker.log.warning("워커 %s 기동 %.3f초 (예산 %.1f초 초과)", worker.pid, elapsed, WORKER_STARTUP_BUDGET)
+    else:
+        worker.log.info("워커 %s 기동 %.3f초", worker.pid, elapsed)
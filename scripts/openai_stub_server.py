@@ -0,0 +1,79 @@
+# OpenAI API 로컬 스텁 서버
+# /v1/chat/completions (stream 포함)를 흉내 내어 API 키 없이 /saju/interpret를 테스트한다.
+# 실행: python scripts/openai_stub_server.py  (기본 포트 8002)
+# 서버 설정: OPENAI_BASE_URL=http://localhost:8002/v1 OPENAI_API_KEY=stub
+
+import asyncio
+import json
+import os
+import time
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+app = FastAPI()
+
+# 호출 횟수 (캐시 동작 확인용)
+stats = {"chat_completions": 0}
+
+STUB_REPLY = (
+    "스텁 해석입니다. 주어진 사주를 바탕으로 한 PM 성향 설명이 이 자리에 스트리밍됩니다. "
+    "실제 OpenAI API 대신 로컬 스텁 서버가 응답했습니다."
+)
+
+
+def _chunk(completion_id, model, delta, finish_reason=None):
+    return {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+    }
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    """OpenAI Chat Completions API 스텁"""
+    body = await request.json()
+    stats["chat_completions"] += 1
+    model = body.get("model", "stub-model")
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    delay = float(os.getenv("STUB_CHUNK_DELAY", "0.01"))
+
+    if not body.get("stream"):
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": STUB_REPLY},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        }
+
+    async def events():
+        yield f"data: {json.dumps(_chunk(completion_id, model, {'role': 'assistant', 'content': ''}))}\n\n"
+        for word in STUB_REPLY.split(" "):
+            await asyncio.sleep(delay)
+            delta = {"content": word + " "}
+            yield f"data: {json.dumps(_chunk(completion_id, model, delta), ensure_ascii=False)}\n\n"
+        yield f"data: {json.dumps(_chunk(completion_id, model, {}, 'stop'))}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.get("/stats")
+async def get_stats():
+    """호출 횟수 조회"""
+    return stats
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="127.0.0.1", port=int(os.getenv("STUB_PORT", "8002")))
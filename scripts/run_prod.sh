@@ -0,0 +1,55 @@
+#!/bin/bash
+
+# pmsang 운영 모드 실행 스크립트 (gunicorn + uvicorn 워커 여러 개)
+#   ./scripts/run_prod.sh          서버 시작 (포그라운드)
+#   ./scripts/run_prod.sh reload   새 코드로 무중단 교체 (새 마스터 기동 후 이전 마스터 정상 종료)
+#   ./scripts/run_prod.sh stop     정상 종료 (처리 중인 요청 완료 후)
+
+cd "$(dirname "$0")/.." || exit 1
+
+PIDFILE="${GUNICORN_PIDFILE:-$(pwd)/gunicorn.pid}"
+
+if [ -d "venv" ]; then
+    source venv/bin/activate
+fi
+
+case "$1" in
+    reload)
+        if [ ! -f "$PIDFILE" ]; then
+            echo "❌ 실행 중인 서버가 없습니다 ($PIDFILE)"
+            exit 1
+        fi
+        OLD_PID=$(cat "$PIDFILE")
+        echo "🔄 새 마스터 기동 중... (이전 마스터 $OLD_PID)"
+        kill -USR2 "$OLD_PID"
+
+        # 새 마스터가 pid 파일(<pidfile>.2, 이전 마스터 종료 후 원래 이름으로 바뀜)을 쓸 때까지 대기
+        for _ in $(seq 1 30); do
+            sleep 1
+            if [ -f "$PIDFILE.2" ]; then
+                NEW_PID=$(cat "$PIDFILE.2")
+                break
+            fi
+        done
+        if [ -z "$NEW_PID" ]; then
+            echo "❌ 새 마스터가 기동되지 않았습니다. 이전 마스터를 유지합니다."
+            exit 1
+        fi
+        # 새 워커 준비 대기
+        sleep 2
+
+        # 이전 마스터: 새 요청 수락 중단, 처리 중인 요청 완료 후 종료
+        kill -TERM "$OLD_PID"
+        echo "✅ 교체 완료: $OLD_PID → $NEW_PID"
+        ;;
+    stop)
+        kill -TERM "$(cat "$PIDFILE")"
+        ;;
+    *)
+        if [ ! -f ".env" ]; then
+            echo "⚠️ .env 파일이 없습니다. 환경변수 기본값으로 실행합니다."
+        fi
+        echo "🌐 운영 모드로 서버를 시작합니다 (워커 ${WEB_CONCURRENCY:-코어 수}개, 포트 ${PORT:-8001})"
+        exec gunicorn -c gunicorn.conf.py
+        ;;
+esac
@@ -0,0 +1,97 @@
+# 정적 파일 빌드 파이프라인
+# CSS/JS 파일을 내용 해시가 붙은 이름으로 app/static/dist 아래에 복사하고 .gz/.br 압축본을 함께 만든다.
+# HTML의 /static 참조는 매니페스트로 해시 경로로 바꿔 장기 캐시(immutable)가 가능하게 한다.
+# 실행: python src/asset_pipeline.py (서버 기동 처리에서도 자동 실행, import 시에는 실행 안 함)
+
+import gzip
+import hashlib
+import json
+import os
+import re
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성 (없으면 .gz만 생성)
+    brotli = None
+
+STATIC_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app', 'static'))
+DIST_DIRNAME = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+# 해시를 붙일 대상 하위 디렉터리와 확장자
+ASSET_DIRS = ('css', 'js')
+ASSET_EXTENSIONS = ('.css', '.js')
+
+# HTML의 src/href="/static/..." 참조 (쿼리스트링 포함)
+_REFERENCE_PATTERN = re.compile(r'(src|href)="(/static/[^"?#]+)(?:\?[^"#]*)?"')
+
+
+def _write_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체 (여러 워커가 동시에 빌드해도 깨진 파일이 보이지 않음)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def build_assets(static_dir=STATIC_DIR):
+    """해시 이름 복사본과 압축본을 만들고 매니페스트({원래 URL: 해시 URL}) 반환"""
+    dist_dir = os.path.join(static_dir, DIST_DIRNAME)
+    manifest = {}
+    outputs = set()
+    # 원본 디렉터리가 없으면 (잘못된 경로 등) 출력 디렉터리를 만들지 않음
+    if not any(os.path.isdir(os.path.join(static_dir, asset_dir)) for asset_dir in ASSET_DIRS):
+        return manifest
+
+    for asset_dir in ASSET_DIRS:
+        source_dir = os.path.join(static_dir, asset_dir)
+        if not os.path.isdir(source_dir):
+            continue
+        target_dir = os.path.join(dist_dir, asset_dir)
+        os.makedirs(target_dir, exist_ok=True)
+
+        for filename in sorted(os.listdir(source_dir)):
+            stem, ext = os.path.splitext(filename)
+            if ext not in ASSET_EXTENSIONS:
+                continue
+            with open(os.path.join(source_dir, filename), 'rb') as f:
+                body = f.read()
+
+            hashed_name = f"{stem}.{hashlib.sha256(body).hexdigest()[:10]}{ext}"
+            target = os.path.join(target_dir, hashed_name)
+            variants = {target: body, target + '.gz': gzip.compress(body, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                variants[target + '.br'] = brotli.compress(body)
+            for path, data in variants.items():
+                outputs.add(path)
+                if not os.path.exists(path):
+                    _write_atomic(path, data)
+
+            manifest[f"/static/{asset_dir}/{filename}"] = f"/static/{DIST_DIRNAME}/{asset_dir}/{hashed_name}"
+
+    # 이전 빌드에서 남은 해시 파일 정리
+    for root, _, files in os.walk(dist_dir):
+        for filename in files:
+            path = os.path.join(root, filename)
+            if path not in outputs and filename != MANIFEST_NAME and not filename.endswith('.tmp'):
+                os.remove(path)
+
+    os.makedirs(dist_dir, exist_ok=True)
+    _write_atomic(os.path.join(dist_dir, MANIFEST_NAME), json.dumps(manifest, indent=2).encode('utf-8'))
+    return manifest
+
+
+def rewrite_references(html, manifest):
+    """HTML의 /static 참조를 매니페스트의 해시 경로로 교체 (?v= 같은 캐시 무효화 쿼리는 제거)"""
+    def replace(match):
+        attribute, url = match.group(1), match.group(2)
+        if url not in manifest:
+            return match.group(0)
+        return f'{attribute}="{manifest[url]}"'
+
+    return _REFERENCE_PATTERN.sub(replace, html)
+
+
+if __name__ == "__main__":
+    for source, target in build_assets().items():
+        print(f"{source} → {target}")
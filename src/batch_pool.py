@@ -0,0 +1,118 @@
+# 대량 계산용 프로세스 풀
+# 큰 /saju/batch 요청은 청크 단위로 별도 프로세스에서 계산/직렬화해, 한 사용자의 배치가
+# API 프로세스의 GIL을 오래 점유해 다른 요청을 밀어내지 않게 한다.
+# - forkserver 방식: 스레드가 도는 API 프로세스를 직접 fork하지 않고, 이 모듈만 미리 로드한 서버에서 fork
+# - 풀은 처음 사용할 때 프로세스별로 만든다 (gunicorn preload 후 fork된 워커마다 따로 생성)
+# - 결과는 NDJSON 텍스트로 받아 프로세스 간 전달량과 API 프로세스의 직렬화 비용을 줄인다
+# - 풀 프로세스는 낮은 CPU 우선순위(nice)로 돌아 코어가 부족할 때 API 프로세스가 먼저 실행된다
+# - multiprocessing/concurrent.futures는 풀을 처음 만들 때 불러온다 (API 기동 시간에 포함되지 않게)
+
+import asyncio
+import json
+import os
+from collections import deque
+
+from saju_calculator import SajuCalculator
+
+# 풀 프로세스 nice 증가분 (배치는 대량 작업이므로 일반 요청보다 낮은 우선순위)
+WORKER_NICENESS = 10
+
+# 풀 프로세스의 계산기 (프로세스 시작 시 한 번 생성)
+_calculator = None
+
+
+def _init_worker():
+    global _calculator
+    os.nice(WORKER_NICENESS)
+    _calculator = SajuCalculator()
+
+
+def batch_lines(calculator, birth_dates, birth_times, start=0, element_profile=False):
+    """배치 청크를 계산해 한 줄에 한 명씩 NDJSON 텍스트로 반환 (index는 start부터, element_profile이면 오행 세력 분포 포함)"""
+    results = calculator.calculate_saju_batch(birth_dates, birth_times, element_profile)
+    lines = []
+    for offset, result in enumerate(results):
+        if result is None:
+            row = {"index": start + offset, "status": "error", "error": "사주 계산에 실패했습니다."}
+        else:
+            row = {"index": start + offset, "status": "success", **result}
+        lines.append(json.dumps(row, ensure_ascii=False))
+    return "\n".join(lines) + "\n"
+
+
+def _calculate_chunk(birth_dates, birth_times, start, element_profile):
+    return batch_lines(_calculator, birth_dates, birth_times, start, element_profile)
+
+
+class BatchPool:
+    """큰 배치를 청크로 나눠 프로세스 풀에서 계산 (max_workers가 0이면 사용 안 함)"""
+
+    def __init__(self, max_workers=2, threshold=5000, chunk_size=1000):
+        self.max_workers = max_workers
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.offloaded = 0
+        self._pid = None
+        self._pool = None
+
+    def should_offload(self, rows):
+        """rows행 배치를 프로세스 풀에서 계산할지 여부"""
+        return self.max_workers > 0 and rows > self.threshold
+
+    @property
+    def running(self):
+        """현재 프로세스에 풀이 만들어져 있는지"""
+        return self._pid == os.getpid()
+
+    def _executor(self):
+        if self._pid != os.getpid():
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload([__name__])
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=context, initializer=_init_worker
+            )
+            self._pid = os.getpid()
+        return self._pool
+
+    async def stream(self, birth_dates, birth_times, element_profile=False):
+        """청크별 NDJSON 텍스트를 입력 순서대로 생성 (최대 max_workers개 청크를 동시에 계산)"""
+        from concurrent.futures.process import BrokenProcessPool
+
+        loop = asyncio.get_running_loop()
+        executor = self._executor()
+        starts = iter(range(0, len(birth_dates), self.chunk_size))
+        pending = deque()
+
+        def submit():
+            start = next(starts, None)
+            if start is not None:
+                end = start + self.chunk_size
+                pending.append(loop.run_in_executor(
+                    executor, _calculate_chunk,
+                    birth_dates[start:end], birth_times[start:end], start, element_profile
+                ))
+
+        self.offloaded += 1
+        try:
+            for _ in range(self.max_workers):
+                submit()
+            while pending:
+                text = await pending.popleft()
+                submit()
+                yield text
+        except BrokenProcessPool:
+            # 풀 프로세스가 죽으면 다음 요청에서 새로 만듦
+            self._pid = None
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self):
+        """풀 프로세스 종료"""
+        if self.running:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pid = None
@@ -0,0 +1,282 @@
+# 사주 차트 저장소 (SQLite, WAL 모드)
+# /saju/detailed에서 계산한 차트(기둥, 십성, 오행, 직렬화된 응답)를 디스크에 보관해
+# 재시작/캐시 만료 후의 반복 조회와 일주/오행/생년월일 기준 코호트 조회, 궁합 후보 검색에 사용한다.
+# 쓰기는 백그라운드 스레드가 큐에서 모아 한 트랜잭션으로 처리하므로 요청 경로는 디스크를 기다리지 않는다.
+# 연결과 스레드는 처음 사용할 때 프로세스별로 만든다 (gunicorn preload 후 fork되어도 안전).
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+# 스키마 버전 (PRAGMA user_version, 다르면 차트 테이블을 다시 만든다 - 차트는 계산으로 다시 채울 수 있는 파생 데이터)
+# 저장된 응답 본문(body) 형식이나 계산 결과가 바뀔 때도 올린다.
+SCHEMA_VERSION = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS charts (
+    id INTEGER PRIMARY KEY,
+    birth_date TEXT NOT NULL,
+    birth_time TEXT NOT NULL,
+    solar_date TEXT NOT NULL,
+    hour_branch INTEGER NOT NULL,
+    month_branch INTEGER NOT NULL,
+    gender TEXT NOT NULL,
+    birth_place TEXT NOT NULL,
+    year_pillar TEXT NOT NULL,
+    month_pillar TEXT NOT NULL,
+    day_pillar TEXT NOT NULL,
+    hour_pillar TEXT NOT NULL,
+    five_element TEXT NOT NULL,
+    year_ten_god TEXT NOT NULL,
+    month_ten_god TEXT NOT NULL,
+    hour_ten_god TEXT NOT NULL,
+    year_branch_ten_god TEXT NOT NULL,
+    month_branch_ten_god TEXT NOT NULL,
+    day_branch_ten_god TEXT NOT NULL,
+    hour_branch_ten_god TEXT NOT NULL,
+    features INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS charts_moment ON charts
+    (solar_date, hour_branch, month_branch, gender, birth_place);
+CREATE INDEX IF NOT EXISTS charts_day_pillar ON charts (day_pillar, birth_date);
+CREATE INDEX IF NOT EXISTS charts_five_element ON charts (five_element, birth_date);
+CREATE INDEX IF NOT EXISTS charts_birth_date ON charts (birth_date);
+CREATE INDEX IF NOT EXISTS charts_match ON charts (gender, id, features);
+"""
+
+COLUMNS = (
+    'birth_date', 'birth_time', 'solar_date', 'hour_branch', 'month_branch', 'gender', 'birth_place',
+    'year_pillar', 'month_pillar', 'day_pillar', 'hour_pillar', 'five_element',
+    'year_ten_god', 'month_ten_god', 'hour_ten_god',
+    'year_branch_ten_god', 'month_branch_ten_god', 'day_branch_ten_god', 'hour_branch_ten_god',
+    'features', 'body', 'updated_at'
+)
+
+# 코호트 조회 결과에 포함할 컬럼 (궁합 특징 값, 응답 본문 제외)
+QUERY_COLUMNS = COLUMNS[:-3]
+
+_UPSERT = (
+    f"INSERT INTO charts ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))}) "
+    "ON CONFLICT (solar_date, hour_branch, month_branch, gender, birth_place) DO UPDATE SET "
+    + ', '.join(f"{column} = excluded.{column}" for column in COLUMNS if column not in (
+        'solar_date', 'hour_branch', 'month_branch', 'gender', 'birth_place'))
+)
+
+# 코호트 조회 필터 (쿼리 파라미터 → SQL 조건)
+FILTERS = {
+    'day_pillar': 'day_pillar = ?',
+    'five_element': 'five_element = ?',
+    'gender': 'gender = ?',
+    'birth_date_from': 'birth_date >= ?',
+    'birth_date_to': 'birth_date <= ?'
+}
+
+_STOP = object()
+
+
+def chart_row(birth_date, birth_time, solar_date, hour_branch, month_branch, gender, birth_place,
+              five_element, four_pillars, features, body):
+    """저장할 행 튜플 생성 (solar_date: 진태양시 날짜, four_pillars: 상세 기둥 딕셔너리,
+    features: 묶인 궁합 특징 값(ChartFeatures.pack()), body: 직렬화된 응답 바이트)"""
+    return (
+        birth_date, birth_time, solar_date, hour_branch, month_branch, gender, birth_place,
+        four_pillars['year']['pillar'], four_pillars['month']['pillar'],
+        four_pillars['day']['pillar'], four_pillars['hour']['pillar'],
+        five_element,
+        four_pillars['year']['ten_god'], four_pillars['month']['ten_god'], four_pillars['hour']['ten_god'],
+        four_pillars['year']['branch_ten_god'], four_pillars['month']['branch_ten_god'],
+        four_pillars['day']['branch_ten_god'], four_pillars['hour']['branch_ten_god'],
+        features, body, time.time()
+    )
+
+
+class ChartStore:
+    """SQLite 차트 저장소 (배치 쓰기 스레드 + 스레드별 읽기 연결)"""
+
+    def __init__(self, path, batch_size=500, flush_interval=0.5, max_pending=50000):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.hits = 0
+        self.misses = 0
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.write_errors = 0
+        self._pid = None
+        self._queue = None
+        self._writer = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _ensure_started(self):
+        """현재 프로세스의 쓰기 스레드 시작 (fork 후 첫 사용 시 다시 만듦)"""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = self._connect()
+            if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                connection.executescript(f"DROP TABLE IF EXISTS charts; PRAGMA user_version = {SCHEMA_VERSION};")
+            connection.executescript(SCHEMA)
+            self._queue = queue.Queue(maxsize=self.max_pending)
+            self._writer = threading.Thread(target=self._write_loop, args=(connection,), name='chart-store-writer', daemon=True)
+            self._writer.start()
+            self._local = threading.local()
+            self._pid = os.getpid()
+
+    def start(self):
+        """현재 프로세스의 쓰기 스레드를 미리 시작 (첫 요청이 연결/스키마 준비 비용을 떠안지 않게)"""
+        self._ensure_started()
+
+    def _reader(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def enqueue(self, row):
+        """chart_row로 만든 행을 쓰기 큐에 추가 (대기 없음, 큐가 가득 차면 버리고 dropped 증가)"""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_loop(self, connection):
+        """큐에서 batch_size개 또는 flush_interval초 동안 모인 행을 한 트랜잭션으로 저장"""
+        stop = False
+        while not stop:
+            batch = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+                timeout = deadline - time.monotonic()
+                if stop or len(batch) >= self.batch_size or timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(connection, batch)
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+        connection.close()
+
+    def _write_batch(self, connection, batch):
+        try:
+            with connection:
+                connection.executemany(_UPSERT, batch)
+            self.written += len(batch)
+            self.batches += 1
+        except sqlite3.Error:
+            self.write_errors += 1
+
+    def get_body(self, solar_date, hour_branch, month_branch, gender, birth_place):
+        """정규화된 출생 정보(진태양시 날짜/시지, 월지)로 저장된 응답 바이트 조회 (없으면 None)"""
+        self._ensure_started()
+        row = self._reader().execute(
+            "SELECT body FROM charts WHERE solar_date = ? AND hour_branch = ? AND month_branch = ? "
+            "AND gender = ? AND birth_place = ?",
+            (solar_date, hour_branch, month_branch, gender, birth_place)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return bytes(row[0])
+
+    def query(self, limit=100, offset=0, **filters):
+        """코호트 조회: (전체 건수, 차트 딕셔너리 목록) 반환 (filters: FILTERS 키, None은 무시)"""
+        self._ensure_started()
+        conditions = []
+        params = []
+        for name, value in filters.items():
+            if value is not None:
+                conditions.append(FILTERS[name])
+                params.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        connection = self._reader()
+        total = connection.execute(f"SELECT COUNT(*) FROM charts{where}", params).fetchone()[0]
+        rows = connection.execute(
+            f"SELECT {', '.join(QUERY_COLUMNS)} FROM charts{where} ORDER BY birth_date, id LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ).fetchall()
+        return total, [dict(zip(QUERY_COLUMNS, row)) for row in rows]
+
+    def match_candidates(self, gender=None, limit=5000, exclude=None):
+        """궁합 후보: 최근 저장된 차트 limit개의 [(id, 묶인 특징 값), ...] (특징 값 색인만 읽음)
+
+        exclude: 빼고 볼 차트의 (solar_date, hour_branch, month_branch, gender, birth_place) - 기준 본인
+        """
+        self._ensure_started()
+        conditions = []
+        params = []
+        if gender is not None:
+            conditions.append("gender = ?")
+            params.append(gender)
+        if exclude is not None:
+            # 기준 본인은 고유 색인으로 한 번만 찾아 빼고, 후보는 (gender, id, features) 색인만 훑음
+            conditions.append(
+                "id NOT IN (SELECT id FROM charts WHERE solar_date = ? AND hour_branch = ? AND month_branch = ? "
+                "AND gender = ? AND birth_place = ?)"
+            )
+            params.extend(exclude)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._reader().execute(
+            f"SELECT id, features FROM charts{where} ORDER BY id DESC LIMIT ?", params + [limit]
+        ).fetchall()
+
+    def get_charts(self, ids):
+        """id 목록 → {id: 차트 딕셔너리}"""
+        self._ensure_started()
+        rows = self._reader().execute(
+            f"SELECT id, {', '.join(QUERY_COLUMNS)} FROM charts WHERE id IN ({', '.join('?' * len(ids))})",
+            list(ids)
+        ).fetchall()
+        return {row[0]: dict(zip(QUERY_COLUMNS, row[1:])) for row in rows}
+
+    def flush(self):
+        """큐에 쌓인 쓰기가 모두 커밋될 때까지 대기 (벤치마크/종료용)"""
+        if self._pid == os.getpid():
+            self._queue.join()
+
+    def close(self):
+        """남은 쓰기를 처리하고 쓰기 스레드 종료"""
+        if self._pid != os.getpid():
+            return
+        self._queue.put(_STOP)
+        self._writer.join(timeout=10)
+        self._pid = None
+
+    def stats(self):
+        """저장소 통계 반환"""
+        return {
+            "pending": self._queue.qsize() if self._pid == os.getpid() else 0,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "write_errors": self.write_errors,
+            "hits": self.hits,
+            "misses": self.misses
+        }
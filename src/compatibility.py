@@ -0,0 +1,262 @@
+# 궁합 계산
+# 두 사주를 일간 관계(십성), 천간합, 지지 육합/삼합/육충, 합친 오행 분포로 점수화한다.
+# 후보 여러 명을 빠르게 순위 매기기 위해 사주를 작은 특징 값(ChartFeatures)으로 줄이고
+# 천간/지지는 비트마스크로 표현해 후보마다 표 조회와 비트 연산만 한다.
+# - 특징 값은 정수 하나로 묶어(pack) 차트 저장소에 함께 보관 → 저장된 차트는 다시 계산하지 않음
+# - 점수는 전통 궁합 규칙을 단순화한 휴리스틱이다 (0~100)
+
+import heapq
+from collections import namedtuple
+from operator import itemgetter
+
+from saju_calculator import (
+    BRANCH_ELEMENTS, EARTHLY_BRANCHES, FIVE_ELEMENT_RELATIONS, FIVE_ELEMENTS, HEAVENLY_STEMS,
+    STEM_ELEMENTS, STEM_TEN_GODS, TEN_GODS
+)
+
+# 점수 기준값과 항목별 배점
+BASE_SCORE = 25
+# 일간 관계 점수 (상대 일간이 나에게 어떤 십성인지, 십성 코드 순서: 비견~정인) - 양쪽 방향 합산
+DAY_MASTER_POINTS = (6, 3, 8, 5, 6, 10, 3, 10, 5, 8)
+DAY_STEM_COMBINATION_POINTS = 10
+STEM_COMBINATION_POINTS, STEM_COMBINATION_MAX = 3, 12
+DAY_BRANCH_HARMONY_POINTS = 8
+BRANCH_HARMONY_POINTS, BRANCH_HARMONY_MAX = 4, 12
+BRANCH_TRIAD_POINTS = 4
+DAY_BRANCH_CLASH_POINTS = -8
+BRANCH_CLASH_POINTS, BRANCH_CLASH_MIN = -4, -12
+ELEMENT_BALANCE_MAX = 20
+
+# 천간합: 갑기, 을경, 병신, 정임, 무계 (천간 코드 s ↔ s + 5) → 합화 오행
+STEM_COMBINATION_ELEMENTS = (2, 3, 4, 0, 1)
+# 지지 육합: 자축, 인해, 묘술, 진유, 사신, 오미 (지지 코드 b ↔ (1 - b) % 12)
+# 지지 육충: 자오, 축미, 인신, 묘유, 진술, 사해 (b ↔ b + 6)
+# 지지 삼합: 신자진(물), 해묘미(나무), 인오술(불), 사유축(금)
+BRANCH_TRIADS = ((8, 0, 4), (11, 3, 7), (2, 6, 10), (5, 9, 1))
+BRANCH_TRIAD_MASKS = tuple(sum(1 << branch for branch in triad) for triad in BRANCH_TRIADS)
+
+
+def _mask_table(bits, partner):
+    """비트마스크 → 각 비트의 짝 비트를 모은 마스크 표 (가장 낮은 비트를 뺀 마스크의 값에 짝 비트를 더해 채움)"""
+    table = [0] * (1 << bits)
+    for mask in range(1, 1 << bits):
+        low = mask & -mask
+        table[mask] = table[mask ^ low] | 1 << partner(low.bit_length() - 1)
+    return tuple(table)
+
+
+def _popcount_table(bits):
+    table = [0] * (1 << bits)
+    for mask in range(1, 1 << bits):
+        table[mask] = table[mask >> 1] + (mask & 1)
+    return tuple(table)
+
+
+def _compositions(total, parts):
+    """합이 total인 parts개 음 아닌 정수 튜플 (사전순)"""
+    if parts == 1:
+        yield (total,)
+        return
+    for first in range(total + 1):
+        for rest in _compositions(total - first, parts - 1):
+            yield (first,) + rest
+
+
+STEM_COMBINATION_MASKS = _mask_table(10, lambda stem: (stem + 5) % 10)
+BRANCH_HARMONY_MASKS = _mask_table(12, lambda branch: (1 - branch) % 12)
+BRANCH_CLASH_MASKS = _mask_table(12, lambda branch: (branch + 6) % 12)
+POPCOUNT = _popcount_table(12)
+
+# 오행별 글자 수 (여덟 글자, 합 8) ↔ 인덱스 (495가지)
+ELEMENT_COUNTS = tuple(_compositions(8, 5))
+ELEMENT_COUNT_INDEX = {counts: index for index, counts in enumerate(ELEMENT_COUNTS)}
+# 두 사람 합친 16글자가 오행마다 고르게(3.2개) 있을 때 최고점, 한 오행에 몰리면 0점
+_BALANCED_COUNT = 16 / 5
+_MAX_IMBALANCE = (16 - _BALANCED_COUNT) + 4 * _BALANCED_COUNT
+
+
+def _balance_points(counts_a, counts_b):
+    imbalance = sum(abs(a + b - _BALANCED_COUNT) for a, b in zip(counts_a, counts_b))
+    return round(ELEMENT_BALANCE_MAX * (1 - imbalance / _MAX_IMBALANCE))
+
+
+class ChartFeatures(namedtuple('ChartFeatures', ('day_stem', 'day_branch', 'stem_mask', 'branch_mask', 'element_index'))):
+    """궁합 계산용 사주 특징 값 (일간, 일지, 천간/지지 비트마스크, 오행 분포 인덱스)"""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_four_pillars(cls, four_pillars):
+        stem_mask = branch_mask = 0
+        counts = [0] * 5
+        for pillar in four_pillars:
+            stem_mask |= 1 << pillar.stem
+            branch_mask |= 1 << pillar.branch
+            counts[STEM_ELEMENTS[pillar.stem]] += 1
+            counts[BRANCH_ELEMENTS[pillar.branch]] += 1
+        return cls(four_pillars.day.stem, four_pillars.day.branch, stem_mask, branch_mask,
+                   ELEMENT_COUNT_INDEX[tuple(counts)])
+
+    def pack(self):
+        """정수 하나로 묶기 (저장용, 39비트)"""
+        return (self.day_stem | self.day_branch << 4 | self.stem_mask << 8
+                | self.branch_mask << 18 | self.element_index << 30)
+
+    @classmethod
+    def unpack(cls, value):
+        return cls(value & 0xF, value >> 4 & 0xF, value >> 8 & 0x3FF, value >> 18 & 0xFFF, value >> 30)
+
+    @property
+    def element_counts(self):
+        return ELEMENT_COUNTS[self.element_index]
+
+
+class MatchScorer:
+    """한 사람 기준 궁합 점수기
+
+    기준 사주 쪽 점수를 상대 특징 값 조각(일간+일지, 천간 마스크, 지지 마스크, 오행 인덱스)별 표로 만들어 두고
+    후보마다 묶인 정수에서 조각을 잘라 표 네 번 조회해 더한다. 지지/오행 표는 처음 나온 값만 계산해 채운다.
+    """
+
+    def __init__(self, features):
+        self.features = features
+        day_stem, day_branch = features.day_stem, features.day_branch
+        # 묶인 값 하위 8비트(일간 | 일지 << 4) → 일간 관계(+천간합) + 일지 육합/육충 점수
+        day_points = [0] * 256
+        for other_stem in range(10):
+            stem_points = (
+                DAY_MASTER_POINTS[STEM_TEN_GODS[day_stem][other_stem]]
+                + DAY_MASTER_POINTS[STEM_TEN_GODS[other_stem][day_stem]]
+                + (DAY_STEM_COMBINATION_POINTS if other_stem == (day_stem + 5) % 10 else 0)
+            )
+            for other_branch in range(12):
+                day_points[other_stem | other_branch << 4] = (
+                    stem_points
+                    + (DAY_BRANCH_HARMONY_POINTS if other_branch == (1 - day_branch) % 12 else 0)
+                    + (DAY_BRANCH_CLASH_POINTS if other_branch == (day_branch + 6) % 12 else 0)
+                )
+        self._day_points = tuple(day_points)
+        # 천간 마스크 → 천간합 점수
+        partners = STEM_COMBINATION_MASKS[features.stem_mask]
+        self._stem_points = tuple(
+            min(POPCOUNT[partners & mask] * STEM_COMBINATION_POINTS, STEM_COMBINATION_MAX)
+            for mask in range(1 << 10)
+        )
+        self._harmony_partners = BRANCH_HARMONY_MASKS[features.branch_mask]
+        self._clash_partners = BRANCH_CLASH_MASKS[features.branch_mask]
+        # 삼합별 (상대가 채워야 완성되는 지지, 삼합 전체) - 기준 사주에 일부만 있는 삼합만
+        self._triad_needs = tuple(
+            (triad & ~features.branch_mask, triad) for triad in BRANCH_TRIAD_MASKS
+            if triad & features.branch_mask not in (0, triad)
+        )
+        self._branch_points = {}
+        self._element_points = {}
+
+    def _branch_score(self, branch_mask):
+        points = (
+            min(POPCOUNT[self._harmony_partners & branch_mask] * BRANCH_HARMONY_POINTS, BRANCH_HARMONY_MAX)
+            + max(POPCOUNT[self._clash_partners & branch_mask] * BRANCH_CLASH_POINTS, BRANCH_CLASH_MIN)
+        )
+        for needs, triad in self._triad_needs:
+            # 상대 혼자 삼합을 다 가진 경우는 두 사람이 만든 삼합으로 보지 않음
+            if branch_mask & needs == needs and branch_mask & triad != triad:
+                points += BRANCH_TRIAD_POINTS
+        self._branch_points[branch_mask] = points
+        return points
+
+    def _element_score(self, element_index):
+        points = self._element_points[element_index] = _balance_points(
+            self.features.element_counts, ELEMENT_COUNTS[element_index]
+        )
+        return points
+
+    def score_packed(self, packed):
+        """상대의 묶인 특징 값(ChartFeatures.pack())과의 궁합 점수 (0~100)"""
+        branch_mask = packed >> 18 & 0xFFF
+        element_index = packed >> 30
+        branch_points = self._branch_points.get(branch_mask)
+        if branch_points is None:
+            branch_points = self._branch_score(branch_mask)
+        element_points = self._element_points.get(element_index)
+        if element_points is None:
+            element_points = self._element_score(element_index)
+        score = (BASE_SCORE + self._day_points[packed & 0xFF] + self._stem_points[packed >> 8 & 0x3FF]
+                 + branch_points + element_points)
+        return 100 if score > 100 else 0 if score < 0 else score
+
+    def score(self, other):
+        """상대 특징 값(ChartFeatures)과의 궁합 점수 (0~100)"""
+        return self.score_packed(other.pack())
+
+    def rank(self, candidates, limit=10):
+        """(키, 묶인 특징 값) 목록에서 점수 상위 limit개를 [(점수, 키), ...]로 반환 (점수 같으면 입력 순서)"""
+        # score_packed와 같은 계산을 지역 변수로 펼친 반복문 (후보 수천 명에서 호출 비용이 대부분이라)
+        day_points, stem_points = self._day_points, self._stem_points
+        branch_points, element_points = self._branch_points, self._element_points
+        scored = []
+        append = scored.append
+        for key, packed in candidates:
+            branch_mask = packed >> 18 & 0xFFF
+            element_index = packed >> 30
+            branch = branch_points.get(branch_mask)
+            if branch is None:
+                branch = self._branch_score(branch_mask)
+            element = element_points.get(element_index)
+            if element is None:
+                element = self._element_score(element_index)
+            score = BASE_SCORE + day_points[packed & 0xFF] + stem_points[packed >> 8 & 0x3FF] + branch + element
+            append((100 if score > 100 else 0 if score < 0 else score, key))
+        # 안정 정렬이라 점수가 같으면 입력 순서 유지
+        return heapq.nlargest(limit, scored, key=itemgetter(0))
+
+
+def _relation_name(element, other):
+    if element == other:
+        return '같음'
+    for name, target in FIVE_ELEMENT_RELATIONS[FIVE_ELEMENTS[element]].items():
+        if target == FIVE_ELEMENTS[other]:
+            return name
+
+
+def compatibility_details(a, b):
+    """두 특징 값의 궁합 점수와 항목별 근거"""
+    stem_pairs = [
+        stem for stem in range(5)
+        if (a.stem_mask >> stem & 1 and b.stem_mask >> (stem + 5) & 1)
+        or (b.stem_mask >> stem & 1 and a.stem_mask >> (stem + 5) & 1)
+    ]
+    branch_masks = a.branch_mask, b.branch_mask
+    harmonies = [
+        branch for branch in (0, 2, 3, 4, 5, 6)
+        if any(x >> branch & 1 and y >> (1 - branch) % 12 & 1 for x, y in (branch_masks, branch_masks[::-1]))
+    ]
+    clashes = [
+        branch for branch in range(6)
+        if any(x >> branch & 1 and y >> (branch + 6) & 1 for x, y in (branch_masks, branch_masks[::-1]))
+    ]
+    triads = [
+        triad for triad, mask in zip(BRANCH_TRIADS, BRANCH_TRIAD_MASKS)
+        if (a.branch_mask | b.branch_mask) & mask == mask
+        and a.branch_mask & mask != mask and b.branch_mask & mask != mask
+        and a.branch_mask & mask and b.branch_mask & mask
+    ]
+    combined = [x + y for x, y in zip(a.element_counts, b.element_counts)]
+    day_elements = STEM_ELEMENTS[a.day_stem], STEM_ELEMENTS[b.day_stem]
+    return {
+        'score': MatchScorer(a).score(b),
+        'day_master': {
+            'a_to_b': TEN_GODS[STEM_TEN_GODS[a.day_stem][b.day_stem]],
+            'b_to_a': TEN_GODS[STEM_TEN_GODS[b.day_stem][a.day_stem]],
+            'relation': _relation_name(*day_elements),
+            'combined': (a.day_stem - b.day_stem) % 10 == 5
+        },
+        'stem_combinations': [
+            {'pair': HEAVENLY_STEMS[stem] + HEAVENLY_STEMS[stem + 5],
+             'element': FIVE_ELEMENTS[STEM_COMBINATION_ELEMENTS[stem]]}
+            for stem in stem_pairs
+        ],
+        'branch_harmonies': [EARTHLY_BRANCHES[branch] + EARTHLY_BRANCHES[(1 - branch) % 12] for branch in harmonies],
+        'branch_triads': [''.join(EARTHLY_BRANCHES[branch] for branch in triad) for triad in triads],
+        'branch_clashes': [EARTHLY_BRANCHES[branch] + EARTHLY_BRANCHES[branch + 6] for branch in clashes],
+        'element_balance': dict(zip(FIVE_ELEMENTS, combined))
+    }
@@ -0,0 +1,110 @@
+# 대운/세운 (운의 흐름) 계산
+# 사주 계산 결과(SajuResult)와 성별로 10년 단위 대운과 해마다의 세운을 만든다.
+# - 대운: 월주에서 60갑자를 한 칸씩 순행(양년생 남자, 음년생 여자) 또는 역행
+# - 대운수: 출생 시각부터 다음(순행)/이전(역행) 절입 시각까지의 일수 ÷ 3 (3일 = 1년)
+# - 세운: 해당 년도의 년주 ((년도 - 4) % 60) - 사주를 다시 계산하지 않고 60갑자 표에서 바로 조회
+# 구간과 년도는 제너레이터로 필요한 만큼만 만든다.
+
+from collections import namedtuple
+
+import solar_terms
+from saju_calculator import PILLARS, STEM_POLARITY
+
+# 성별 → 순행 여부 판단용 코드 (양년생 남자/음년생 여자가 순행)
+GENDER_CODES = {'남': 0, '여': 1}
+
+DIRECTION_NAMES = {1: '순행', -1: '역행'}
+
+# 대운 한 구간 년수
+MAJOR_LUCK_YEARS = 10
+
+# 60갑자 인덱스 → 기둥 객체
+CYCLE_PILLARS = tuple(PILLARS[index % 10][index % 12] for index in range(60))
+
+
+def luck_direction(year_stem, gender):
+    """대운 방향: 순행 1, 역행 -1 (gender: '남'/'여')"""
+    if gender not in GENDER_CODES:
+        raise ValueError("성별은 '남' 또는 '여'여야 합니다.")
+    return 1 if STEM_POLARITY[year_stem] == GENDER_CODES[gender] else -1
+
+
+def _month_term_moment(year, month):
+    if month == 0:
+        year, month = year - 1, 12
+    elif month == 13:
+        year, month = year + 1, 1
+    return solar_terms.month_term(year, month)[1]
+
+
+def start_age(moment, direction):
+    """대운수: 출생 시각 (년, 월, 일, 시, 분)부터 가까운 절입까지 일수 ÷ 3 (나머지 2일은 올림, 1~10)"""
+    year, month = moment[:2]
+    birth = solar_terms.moment_minutes(*moment)
+    term = _month_term_moment(year, month)
+    if direction > 0:
+        boundary = term if birth < term else _month_term_moment(year, month + 1)
+    else:
+        boundary = term if birth >= term else _month_term_moment(year, month - 1)
+    days = abs(boundary - birth) // 1440
+    return min(max((days + 1) // 3, 1), 10)
+
+
+class LuckPeriod(namedtuple('LuckPeriod', ('index', 'pillar', 'start_age', 'end_age'))):
+    """대운 한 구간 (index 0은 첫 대운 전 구간, pillar는 None)"""
+
+    __slots__ = ()
+
+
+class LuckCycle:
+    """한 사람의 대운/세운 생성기"""
+
+    __slots__ = ('day_stem', 'birth_year', 'direction', 'start_age', '_month_index')
+
+    def __init__(self, saju_result, gender):
+        four_pillars = saju_result.four_pillars
+        self.day_stem = four_pillars.day.stem
+        self.birth_year = saju_result.moment[0]
+        self.direction = luck_direction(four_pillars.year.stem, gender)
+        self.start_age = start_age(saju_result.moment, self.direction)
+        self._month_index = four_pillars.month.index
+
+    def periods(self):
+        """대운 구간을 순서대로 끝없이 생성"""
+        yield LuckPeriod(0, None, 0, self.start_age - 1)
+        index = 1
+        while True:
+            age = self.start_age + (index - 1) * MAJOR_LUCK_YEARS
+            pillar = CYCLE_PILLARS[(self._month_index + self.direction * index) % 60]
+            yield LuckPeriod(index, pillar, age, age + MAJOR_LUCK_YEARS - 1)
+            index += 1
+
+    def yearly(self, start_age, end_age):
+        """start_age~end_age(포함) 나이의 세운 딕셔너리 생성 (해마다 표 조회 한 번)"""
+        for age in range(start_age, end_age + 1):
+            year = self.birth_year + age
+            pillar = CYCLE_PILLARS[(year - 4) % 60]
+            yield {'year': year, 'age': age, **pillar.to_dict(self.day_stem)}
+
+    def timeline(self, years=100):
+        """출생부터 years년 동안의 대운 구간 딕셔너리를 차례로 생성 (구간마다 세운 목록 포함)"""
+        for period in self.periods():
+            if period.start_age >= years:
+                return
+            end_age = min(period.end_age, years - 1)
+            yield {
+                'index': period.index,
+                'pillar': period.pillar.to_dict(self.day_stem) if period.pillar else None,
+                'start_age': period.start_age,
+                'end_age': end_age,
+                'start_year': self.birth_year + period.start_age,
+                'end_year': self.birth_year + end_age,
+                'years': list(self.yearly(period.start_age, end_age))
+            }
+
+    def to_dict(self):
+        """대운 요약 정보"""
+        return {
+            'direction': DIRECTION_NAMES[self.direction],
+            'start_age': self.start_age
+        }
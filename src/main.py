@@ -1,96 +1,406 @@
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
-from pydantic import BaseModel
-from saju_calculator import SajuCalculator
+# 기동 단계 측정 (모듈 로드 시작부터, /ready 응답에 포함)
+from startup import Lazy, StartupProfile, Warmup
+startup_profile = StartupProfile()
+
+from fastapi import APIRouter, FastAPI, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, BeforeValidator, Field, field_validator
+from datetime import date, time
+from typing import Annotated, List, Literal, Optional
+from saju_calculator import SajuCalculator, parse_birth_date, parse_birth_time
+from solar_terms import MAX_YEAR, MIN_YEAR
+from batch_pool import BatchPool, batch_lines
+from places import AUTOCOMPLETE_LIMIT, PLACE_MAX_LENGTH, PlaceIndex
+from luck_cycle import LuckCycle
+from compatibility import ChartFeatures, MatchScorer, compatibility_details
+from solar_time import resolve_birth_time
+from result_cache import ResultCache, dump_json, prepend_fields
+from page_cache import CachedStaticFiles, PageCache
+from asset_pipeline import DIST_DIRNAME, STATIC_DIR, build_assets, rewrite_references
+from metrics import MetricsMiddleware, StageTimer, registry, saju_calculations_total
+from request_guard import CoalescingMiddleware, RateLimiter, RateLimitMiddleware, RequestCoalescer
 from dotenv import load_dotenv
+import json
+import logging
 import os
 
+startup_profile.mark("imports")
+
 # .env 파일 로드
 load_dotenv()
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
 
-# 정적 파일 서빙 설정
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+router = APIRouter()
 
 # 오행 계산기 초기화
 saju_calculator = SajuCalculator()
 
+# 출생지 색인 (내장 지명 표 → 경도 조회/자동완성, 처음 사용하거나 준비 작업 때 생성)
+place_index = Lazy(PlaceIndex)
+
+# 분석 결과 캐시 (직렬화된 응답 바이트 보관)
+result_cache = ResultCache(
+    max_size=int(os.getenv("RESULT_CACHE_SIZE", "10000")),
+    ttl_seconds=int(os.getenv("RESULT_CACHE_TTL", "3600"))
+)
+
+# 차트 저장소 (SQLite WAL, 백그라운드 배치 쓰기, CHART_STORE_PATH가 비어 있으면 사용 안 함)
+# sqlite3 모듈과 저장소는 처음 사용할 때 불러옴
+CHART_STORE_PATH = os.getenv("CHART_STORE_PATH", "data/charts.sqlite3")
+
+def _create_chart_store():
+    if not CHART_STORE_PATH:
+        return None
+    from chart_store import ChartStore
+    return ChartStore(CHART_STORE_PATH)
+
+chart_store = Lazy(_create_chart_store)
+
+# 대량 계산 프로세스 풀 (BATCH_PROCESS_THRESHOLD행을 넘는 /saju/batch 요청만, BATCH_PROCESS_WORKERS=0이면 사용 안 함)
+batch_pool = BatchPool(
+    max_workers=int(os.getenv("BATCH_PROCESS_WORKERS", "2")),
+    threshold=int(os.getenv("BATCH_PROCESS_THRESHOLD", "5000"))
+)
+
+# LLM 해석 서비스 (클라이언트 재사용, 동시 호출 제한, 해석 캐시) - 첫 /saju/interpret 요청 때 생성
+def _create_openai_service():
+    from openai_service import OpenAIService
+    return OpenAIService(max_concurrency=int(os.getenv("OPENAI_MAX_CONCURRENCY", "4")))
+
+openai_service = Lazy(_create_openai_service)
+
+# 같은 본문의 /saju/analyze, /saju/detailed 동시 요청 합치기 (먼저 온 요청의 응답 바이트를 함께 사용)
+request_coalescer = RequestCoalescer()
+
+# 클라이언트 IP별 요청 속도 제한 (계산/해석 라우트만, RATE_LIMIT_RATE=0이면 사용 안 함)
+# 리버스 프록시 뒤라면 RATE_LIMIT_TRUST_PROXY=1로 X-Forwarded-For 주소 기준
+rate_limiter = RateLimiter(
+    rate=float(os.getenv("RATE_LIMIT_RATE", "20")),
+    burst=int(os.getenv("RATE_LIMIT_BURST", "40"))
+)
+RATE_LIMIT_TRUST_PROXY = os.getenv("RATE_LIMIT_TRUST_PROXY", "0") == "1"
+
 # 환경변수에서 API URL 설정
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8001")
 
-# 요청 모델 정의
-class SajuRequest(BaseModel):
-    birth_date: str  # YYYY-MM-DD 형식
-    birth_time: str  # HH:MM 형식
-    gender: str      # 남/여
-    birth_place: str # 출생지역
+# 페이지/정적 파일 메모리 캐시 (PAGE_CACHE_CHECK_INTERVAL초마다 파일 변경 확인, 0이면 확인 안 함)
+page_cache = PageCache(check_interval=float(os.getenv("PAGE_CACHE_CHECK_INTERVAL", "2")))
 
-@app.get("/")
-async def read_root():
-    return {"message": "오행 계산기 API"}
+# 정적 파일 빌드 결과 {원래 URL: 해시 URL} (기동 처리에서 채움)
+asset_manifest = {}
 
-@app.get("/chat")
-async def chat_page():
-    """채팅 페이지 반환"""
-    with open("app/static/chat.html", "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # 환경변수를 HTML에 주입
+def render_page(content):
+    """환경변수를 HTML에 주입하고 정적 파일 참조를 해시 경로로 교체"""
     content = content.replace(
         "window.API_BASE_URL = window.location.origin;",
         f"window.API_BASE_URL = '{API_BASE_URL}';"
     )
+    return rewrite_references(content, asset_manifest)
+
+# 정적 파일 서빙 설정 (메모리 캐시 + ETag/압축, 해시 파일은 immutable 캐시)
+static_files = CachedStaticFiles(STATIC_DIR, page_cache, immutable_prefix=f"{DIST_DIRNAME}/")
+
+def _build_static():
+    """정적 파일 빌드(해시 이름 복사본 + .gz/.br 압축본) 후 페이지 렌더링, 정적 파일 미리 읽기"""
+    asset_manifest.update(build_assets(STATIC_DIR))
+    page_cache.register("chat", os.path.join(STATIC_DIR, "chat.html"), "text/html", render_page)
+    page_cache.register("saju_analysis", os.path.join(STATIC_DIR, "saju_analysis.html"), "text/html", render_page)
+    static_files.preload()
+
+# import 시점이 아니라 기동 처리(gunicorn preload면 fork 전 마스터의 준비 작업)에서 한 번 실행
+static_assets = Lazy(_build_static)
+
+# 결과 캐시 상태 지표 (/metrics 요청 시 갱신)
+result_cache_entries = registry.gauge("saju_result_cache_entries", "분석 결과 캐시 항목 수")
+result_cache_lookups = registry.gauge("saju_result_cache_lookups", "분석 결과 캐시 조회 수 (hit/miss)", ("result",))
+chart_store_gauges = {
+    name: registry.gauge(f"saju_chart_store_{name}", description)
+    for name, description in (
+        ("pending", "차트 저장소 쓰기 대기 행 수"),
+        ("written", "차트 저장소에 저장된 행 수"),
+        ("batches", "차트 저장소 쓰기 트랜잭션 수"),
+        ("dropped", "쓰기 큐가 가득 차 버린 행 수"),
+        ("write_errors", "차트 저장소 쓰기 실패 배치 수"),
+        ("hits", "차트 저장소 조회 적중 수"),
+        ("misses", "차트 저장소 조회 실패 수")
+    )
+}
+coalescing_gauges = {
+    name: registry.gauge(f"saju_coalescing_{name}", description)
+    for name, description in (
+        ("in_flight", "처리 중인 고유 요청 본문 수"),
+        ("leaders", "앱에서 직접 처리한 요청 수"),
+        ("followers", "같은 본문의 처리 중 요청 응답을 함께 받은 요청 수")
+    )
+}
+rate_limit_requests = registry.gauge("saju_rate_limit_requests", "속도 제한 판정 수 (allowed/limited)", ("result",))
+rate_limit_clients = registry.gauge("saju_rate_limit_clients", "속도 제한 버킷을 보관 중인 클라이언트 수")
+
+# 대운/세운 최대 년수
+LUCK_MAX_YEARS = 120
+
+# 요청 모델 정의 (날짜/시각은 검증 단계에서 한 번만 파싱)
+class SajuRequest(BaseModel):
+    birth_date: date  # YYYY-MM-DD 형식
+    birth_time: time  # HH:MM 형식
+    gender: Literal["남", "여"]
+    birth_place: str = Field(max_length=PLACE_MAX_LENGTH)  # 출생지역
+    
+    # 문자열만 받아 배치와 같은 규칙으로 파싱 (숫자/다른 형식을 느슨하게 변환하지 않음)
+    @field_validator("birth_date", mode="before")
+    @classmethod
+    def parse_date_text(cls, value):
+        return parse_birth_date(value)
     
-    return HTMLResponse(content=content)
+    @field_validator("birth_time", mode="before")
+    @classmethod
+    def parse_time_text(cls, value):
+        # 출생 시각은 출생지 현지 시각 HH:MM (초/시간대 오프셋은 받지 않음)
+        return parse_birth_time(value)
+    
+    @field_validator("birth_date")
+    @classmethod
+    def check_birth_year(cls, value):
+        if not MIN_YEAR <= value.year <= MAX_YEAR:
+            raise ValueError(f"{MIN_YEAR}~{MAX_YEAR}년 사이의 날짜만 계산할 수 있습니다.")
+        return value
+    
+    @property
+    def moment(self):
+        """(년, 월, 일, 시, 분)"""
+        return (
+            self.birth_date.year, self.birth_date.month, self.birth_date.day,
+            self.birth_time.hour, self.birth_time.minute
+        )
+
+# 대운/세운 요청 모델 (years: 출생부터 몇 년치를 받을지)
+class LuckRequest(SajuRequest):
+    years: int = Field(100, ge=1, le=LUCK_MAX_YEARS)
+
+# 궁합 후보 수/결과 수 상한 (요청에 담긴 후보는 하나씩 계산, 저장된 차트는 특징 값만 읽어 순위 계산)
+MATCH_MAX_CANDIDATES = 1000
+MATCH_MAX_POOL = 10000
+MATCH_MAX_LIMIT = 100
+
+# 두 사람 궁합 요청 모델
+class CompatibilityRequest(BaseModel):
+    person_a: SajuRequest
+    person_b: SajuRequest
+
+# 궁합 상대 찾기 요청 모델 (candidates가 없으면 저장된 차트 중 최근 pool_size개에서 찾음)
+class MatchRequest(BaseModel):
+    person: SajuRequest
+    candidates: Optional[List[SajuRequest]] = Field(None, max_length=MATCH_MAX_CANDIDATES)
+    gender: Optional[Literal["남", "여"]] = None  # 저장된 차트 후보 성별 (기본: 기준 인물과 다른 성별)
+    pool_size: int = Field(5000, ge=1, le=MATCH_MAX_POOL)
+    limit: int = Field(10, ge=1, le=MATCH_MAX_LIMIT)
+
+# 배치 최대 행 수 (요청 본문 크기와 스트리밍 시간 상한)
+BATCH_MAX_ROWS = 100000
 
-@app.get("/saju/analysis")
-async def saju_analysis_page():
+# 대량 분석 요청 모델 (열 단위 배열)
+class SajuBatchRequest(BaseModel):
+    birth_dates: List[str] = Field(max_length=BATCH_MAX_ROWS)  # YYYY-MM-DD 형식 배열
+    birth_times: List[str] = Field(max_length=BATCH_MAX_ROWS)  # HH:MM 형식 배열
+    element_profile: bool = False  # 행마다 오행 세력 분포 포함
+
+# 해석 스트림 오류 시 클라이언트에 보내는 문구 (업스트림 오류 내용은 로그에만)
+INTERPRET_ERROR = "해석 생성에 실패했습니다. 잠시 후 다시 시도해 주세요."
+
+# 코호트 조회 최대 건수
+CHART_QUERY_MAX_LIMIT = 1000
+
+# 코호트 조회 날짜 파라미터 (요청 본문 birth_date와 같은 YYYY-MM-DD 규칙)
+QueryDate = Annotated[date, BeforeValidator(parse_birth_date)]
+
+# 배치 계산 단위 (이 크기만큼씩 계산해서 스트리밍)
+BATCH_CHUNK_SIZE = 1000
+
+# 계산 결과 지표(saju_calculations_total)를 남기는 라우트
+CALCULATION_ROUTES = (
+    "/saju/analyze", "/saju/detailed", "/saju/luck", "/saju/compatibility", "/saju/compatibility/matches",
+    "/saju/batch"
+)
+
+# 속도 제한을 적용하는 라우트
+RATE_LIMITED_ROUTES = CALCULATION_ROUTES + ("/saju/interpret",)
+# 같은 본문의 동시 요청을 합치는 라우트 (응답이 입력만으로 정해지고 스트리밍하지 않는 라우트)
+COALESCED_ROUTES = ("/saju/analyze", "/saju/detailed")
+
+# 검증 오류 종류별 안내 문구 (그 밖의 오류는 pydantic 메시지 사용)
+VALIDATION_MESSAGES = {
+    "missing": "필수 항목입니다.",
+    "date_parsing": "YYYY-MM-DD 형식의 날짜여야 합니다.",
+    "date_from_datetime_parsing": "YYYY-MM-DD 형식의 날짜여야 합니다.",
+    "date_type": "YYYY-MM-DD 형식의 날짜여야 합니다.",
+    "time_parsing": "HH:MM 형식의 시각이어야 합니다.",
+    "time_type": "HH:MM 형식의 시각이어야 합니다.",
+    "literal_error": "{expected} 중 하나여야 합니다.",
+    "greater_than_equal": "{ge} 이상이어야 합니다.",
+    "less_than_equal": "{le} 이하여야 합니다.",
+    "too_long": "최대 {max_length}개까지 가능합니다.",
+    "string_too_long": "최대 {max_length}자까지 가능합니다.",
+    "value_error": "{error}"
+}
+
+def _error_response(status_code, message):
+    """오류 응답 ({"status": "error", "error": 메시지})"""
+    return JSONResponse(status_code=status_code, content={"status": "error", "error": message})
+
+def _validation_message(exc):
+    messages = []
+    for error in exc.errors():
+        field = ".".join(str(part) for part in error["loc"][1:]) or "body"
+        template = VALIDATION_MESSAGES.get(error["type"])
+        message = template.format(**error.get("ctx", {})) if template else error["msg"]
+        messages.append(f"{field}: {message}")
+    return "; ".join(messages)
+
+async def validation_error(request: Request, exc: RequestValidationError):
+    """요청 검증 실패 → 422"""
+    if request.url.path in CALCULATION_ROUTES:
+        saju_calculations_total.inc(request.url.path, "invalid")
+    return _error_response(422, _validation_message(exc))
+
+async def server_error(request: Request, exc: Exception):
+    """처리되지 않은 예외 → 500 (예외는 서버 로그에 남음)"""
+    if request.url.path in CALCULATION_ROUTES:
+        saju_calculations_total.inc(request.url.path, "error")
+    return _error_response(500, "서버 오류가 발생했습니다.")
+
+# 준비 작업: 미리 계산된 표를 데워 첫 요청이 그 비용을 떠안지 않게 함 (/ready가 완료 여부 보고)
+WARMUP_SAMPLE = (1990, 5, 15, 14, 30, "서울")
+
+def _warm_calendar():
+    if saju_calculator.calendar is not None:
+        saju_calculator.calendar.warm()
+
+def _warm_calculation():
+    """표본 한 명을 /saju/detailed와 같은 경로로 계산 (진태양시, 기둥/십성 표, 오행 세력, 궁합 특징 값, 직렬화)"""
+    *moment, birth_place = WARMUP_SAMPLE
+    _, standard, solar = _resolve_birth_moment(*moment, birth_place)
+    saju_result = saju_calculator.calculate_saju(*standard, solar=solar)
+    dump_json({
+        "four_pillars": saju_result.four_pillars.to_dict(detailed=True),
+        "element_profile": saju_result.element_profile.to_dict(),
+        "features": ChartFeatures.from_four_pillars(saju_result.four_pillars).pack()
+    })
+
+def _warm_chart_store():
+    store = chart_store.get()
+    if store is not None:
+        store.start()
+
+warmup = Warmup()
+warmup.add("static_assets", static_assets.get)
+warmup.add("calendar", _warm_calendar)
+warmup.add("places", place_index.get)
+warmup.add("calculation", _warm_calculation)
+# 쓰기 스레드/연결은 fork 후 워커마다 만들어야 하므로 프로세스별 작업
+warmup.add("chart_store", _warm_chart_store, per_process=True)
+
+async def startup():
+    startup_profile.mark("startup")
+    # 페이지는 정적 파일 빌드 뒤에만 응답할 수 있으므로 먼저 끝냄 (이미 했으면 바로 반환)
+    static_assets.get()
+    # 미리 계산된 표 데우기 (gunicorn preload면 공유 작업은 마스터에서 이미 끝나 있음)
+    warmup.start()
+
+async def shutdown():
+    if openai_service.loaded:
+        await openai_service.get().close()
+    batch_pool.close()
+    if chart_store.loaded and chart_store.get() is not None:
+        # 쓰기 큐에 남은 차트 저장
+        chart_store.get().close()
+
+@router.get("/")
+async def read_root():
+    return {"message": "오행 계산기 API"}
+
+@router.get("/ready")
+async def readiness():
+    """준비 상태 API - 준비 작업(표 데우기)이 끝났으면 200, 아직이면 503 (로드밸런서/오토스케일러 readiness 검사용)"""
+    status = warmup.status()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content={
+        "status": "ready" if status["ready"] else "warming",
+        "warmup_ms": status["tasks"],
+        "warmup_errors": status["errors"],
+        "startup_ms": startup_profile.to_dict(),
+        "loaded": {
+            "chart_store": chart_store.loaded,
+            "openai_service": openai_service.loaded,
+            "batch_pool": batch_pool.running
+        }
+    })
+
+@router.get("/chat")
+async def chat_page(request: Request):
+    """채팅 페이지 반환"""
+    static_assets.get()
+    return page_cache.response(request, "chat")
+
+@router.get("/saju/analysis")
+async def saju_analysis_page(request: Request):
     """사주 분석 페이지 반환"""
-    with open("app/static/saju_analysis.html", "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # 환경변수를 HTML에 주입
-    content = content.replace(
-        "window.API_BASE_URL = window.location.origin;",
-        f"window.API_BASE_URL = '{API_BASE_URL}';"
+    static_assets.get()
+    return page_cache.response(request, "saju_analysis")
+
+def _moment_text(moment):
+    year, month, day, hour, minute = moment
+    return f"{year}년 {month}월 {day}일 {hour}시 {minute}분"
+
+def _resolve_birth_moment(year, month, day, hour, minute, birth_place):
+    """출생지 경도로 시각 보정: (지명 또는 None, 한국 표준시 (년, 월, 일, 시, 분), 진태양시 (년, 월, 일, 시, 분))"""
+    place = place_index.get().lookup(birth_place)
+    return (place,) + resolve_birth_time(year, month, day, hour, minute, place.longitude if place else None)
+
+def _cached_response(birth_date_text, true_solar_time, cached_body):
+    """캐시된 응답 본문에 상태/출생일시/진태양시 필드를 붙여 JSON 응답 생성"""
+    content = prepend_fields(
+        {"status": "success", "birth_date": birth_date_text, "true_solar_time": true_solar_time}, cached_body
     )
-    
-    return HTMLResponse(content=content)
+    return Response(content=content, media_type="application/json")
 
-@app.post("/saju/analyze")
+@router.post("/saju/analyze")
 async def analyze_saju(request: SajuRequest):
     """오행 분석 API - 생년월일시를 받아서 해당하는 오행을 반환"""
-    try:
-        # 날짜와 시간 파싱
-        from datetime import datetime
-        
-        # 생년월일 파싱
-        birth_date_obj = datetime.strptime(request.birth_date, "%Y-%m-%d")
-        year = birth_date_obj.year
-        month = birth_date_obj.month
-        day = birth_date_obj.day
-        
-        # 출생시간 파싱
-        birth_time_obj = datetime.strptime(request.birth_time, "%H:%M")
-        hour = birth_time_obj.hour
-        minute = birth_time_obj.minute
-        
-        # 오행 계산
-        five_element = saju_calculator.get_five_element(
-            year, month, day, hour, minute
+    route = "/saju/analyze"
+    moment = request.moment
+    
+    # 진태양시 보정 (출생지 경도 + 균시차, 표준시 변경/서머타임 반영)
+    with StageTimer(route, "solar_time"):
+        place, standard, solar = _resolve_birth_moment(*moment, request.birth_place)
+    
+    # 캐시 확인 (같은 시지/월지면 결과가 같으므로 정규화된 키 사용)
+    with StageTimer(route, "cache_lookup"):
+        birth_date_text = _moment_text(moment)
+        true_solar_time = _moment_text(solar) if place else None
+        cache_key = (
+            "analyze", saju_calculator.canonical_moment(*standard, solar=solar),
+            request.gender, request.birth_place
         )
-        
-        if not five_element:
-            return {
-                "status": "error",
-                "error": "오행 계산에 실패했습니다."
-            }
-        
-        # 오행 성향 정보 가져오기
+        cached_body = result_cache.get(cache_key)
+    if cached_body is not None:
+        saju_calculations_total.inc(route, "cached")
+        return _cached_response(birth_date_text, true_solar_time, cached_body)
+    
+    # 오행 계산
+    with StageTimer(route, "calculate_saju"):
+        five_element = saju_calculator.get_five_element(*standard, solar=solar)
+    
+    if not five_element:
+        saju_calculations_total.inc(route, "failure")
+        return _error_response(500, "오행 계산에 실패했습니다.")
+    
+    # 오행 성향 정보 가져오기
+    with StageTimer(route, "traits"):
         traits_info = saju_calculator.get_five_element_traits(five_element)
-        
+    
+    with StageTimer(route, "response"):
         if traits_info:
             message = f"{traits_info['emoji']} 당신의 오행은 '{traits_info['name']}'입니다.\n\n"
             message += f"📋 주요 성향: {', '.join(traits_info['traits'])}\n\n"
@@ -100,88 +410,392 @@ async def analyze_saju(request: SajuRequest):
         else:
             message = f"당신의 오행은 '{five_element}'입니다."
         
-        return {
-            "status": "success",
-            "birth_date": f"{year}년 {month}월 {day}일 {hour}시 {minute}분",
+        cached_body = result_cache.set(cache_key, dump_json({
             "gender": request.gender,
             "birth_place": request.birth_place,
+            "place": place.to_dict() if place else None,
             "five_element": five_element,
             "message": message,
             "traits": traits_info
-        }
-        
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+        }))
+        response = _cached_response(birth_date_text, true_solar_time, cached_body)
+    saju_calculations_total.inc(route, "success")
+    return response
 
-@app.post("/saju/detailed")
+@router.post("/saju/detailed")
 async def analyze_saju_detailed(request: SajuRequest):
     """상세 사주 분석 API - 오행 + 천간 + 지지 + 일주 정보 반환"""
-    try:
-        # 날짜와 시간 파싱
-        from datetime import datetime
-        
-        # 생년월일 파싱
-        birth_date_obj = datetime.strptime(request.birth_date, "%Y-%m-%d")
-        year = birth_date_obj.year
-        month = birth_date_obj.month
-        day = birth_date_obj.day
-        
-        # 출생시간 파싱
-        birth_time_obj = datetime.strptime(request.birth_time, "%H:%M")
-        hour = birth_time_obj.hour
-        minute = birth_time_obj.minute
-        
-        # 상세 사주 계산
-        saju_result = saju_calculator.calculate_saju(
-            year, month, day, hour, minute
+    route = "/saju/detailed"
+    moment = request.moment
+    year, month, day, hour, minute = moment
+    
+    # 진태양시 보정 (출생지 경도 + 균시차, 표준시 변경/서머타임 반영)
+    with StageTimer(route, "solar_time"):
+        place, standard, solar = _resolve_birth_moment(*moment, request.birth_place)
+    
+    # 캐시 확인 (같은 시지/월지면 결과가 같으므로 정규화된 키 사용)
+    with StageTimer(route, "cache_lookup"):
+        birth_date_text = _moment_text(moment)
+        true_solar_time = _moment_text(solar) if place else None
+        cache_key = (
+            "detailed", saju_calculator.canonical_moment(*standard, solar=solar),
+            request.gender, request.birth_place
         )
-        
-        if not saju_result:
-            return {
-                "status": "error",
-                "error": "사주 계산에 실패했습니다."
-            }
-        
-        # 십성 계산 및 four_pillars 업데이트
-        four_pillars = saju_result['four_pillars']
-        day_stem = saju_result['day_stem']
-        
-        # 각 기둥에 십성 정보 추가
-        for pillar_name, pillar_data in four_pillars.items():
-            # 천간 십성 계산
-            ten_god = saju_calculator.calculate_ten_god(day_stem, pillar_data['stem'])
-            pillar_data['ten_god'] = ten_god
-            pillar_data['stem_hanja'] = saju_calculator.heavenly_stems_hanja[pillar_data['stem']]
-            
-            # 지지 십성 계산
-            branch_ten_god = saju_calculator.calculate_branch_ten_god(day_stem, pillar_data['branch'])
-            pillar_data['branch_ten_god'] = branch_ten_god
-            pillar_data['branch_hanja'] = saju_calculator.earthly_branches_hanja[pillar_data['branch']]
-        
-        # 오행 성향 정보 가져오기
-        traits_info = saju_calculator.get_five_element_traits(saju_result['five_element'])
-        
-        return {
-            "status": "success",
-            "birth_date": f"{year}년 {month}월 {day}일 {hour}시 {minute}분",
+        cached_body = result_cache.get(cache_key)
+    if cached_body is not None:
+        saju_calculations_total.inc(route, "cached")
+        return _cached_response(birth_date_text, true_solar_time, cached_body)
+    
+    # 차트 저장소 확인 (재시작/캐시 만료 후 반복 조회, 일주/시주가 진태양시 기준이므로 진태양시 날짜로 조회)
+    birth_date_key = f"{year:04d}-{month:02d}-{day:02d}"
+    solar_date_key = f"{solar[0]:04d}-{solar[1]:02d}-{solar[2]:02d}"
+    _, _, _, hour_branch, month_branch = cache_key[1]
+    store = chart_store.get()
+    if store is not None:
+        # SQLite 읽기는 이벤트 루프를 막지 않게 스레드풀에서
+        with StageTimer(route, "store_lookup"):
+            cached_body = await run_in_threadpool(
+                store.get_body, solar_date_key, hour_branch, month_branch, request.gender, request.birth_place
+            )
+        if cached_body is not None:
+            result_cache.set(cache_key, cached_body)
+            saju_calculations_total.inc(route, "stored")
+            return _cached_response(birth_date_text, true_solar_time, cached_body)
+    
+    # 상세 사주 계산
+    with StageTimer(route, "calculate_saju"):
+        saju_result = saju_calculator.calculate_saju(*standard, solar=solar)
+    
+    if not saju_result:
+        saju_calculations_total.inc(route, "failure")
+        return _error_response(500, "사주 계산에 실패했습니다.")
+    
+    # 십성/한자 포함 상세 기둥 (미리 만들어 둔 기둥별 필드 표에서 조회)
+    with StageTimer(route, "ten_god_enrichment"):
+        four_pillars = saju_result.four_pillars.to_dict(detailed=True)
+    
+    # 오행 성향 정보 가져오기
+    with StageTimer(route, "traits"):
+        traits_info = saju_calculator.get_five_element_traits(saju_result.five_element)
+    
+    with StageTimer(route, "response"):
+        cached_body = result_cache.set(cache_key, dump_json({
             "gender": request.gender,
             "birth_place": request.birth_place,
-            "five_element": saju_result['five_element'],
-            "day_stem": saju_result['day_stem'],
-            "day_branch": saju_result['day_branch'],
-            "day_pillar": saju_result['day_pillar'],
+            "place": place.to_dict() if place else None,
+            "five_element": saju_result.five_element,
+            "day_stem": saju_result.day_stem,
+            "day_branch": saju_result.day_branch,
+            "day_pillar": saju_result.day_pillar,
             "four_pillars": four_pillars,
+            "element_profile": saju_result.element_profile.to_dict(),
             "traits": traits_info
-        }
+        }))
+        response = _cached_response(birth_date_text, true_solar_time, cached_body)
+    
+    # 차트 저장 (큐에 넣기만 하고 디스크 쓰기는 백그라운드 스레드가 처리)
+    if store is not None:
+        from chart_store import chart_row
+        with StageTimer(route, "store_enqueue"):
+            store.enqueue(chart_row(
+                birth_date_key, f"{hour:02d}:{minute:02d}", solar_date_key, hour_branch, month_branch,
+                request.gender, request.birth_place, saju_result.five_element, four_pillars,
+                ChartFeatures.from_four_pillars(saju_result.four_pillars).pack(), cached_body
+            ))
+    saju_calculations_total.inc(route, "success")
+    return response
+
+@router.post("/saju/luck")
+async def analyze_luck(request: LuckRequest):
+    """대운/세운 API - 첫 줄은 요약, 이후 대운 구간(세운 포함)을 한 줄씩 NDJSON으로 스트리밍"""
+    route = "/saju/luck"
+    moment = request.moment
+    
+    # 진태양시 보정
+    with StageTimer(route, "solar_time"):
+        place, standard, solar = _resolve_birth_moment(*moment, request.birth_place)
+    
+    # 원국 계산 후 대운 방향/대운수 결정 (구간/세운은 스트리밍하면서 생성)
+    with StageTimer(route, "calculate_saju"):
+        saju_result = saju_calculator.calculate_saju(*standard, solar=solar)
+        if not saju_result:
+            saju_calculations_total.inc(route, "failure")
+            return _error_response(500, "사주 계산에 실패했습니다.")
+        luck_cycle = LuckCycle(saju_result, request.gender)
+    
+    summary = {
+        "status": "success",
+        "birth_date": _moment_text(moment),
+        "true_solar_time": _moment_text(solar) if place else None,
+        "gender": request.gender,
+        "day_pillar": saju_result.day_pillar,
+        "month_pillar": saju_result.four_pillars.month.name,
+        **luck_cycle.to_dict()
+    }
+    
+    def generate():
+        yield json.dumps(summary, ensure_ascii=False) + "\n"
+        for period in luck_cycle.timeline(request.years):
+            yield json.dumps(period, ensure_ascii=False) + "\n"
+    
+    saju_calculations_total.inc(route, "success")
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+def _calculate_person(person):
+    """요청 인물 한 명의 (지명 또는 None, 한국 표준시, 진태양시, SajuResult 또는 None)"""
+    place, standard, solar = _resolve_birth_moment(*person.moment, person.birth_place)
+    return place, standard, solar, saju_calculator.calculate_saju(*standard, solar=solar)
+
+def _person_summary(person, place, standard, solar, saju_result):
+    return {
+        "birth_date": _moment_text(person.moment),
+        "true_solar_time": _moment_text(solar) if place else None,
+        "gender": person.gender,
+        "birth_place": person.birth_place,
+        "five_element": saju_result.five_element,
+        "day_pillar": saju_result.day_pillar,
+        "four_pillars": saju_result.four_pillars.to_dict()
+    }
+
+@router.post("/saju/compatibility")
+async def analyze_compatibility(request: CompatibilityRequest):
+    """궁합 API - 두 사람의 일간 관계, 천간합, 지지 합/충, 오행 분포로 점수(0~100)와 근거 반환"""
+    route = "/saju/compatibility"
+    with StageTimer(route, "calculate_saju"):
+        people = [_calculate_person(person) for person in (request.person_a, request.person_b)]
+    if not all(person[-1] for person in people):
+        saju_calculations_total.inc(route, "failure")
+        return _error_response(500, "사주 계산에 실패했습니다.")
+    
+    with StageTimer(route, "score"):
+        details = compatibility_details(*(
+            ChartFeatures.from_four_pillars(person[-1].four_pillars) for person in people
+        ))
+    
+    saju_calculations_total.inc(route, "success")
+    return {
+        "status": "success",
+        "score": details.pop("score"),
+        "person_a": _person_summary(request.person_a, *people[0]),
+        "person_b": _person_summary(request.person_b, *people[1]),
+        "details": details
+    }
+
+def _rank_matches(features, candidates, limit):
+    """기준 인물 점수 표로 후보 순위를 계산해 상위 limit개의 [(점수, 키, 궁합 근거), ...] 반환"""
+    ranked = MatchScorer(features).rank(candidates, limit)
+    packed = dict(candidates)
+    results = []
+    for score, key in ranked:
+        details = compatibility_details(features, ChartFeatures.unpack(packed[key]))
+        del details["score"]
+        results.append((score, key, details))
+    return results
+
+@router.post("/saju/compatibility/matches")
+async def find_matches(request: MatchRequest):
+    """궁합 상대 찾기 API - 후보(요청에 담긴 목록 또는 저장된 차트) 중 궁합 점수 상위 limit명 반환"""
+    route = "/saju/compatibility/matches"
+    person = request.person
+    with StageTimer(route, "calculate_saju"):
+        place, standard, solar, saju_result = _calculate_person(person)
+    if not saju_result:
+        saju_calculations_total.inc(route, "failure")
+        return _error_response(500, "사주 계산에 실패했습니다.")
+    features = ChartFeatures.from_four_pillars(saju_result.four_pillars)
+    
+    # 후보 특징 값 준비: [(키, 묶인 특징 값), ...]
+    if request.candidates is not None:
+        source = "candidates"
+        with StageTimer(route, "candidate_features"):
+            candidates = []
+            for index, candidate in enumerate(request.candidates):
+                candidate_result = _calculate_person(candidate)[-1]
+                if candidate_result:
+                    candidates.append((index, ChartFeatures.from_four_pillars(candidate_result.four_pillars).pack()))
+    else:
+        store = chart_store.get()
+        if store is None:
+            return _error_response(503, "차트 저장소가 비활성화되어 있습니다.")
+        source = "charts"
+        gender = request.gender or ("여" if person.gender == "남" else "남")
+        _, _, _, hour_branch, month_branch = saju_calculator.canonical_moment(*standard, solar=solar)
+        exclude = (
+            f"{solar[0]:04d}-{solar[1]:02d}-{solar[2]:02d}", hour_branch, month_branch,
+            person.gender, person.birth_place
+        )
+        # 저장소 읽기/순위 계산은 후보 수에 비례하므로 이벤트 루프를 막지 않게 스레드풀에서
+        with StageTimer(route, "store_lookup"):
+            candidates = await run_in_threadpool(store.match_candidates, gender, request.pool_size, exclude=exclude)
+    
+    with StageTimer(route, "rank"):
+        ranked = await run_in_threadpool(_rank_matches, features, candidates, request.limit)
+    
+    with StageTimer(route, "response"):
+        if source == "charts":
+            charts = await run_in_threadpool(store.get_charts, [key for _, key, _ in ranked])
+            matches = [
+                {"chart_id": key, "score": score, **charts.get(key, {}), "details": details}
+                for score, key, details in ranked
+            ]
+        else:
+            matches = []
+            for score, key, details in ranked:
+                candidate = request.candidates[key]
+                matches.append({
+                    "index": key,
+                    "score": score,
+                    "birth_date": _moment_text(candidate.moment),
+                    "gender": candidate.gender,
+                    "birth_place": candidate.birth_place,
+                    "details": details
+                })
+    
+    saju_calculations_total.inc(route, "success")
+    return {
+        "status": "success",
+        "person": _person_summary(person, place, standard, solar, saju_result),
+        "source": source,
+        "candidates": len(candidates),
+        "matches": matches
+    }
+
+@router.get("/saju/cache/stats")
+async def cache_stats():
+    """분석 결과 캐시 통계 (적중/실패/제거 횟수)"""
+    return result_cache.stats()
+
+@router.get("/saju/places")
+async def complete_places(
+    q: str = Query("", max_length=PLACE_MAX_LENGTH),
+    limit: int = Query(AUTOCOMPLETE_LIMIT, ge=1, le=AUTOCOMPLETE_LIMIT)
+):
+    """출생지 자동완성 API - 입력 중인 지명 접두어로 후보 조회"""
+    return {"status": "success", "places": [place.to_dict() for place in place_index.get().complete(q, limit)]}
+
+@router.get("/saju/charts")
+async def query_charts(
+    day_pillar: Optional[str] = None,
+    five_element: Optional[Literal["나무", "불", "흙", "금", "물"]] = None,
+    gender: Optional[Literal["남", "여"]] = None,
+    birth_date_from: Optional[QueryDate] = None,
+    birth_date_to: Optional[QueryDate] = None,
+    limit: int = Query(100, ge=1, le=CHART_QUERY_MAX_LIMIT),
+    offset: int = Query(0, ge=0)
+):
+    """저장된 차트 코호트 조회 API - 일주/오행/성별/생년월일 범위(YYYY-MM-DD)로 필터링"""
+    store = chart_store.get()
+    if store is None:
+        return _error_response(503, "차트 저장소가 비활성화되어 있습니다.")
+    # 건수/목록 SQLite 조회는 이벤트 루프를 막지 않게 스레드풀에서
+    total, charts = await run_in_threadpool(
+        store.query, limit=limit, offset=offset, day_pillar=day_pillar, five_element=five_element, gender=gender,
+        birth_date_from=birth_date_from and birth_date_from.isoformat(),
+        birth_date_to=birth_date_to and birth_date_to.isoformat()
+    )
+    return {"status": "success", "total": total, "charts": charts}
+
+@router.get("/metrics")
+async def metrics():
+    """Prometheus 텍스트 형식 지표 (요청 수, 지연 시간 히스토그램, 단계별 시간, 계산 결과)"""
+    stats = result_cache.stats()
+    result_cache_entries.set(value=stats["size"])
+    result_cache_lookups.set("hit", value=stats["hits"])
+    result_cache_lookups.set("miss", value=stats["misses"])
+    for name, value in request_coalescer.stats().items():
+        coalescing_gauges[name].set(value=value)
+    limiter_stats = rate_limiter.stats()
+    rate_limit_requests.set("allowed", value=limiter_stats["allowed"])
+    rate_limit_requests.set("limited", value=limiter_stats["limited"])
+    rate_limit_clients.set(value=limiter_stats["clients"])
+    # 아직 만들지 않은 저장소는 지표 때문에 만들지 않음
+    if chart_store.loaded and chart_store.get() is not None:
+        store_stats = chart_store.get().stats()
+        for name, gauge in chart_store_gauges.items():
+            gauge.set(value=store_stats[name])
+    return Response(content=registry.render(), media_type="text/plain; version=0.0.4")
+
+@router.post("/saju/batch")
+async def analyze_saju_batch(request: SajuBatchRequest):
+    """대량 사주 분석 API - 결과를 한 줄에 한 명씩 NDJSON으로 스트리밍 (잘못된 행은 그 행만 error)"""
+    route = "/saju/batch"
+    if len(request.birth_dates) != len(request.birth_times):
+        saju_calculations_total.inc(route, "invalid")
+        return _error_response(422, "birth_dates와 birth_times의 길이가 같아야 합니다.")
+    
+    # 큰 배치는 프로세스 풀에서 계산 (API 프로세스는 전달만)
+    if batch_pool.should_offload(len(request.birth_dates)):
+        async def generate_pooled():
+            async for chunk in batch_pool.stream(request.birth_dates, request.birth_times, request.element_profile):
+                yield chunk
+            # 결과를 끝까지 보낸 뒤에 집계 (중간에 실패하면 success로 세지 않음)
+            saju_calculations_total.inc(route, "success")
         
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e)
-        }
+        return StreamingResponse(generate_pooled(), media_type="application/x-ndjson")
+    
+    def generate():
+        for start in range(0, len(request.birth_dates), BATCH_CHUNK_SIZE):
+            end = start + BATCH_CHUNK_SIZE
+            yield batch_lines(
+                saju_calculator, request.birth_dates[start:end], request.birth_times[start:end], start,
+                request.element_profile
+            )
+        saju_calculations_total.inc(route, "success")
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+@router.post("/saju/interpret")
+async def interpret_saju(request: SajuRequest):
+    """사주 해석 API - 출생 정보로 서버에서 사주를 계산해 LLM 해석을 SSE(text/event-stream)로 스트리밍"""
+    route = "/saju/interpret"
+    with StageTimer(route, "calculate_saju"):
+        _, _, _, result = _calculate_person(request)
+    if not result:
+        return _error_response(500, "사주 계산에 실패했습니다.")
+    
+    # 프롬프트에는 서버가 계산한 값만 들어간다
+    saju_result = {
+        "five_element": result.five_element,
+        "day_pillar": result.day_pillar,
+        "four_pillars": result.four_pillars.to_dict(detailed=True)
+    }
+    
+    async def events():
+        try:
+            async for delta in openai_service.get().stream_interpretation(saju_result):
+                yield f"data: {json.dumps({'delta': delta}, ensure_ascii=False)}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception:
+            # 업스트림 오류 내용은 로그에만 남기고 클라이언트에는 고정 문구
+            logger.exception("해석 생성 실패")
+            yield f"event: error\ndata: {json.dumps({'error': INTERPRET_ERROR}, ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# 앱 조립 (미들웨어, 예외 처리기, 라우트, 정적 파일, 기동/종료 처리 등록) - 서비스/캐시는 모듈 전역을 공유하므로 앱은 모듈당 하나
+with startup_profile.phase("app"):
+    app = FastAPI()
+    # 미들웨어는 나중에 추가한 것이 바깥쪽: 지표 → 속도 제한 → 동시 요청 합치기 → 라우트
+    # 같은 본문의 동시 요청 합치기
+    app.add_middleware(CoalescingMiddleware, coalescer=request_coalescer, routes=COALESCED_ROUTES)
+    # 클라이언트 IP별 속도 제한 (본문 파싱 전에 429 응답)
+    app.add_middleware(
+        RateLimitMiddleware, limiter=rate_limiter, routes=RATE_LIMITED_ROUTES,
+        trust_forwarded=RATE_LIMIT_TRUST_PROXY
+    )
+    # 라우트별 요청 수/지연 시간 수집 (/metrics로 노출, 429/합쳐진 요청 포함)
+    app.add_middleware(MetricsMiddleware)
+    app.add_exception_handler(RequestValidationError, validation_error)
+    app.add_exception_handler(Exception, server_error)
+    app.include_router(router)
+    app.mount("/static", static_files, name="static")
+    app.add_event_handler("startup", startup)
+    app.add_event_handler("shutdown", shutdown)
+startup_profile.mark("module_loaded")
 
 if __name__ == "__main__":
     import uvicorn
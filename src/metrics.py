@@ -0,0 +1,217 @@
+# 요청/단계별 성능 지표 수집
+# 외부 의존성 없이 Prometheus 텍스트 형식(0.0.4)으로 카운터/히스토그램/게이지를 노출한다.
+# - MetricsMiddleware: 라우트별 요청 수와 지연 시간 히스토그램
+# - StageTimer: 핸들러 내부 단계(날짜 파싱, 사주 계산 등)별 소요 시간
+
+import time
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# 핸들러 내부 단계용 구간 (초, 마이크로초 단위 작업)
+STAGE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(label_names, label_values, extra=None):
+    pairs = list(zip(label_names, label_values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    kind = 'counter'
+
+    def __init__(self, name, documentation, label_names=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values = {}
+
+    def inc(self, *label_values, amount=1):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values):
+        return self._values.get(label_values, 0)
+
+    def samples(self):
+        for label_values, value in sorted(self._values.items()):
+            yield self.name, _format_labels(self.label_names, label_values), value
+
+
+class Gauge(Counter):
+    """임의로 설정 가능한 값"""
+
+    kind = 'gauge'
+
+    def set(self, *label_values, value):
+        self._values[label_values] = value
+
+
+class Histogram:
+    """누적 구간(bucket) 히스토그램"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, label_names=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._series = {}  # 라벨 값 → [구간별 개수 리스트, 합계, 개수]
+
+    def observe(self, value, *label_values):
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [[0] * len(self.buckets), 0.0, 0]
+        counts = series[0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        series[1] += value
+        series[2] += 1
+
+    def count(self, *label_values):
+        series = self._series.get(label_values)
+        return series[2] if series else 0
+
+    def samples(self):
+        for label_values, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.label_names, label_values, ('le', _format_value(bound)))
+                yield f'{self.name}_bucket', labels, cumulative
+            labels = _format_labels(self.label_names, label_values)
+            yield f'{self.name}_sum', labels, total
+            yield f'{self.name}_count', labels, count
+
+
+class MetricsRegistry:
+    """지표 모음과 텍스트 형식 출력"""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, label_names=()):
+        return self.register(Counter(name, documentation, label_names))
+
+    def gauge(self, name, documentation, label_names=()):
+        return self.register(Gauge(name, documentation, label_names))
+
+    def histogram(self, name, documentation, label_names=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self):
+        """Prometheus 텍스트 형식 문자열"""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for name, labels, value in metric.samples():
+                lines.append(f'{name}{labels} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    'http_requests_total', '라우트별 HTTP 요청 수', ('method', 'route', 'status'))
+http_request_duration_seconds = registry.histogram(
+    'http_request_duration_seconds', '라우트별 HTTP 요청 처리 시간(초)', ('method', 'route'))
+handler_stage_duration_seconds = registry.histogram(
+    'handler_stage_duration_seconds', '핸들러 내부 단계별 처리 시간(초)', ('route', 'stage'), STAGE_BUCKETS)
+saju_calculations_total = registry.counter(
+    'saju_calculations_total', '사주 계산 결과 (success/cached/stored/failure/error)', ('route', 'outcome'))
+
+
+class StageTimer:
+    """핸들러 내부 단계 시간 측정용 컨텍스트 매니저
+
+    with StageTimer('/saju/detailed', 'parse'):
+        ...
+    """
+
+    __slots__ = ('route', 'stage', 'start')
+
+    def __init__(self, route, stage):
+        self.route = route
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        handler_stage_duration_seconds.observe(time.perf_counter() - self.start, self.route, self.stage)
+        return False
+
+
+class MetricsMiddleware:
+    """라우트별 요청 수/지연 시간을 기록하는 ASGI 미들웨어
+
+    라벨에는 실제 경로 대신 라우트 템플릿(/static 마운트 포함)을 써서 값의 가짓수를 제한한다.
+    스트리밍 응답은 본문 전송이 끝날 때까지의 시간을 잰다.
+    """
+
+    def __init__(self, app, excluded_routes=('/metrics',)):
+        self.app = app
+        self.excluded_routes = excluded_routes
+        # 라우트 endpoint → 라우트 경로 템플릿 (첫 요청 때 앱 라우트로부터 구성)
+        self._route_names = None
+        self._route_paths = frozenset()
+
+    def _route_name(self, scope):
+        if self._route_names is None:
+            self._route_names = {}
+            for route in scope['app'].routes if 'app' in scope else ():
+                endpoint = getattr(route, 'endpoint', None) or getattr(route, 'app', None)
+                if endpoint is not None:
+                    self._route_names[endpoint] = route.path
+            self._route_paths = frozenset(self._route_names.values())
+        name = self._route_names.get(scope.get('endpoint'))
+        if name is None:
+            # 라우팅 전에 응답한 요청(속도 제한, 합쳐진 동시 요청)은 경로가 라우트 경로와 같을 때만 그 이름으로
+            name = scope['path'] if scope['path'] in self._route_paths else 'unmatched'
+        return name
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = self._route_name(scope)
+            if route not in self.excluded_routes:
+                method = scope['method']
+                http_requests_total.inc(method, route, str(status_code))
+                http_request_duration_seconds.observe(time.perf_counter() - start, method, route)
@@ -0,0 +1,115 @@
+# OpenAI 사주 해석 서비스
+# 사주 계산 결과를 받아 LLM 해석을 스트리밍으로 생성한다.
+# - AsyncOpenAI 클라이언트 1개를 재사용 (내부 httpx 커넥션 풀 공유)
+# - 세마포어로 동시 업스트림 호출 수 제한
+# - (프롬프트 전체, 프롬프트 버전, 모델)을 키로 완성된 해석을 캐시
+# OPENAI_BASE_URL을 로컬 스텁 서버(scripts/openai_stub_server.py)로 지정하면 키 없이 테스트할 수 있다.
+
+import asyncio
+import os
+
+from result_cache import ResultCache
+
+# 프롬프트를 바꾸면 버전을 올려 이전 캐시가 재사용되지 않게 한다
+PROMPT_VERSION = "v1"
+
+SYSTEM_PROMPT = (
+    "당신은 사주 명리학을 바탕으로 PM(프로덕트 매니저) 성향을 풀어 주는 상담가입니다. "
+    "주어진 사주 네 기둥과 십성, 일간 오행을 근거로 업무 스타일, 강점, 주의할 점, "
+    "어울리는 PM 역할을 친근한 한국어로 4~6문단 이내로 설명하세요. "
+    "단정적인 운명 예언이나 건강/금전에 대한 조언은 하지 마세요."
+)
+
+PILLAR_LABELS = (('year', '연주'), ('month', '월주'), ('day', '일주'), ('hour', '시주'))
+
+
+def build_prompt(saju_result):
+    """사주 계산 결과로 사용자 프롬프트 생성"""
+    lines = [f"일간 오행: {saju_result['five_element']}", f"일주: {saju_result['day_pillar']}"]
+    for name, label in PILLAR_LABELS:
+        pillar = saju_result['four_pillars'][name]
+        line = f"{label}: {pillar['pillar']}"
+        if pillar.get('ten_god'):
+            line += f" (천간 십성 {pillar['ten_god']}, 지지 십성 {pillar.get('branch_ten_god', '-')})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class OpenAIService:
+    """OpenAI 스트리밍 해석 서비스"""
+
+    def __init__(self, api_key=None, base_url=None, model=None, max_concurrency=4,
+                 cache_size=5000, cache_ttl=86400, timeout=60.0):
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL")
+        self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.cache = ResultCache(max_size=cache_size, ttl_seconds=cache_ttl)
+        self._client = None
+        self._semaphore = None
+
+    @property
+    def client(self):
+        """AsyncOpenAI 클라이언트 (최초 사용 시 생성 후 재사용)"""
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
+                api_key=self.api_key or "not-set",
+                base_url=self.base_url,
+                timeout=self.timeout,
+                max_retries=2
+            )
+        return self._client
+
+    @property
+    def semaphore(self):
+        # 이벤트 루프가 뜬 뒤에 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def cache_key(self, prompt):
+        """(프롬프트, 프롬프트 버전, 모델) 캐시 키 - 업스트림에 보내는 입력 전체로 구분"""
+        return prompt, PROMPT_VERSION, self.model
+
+    async def stream_interpretation(self, saju_result):
+        """해석 텍스트 조각을 생성하는 비동기 제너레이터 (캐시 적중 시 업스트림 호출 없음)"""
+        prompt = build_prompt(saju_result)
+        key = self.cache_key(prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        async with self.semaphore:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                stream=True
+            )
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        chunks.append(delta)
+                        yield delta
+            finally:
+                # 클라이언트가 중간에 끊어도 업스트림 연결을 풀에 반납
+                await stream.close()
+
+        # 끝까지 받은 경우에만 캐시
+        self.cache.set(key, "".join(chunks))
+
+    async def close(self):
+        """커넥션 풀 정리"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
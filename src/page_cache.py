@@ -0,0 +1,227 @@
+# 페이지/정적 파일 메모리 캐시
+# 파일을 한 번 읽어(필요하면 변환 후) 원본/gzip/brotli 바이트로 보관하고,
+# ETag/Last-Modified 조건부 요청에는 304로 응답한다. 파일 수정 시각이 바뀌면 다시 렌더링한다.
+# 파일 옆에 미리 압축된 .gz/.br 파일이 있으면 다시 압축하지 않고 그대로 사용한다.
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import time
+from email.utils import formatdate, parsedate_to_datetime
+
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성 (없으면 gzip만 제공)
+    brotli = None
+
+# 이보다 작은 파일은 압축하지 않음
+MIN_COMPRESS_SIZE = 256
+
+# 미리 압축된 파일 확장자 → Content-Encoding
+PRECOMPRESSED_SUFFIXES = {'.br': 'br', '.gz': 'gzip'}
+
+# 내용 해시가 붙은 파일용 캐시 헤더 (내용이 바뀌면 URL이 바뀜)
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+class CachedAsset:
+    """메모리에 보관된 파일 한 개의 렌더링 결과"""
+
+    __slots__ = ('path', 'media_type', 'mtime', 'etag', 'last_modified', 'variants')
+
+    def __init__(self, path, media_type, mtime, body, precompressed=None):
+        self.path = path
+        self.media_type = media_type
+        self.mtime = mtime
+        self.etag = hashlib.md5(body).hexdigest()
+        self.last_modified = formatdate(mtime, usegmt=True)
+        # 인코딩 → 본문 바이트 (identity는 항상 존재)
+        self.variants = {'identity': body}
+        if precompressed:
+            self.variants.update(precompressed)
+        elif len(body) >= MIN_COMPRESS_SIZE:
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                self.variants['gzip'] = compressed
+            if brotli is not None:
+                compressed = brotli.compress(body)
+                if len(compressed) < len(body):
+                    self.variants['br'] = compressed
+
+
+def _accepted_encodings(header):
+    """Accept-Encoding 헤더를 {인코딩: q 값}으로 파싱 (q가 없으면 1, 잘못된 q는 0으로 봄)"""
+    accepted = {}
+    for part in header.split(','):
+        name, *params = part.split(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def choose_encoding(asset, accept_encoding):
+    """Accept-Encoding에서 q > 0인 인코딩 중 가장 작은 변형 선택 (목록에 없으면 *의 q 값, 후보가 없으면 identity)"""
+    accepted = _accepted_encodings(accept_encoding)
+    wildcard = accepted.get('*', 0.0)
+    candidates = [
+        encoding for encoding in ('br', 'gzip')
+        if encoding in asset.variants and accepted.get(encoding, wildcard) > 0
+    ]
+    if not candidates:
+        return 'identity'
+    return min(candidates, key=lambda encoding: len(asset.variants[encoding]))
+
+
+def is_not_modified(asset, request_headers):
+    """조건부 요청(If-None-Match / If-Modified-Since)이 현재 버전과 일치하는지 확인"""
+    if_none_match = request_headers.get('if-none-match')
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix('W/').strip('"') for tag in if_none_match.split(',')}
+        return '*' in tags or asset.etag in tags
+
+    if_modified_since = request_headers.get('if-modified-since')
+    if if_modified_since:
+        try:
+            return int(asset.mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+class PageCache:
+    """파일 경로별 CachedAsset 보관소"""
+
+    def __init__(self, check_interval=2.0):
+        # 수정 시각 확인 간격(초), 0 이하면 시작 시 한 번만 읽음
+        self.check_interval = check_interval
+        self._assets = {}        # 이름 → CachedAsset
+        self._sources = {}       # 이름 → (경로, media_type, transform)
+        self._checked_at = {}    # 이름 → 마지막 수정 시각 확인 시점
+
+    def register(self, name, path, media_type=None, transform=None):
+        """파일을 등록하고 즉시 렌더링 (transform: 문자열 → 문자열 변환 함수)"""
+        if media_type is None:
+            # text/* 타입은 Response가 charset=utf-8을 붙여 줌
+            media_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self._sources[name] = (path, media_type, transform)
+        return self._render(name)
+
+    def _render(self, name):
+        path, media_type, transform = self._sources[name]
+        mtime = os.stat(path).st_mtime
+        with open(path, 'rb') as f:
+            body = f.read()
+        precompressed = None
+        if transform is not None:
+            body = transform(body.decode('utf-8')).encode('utf-8')
+        else:
+            precompressed = {}
+            for suffix, encoding in PRECOMPRESSED_SUFFIXES.items():
+                if os.path.exists(path + suffix):
+                    with open(path + suffix, 'rb') as f:
+                        precompressed[encoding] = f.read()
+        asset = CachedAsset(path, media_type, mtime, body, precompressed)
+        self._assets[name] = asset
+        self._checked_at[name] = time.monotonic()
+        return asset
+
+    def get(self, name):
+        """렌더링된 파일 반환 (확인 간격이 지났고 파일이 바뀌었으면 다시 렌더링)"""
+        asset = self._assets[name]
+        if self.check_interval > 0:
+            now = time.monotonic()
+            if now - self._checked_at[name] >= self.check_interval:
+                self._checked_at[name] = now
+                try:
+                    if os.stat(asset.path).st_mtime != asset.mtime:
+                        asset = self._render(name)
+                except FileNotFoundError:
+                    pass
+        return asset
+
+    def __contains__(self, name):
+        return name in self._assets
+
+    def response(self, request, name, cache_control='no-cache'):
+        """조건부 요청/압축을 반영한 응답 생성"""
+        return asset_response(self.get(name), request.headers, cache_control)
+
+
+def asset_response(asset, request_headers, cache_control='no-cache'):
+    """CachedAsset으로 200 또는 304 응답 생성"""
+    encoding = choose_encoding(asset, request_headers.get('accept-encoding', ''))
+    headers = {
+        # 압축본은 바이트가 다르므로 약한 ETag 사용
+        'ETag': f'"{asset.etag}"' if encoding == 'identity' else f'W/"{asset.etag}"',
+        'Last-Modified': asset.last_modified,
+        'Cache-Control': cache_control,
+        'Vary': 'Accept-Encoding'
+    }
+    if is_not_modified(asset, request_headers):
+        return Response(status_code=304, headers=headers)
+    if encoding != 'identity':
+        headers['Content-Encoding'] = encoding
+    return Response(content=asset.variants[encoding], media_type=asset.media_type, headers=headers)
+
+
+class CachedStaticFiles:
+    """디렉터리 아래 파일을 처음 요청 시 메모리에 올려 두고 서빙하는 ASGI 앱 (StaticFiles 대체)
+
+    immutable_prefix 아래(해시 이름 파일)는 1년 immutable 캐시, 나머지는 매번 재검증(no-cache)한다.
+    """
+
+    def __init__(self, directory, cache=None, cache_control='no-cache', immutable_prefix=None):
+        self.directory = os.path.realpath(directory)
+        self.cache = cache or PageCache()
+        self.cache_control = cache_control
+        self.immutable_prefix = immutable_prefix
+
+    def preload(self):
+        """디렉터리 아래 모든 파일을 미리 렌더링 (압축본은 원본의 변형으로 함께 올라감)"""
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                if filename.endswith(('.gz', '.br', '.tmp')):
+                    continue
+                path = os.path.join(root, filename)
+                self.cache.register(os.path.relpath(path, self.directory).replace(os.sep, '/'), path)
+
+    def resolve(self, path):
+        """요청 경로를 디렉터리 안의 실제 파일 경로로 변환 (디렉터리 밖이면 None)"""
+        full_path = os.path.realpath(os.path.join(self.directory, path.lstrip('/')))
+        if not full_path.startswith(self.directory + os.sep) or not os.path.isfile(full_path):
+            return None
+        return full_path
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope, receive)
+        if request.method not in ('GET', 'HEAD'):
+            response = PlainTextResponse('Method Not Allowed', status_code=405)
+        else:
+            response = self.get_response(scope['path'], request.headers)
+        await response(scope, receive, send)
+
+    def get_response(self, path, request_headers):
+        name = path.lstrip('/')
+        if name not in self.cache:
+            full_path = self.resolve(name)
+            if full_path is None:
+                return PlainTextResponse('Not Found', status_code=404)
+            self.cache.register(name, full_path)
+        cache_control = self.cache_control
+        if self.immutable_prefix and name.startswith(self.immutable_prefix):
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        return asset_response(self.cache.get(name), request_headers, cache_control)
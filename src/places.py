@@ -0,0 +1,161 @@
+# 출생지 색인
+# 내장 지명 표(data/places.csv: 시/도, 시/군/구 → 위도/경도)를 메모리 색인으로 올려
+# 출생지 문자열 → 경도 조회(진태양시 보정용)와 자동완성을 처리한다.
+# - 조회: 공백을 뺀 이름/별칭 딕셔너리 (주소처럼 뒤에 동/읍 등이 붙으면 가장 긴 일치 접두어)
+# - 자동완성: 모든 별칭의 모든 접두어 → 후보 목록을 미리 계산해 둔 딕셔너리
+
+import csv
+import os
+from collections import namedtuple
+
+from saju_calendar import DATA_DIR
+
+PLACES_PATH = os.path.join(DATA_DIR, 'places.csv')
+
+# 자동완성 후보 최대 개수
+AUTOCOMPLETE_LIMIT = 10
+
+# 출생지/자동완성 입력 최대 길이 (주소 형태 입력까지 허용)
+PLACE_MAX_LENGTH = 100
+
+# 시/도 약칭 (옛 이름 포함)
+PROVINCE_ALIASES = {
+    '서울특별시': ('서울',),
+    '부산광역시': ('부산',),
+    '대구광역시': ('대구',),
+    '인천광역시': ('인천',),
+    '광주광역시': ('광주',),
+    '대전광역시': ('대전',),
+    '울산광역시': ('울산',),
+    '세종특별자치시': ('세종',),
+    '경기도': ('경기',),
+    '강원특별자치도': ('강원', '강원도'),
+    '충청북도': ('충북',),
+    '충청남도': ('충남',),
+    '전북특별자치도': ('전북', '전라북도'),
+    '전라남도': ('전남',),
+    '경상북도': ('경북',),
+    '경상남도': ('경남',),
+    '제주특별자치도': ('제주', '제주도'),
+    '평안남도': ('평남',),
+    '평안북도': ('평북',),
+    '황해북도': ('황북',),
+    '함경남도': ('함남',),
+    '함경북도': ('함북',)
+}
+
+# 시/도 이름만 입력하면 도청 소재지로 본다
+PROVINCE_CAPITALS = {
+    '경기도': '수원시',
+    '강원특별자치도': '춘천시',
+    '충청북도': '청주시',
+    '충청남도': '홍성군',
+    '전북특별자치도': '전주시',
+    '전라남도': '무안군',
+    '경상북도': '안동시',
+    '경상남도': '창원시',
+    '제주특별자치도': '제주시',
+    '평안남도': '평양시',
+    '평안북도': '신의주시',
+    '황해북도': '개성시',
+    '함경남도': '함흥시',
+    '함경북도': '청진시'
+}
+
+
+class Place(namedtuple('Place', ('name', 'province', 'latitude', 'longitude'))):
+    """지명 하나 (경도는 동경, 도 단위)"""
+
+    __slots__ = ()
+
+    @property
+    def full_name(self):
+        return self.name if self.name == self.province else f"{self.province} {self.name}"
+
+    def to_dict(self):
+        return {
+            'name': self.full_name,
+            'latitude': self.latitude,
+            'longitude': self.longitude
+        }
+
+
+def _normalize(text):
+    return ''.join(text.split())
+
+
+def _short_name(name):
+    """'수원시' → '수원', '강남구' → '강남' (남는 글자가 2자 미만이면 None)"""
+    for suffix in ('특별자치시', '특별시', '광역시', '시', '군', '구'):
+        if name.endswith(suffix) and len(name) - len(suffix) >= 2:
+            return name[:-len(suffix)]
+    return None
+
+
+def _aliases(place):
+    """지명의 조회 키 목록: (지명 자체 이름/약칭, 시/도 이름을 붙인 이름)"""
+    names = [place.name]
+    short = _short_name(place.name)
+    if short:
+        names.append(short)
+    if place.name == place.province:
+        return names + list(PROVINCE_ALIASES.get(place.province, ())), []
+    provinces = (place.province,) + PROVINCE_ALIASES.get(place.province, ())
+    return names, [province + name for province in provinces for name in names]
+
+
+class PlaceIndex:
+    """출생지 조회/자동완성 색인"""
+
+    def __init__(self, path=PLACES_PATH):
+        with open(path, encoding='utf-8', newline='') as f:
+            self.places = tuple(
+                Place(row['name'], row['province'], float(row['latitude']), float(row['longitude']))
+                for row in csv.DictReader(f)
+            )
+
+        # 조회 키 → Place (같은 키는 먼저 등록된 지명 우선: 광역시 > 시/군/구)
+        aliases = [(place, _aliases(place)) for place in self.places]
+        self._keys = {}
+        for place, (names, qualified) in aliases:
+            for alias in qualified + names:
+                self._keys.setdefault(_normalize(alias), place)
+
+        # 시/도 이름 → 도청 소재지
+        by_name = {(place.province, place.name): place for place in self.places}
+        for province, capital in PROVINCE_CAPITALS.items():
+            place = by_name.get((province, capital))
+            if place is None:
+                continue
+            for alias in (province,) + PROVINCE_ALIASES.get(province, ()):
+                self._keys.setdefault(alias, place)
+        # 접두어 조회는 가장 긴 키 길이부터 시작
+        self._max_key_length = max(map(len, self._keys))
+
+        # 접두어 → 자동완성 후보 (지명 자체 이름으로 일치한 것 먼저, 표 순서대로 최대 AUTOCOMPLETE_LIMIT개)
+        prefixes = {}
+        for qualified_pass in (False, True):
+            for place, (names, qualified) in aliases:
+                for alias in qualified if qualified_pass else names:
+                    key = _normalize(alias)
+                    for end in range(1, len(key) + 1):
+                        candidates = prefixes.setdefault(key[:end], [])
+                        if place not in candidates and len(candidates) < AUTOCOMPLETE_LIMIT:
+                            candidates.append(place)
+        self._prefixes = {prefix: tuple(candidates) for prefix, candidates in prefixes.items()}
+
+    def lookup(self, text):
+        """출생지 문자열 → Place (정확히 일치하는 키, 없으면 가장 긴 일치 접두어), 없으면 None"""
+        key = _normalize(text or '')
+        place = self._keys.get(key)
+        if place is not None:
+            return place
+        for end in range(min(len(key) - 1, self._max_key_length), 1, -1):
+            place = self._keys.get(key[:end])
+            if place is not None:
+                return place
+        return None
+
+    def complete(self, prefix, limit=AUTOCOMPLETE_LIMIT):
+        """입력 중인 접두어의 자동완성 후보 목록"""
+        return self._prefixes.get(_normalize(prefix or ''), ())[:limit]
@@ -0,0 +1,217 @@
+# 요청 보호: 같은 입력 동시 요청 합치기와 클라이언트별 요청 속도 제한
+# - RequestCoalescer: 같은 키의 작업이 진행 중이면 새로 시작하지 않고 그 결과를 함께 기다린다
+# - CoalescingMiddleware: 본문이 같은 동시 POST 요청은 먼저 온 요청만 앱(검증/캐시 조회/계산/직렬화)에서 처리하고
+#   나머지는 그 응답 바이트를 그대로 받는다 → 새로고침/공유 링크 폭주 때 CPU가 요청 수가 아닌 고유 입력 수에 비례
+# - RateLimiter: 클라이언트 IP별 토큰 버킷 (초당 rate개 충전, 최대 burst개), 외부 저장소 없이 프로세스 메모리에 보관
+#   워커가 여러 개면 워커마다 따로 세므로 실제 한도는 대략 워커 수 × rate
+# - RateLimitMiddleware: 본문 파싱 전에 걸러 한도를 넘은 요청이 검증/계산 비용을 쓰지 않게 한다
+
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict
+
+# 한도 초과 응답 본문 (다른 오류 응답과 같은 형식)
+RATE_LIMITED_BODY = json.dumps(
+    {"status": "error", "error": "요청이 너무 많습니다. 잠시 후 다시 시도해 주세요."},
+    ensure_ascii=False, separators=(",", ":")
+).encode("utf-8")
+
+
+class RequestCoalescer:
+    """키별 진행 중 작업 공유 (single-flight)
+
+    먼저 온 요청은 이벤트 루프를 한 번 양보한 뒤 작업을 실행해, 같은 루프 반복에 도착한 같은 키의
+    요청이 합류할 수 있게 한다. 합류한 요청은 결과(또는 예외)를 그대로 받는다.
+    """
+
+    def __init__(self):
+        self._in_flight = {}  # key → 결과를 받을 Future
+        self.leaders = 0
+        self.followers = 0
+
+    async def run(self, key, factory):
+        """key의 작업이 진행 중이면 그 결과를 기다리고, 아니면 factory()를 await
+        (결과, 다른 요청의 작업을 공유했는지) 반환"""
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.followers += 1
+            # 기다리던 요청이 취소돼도 공유 Future는 취소되지 않게
+            return await asyncio.shield(future), True
+
+        future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+        self.leaders += 1
+        try:
+            await asyncio.sleep(0)
+            result = await factory()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # 합류한 요청이 없어도 처리되지 않은 예외로 로그에 남지 않게
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._in_flight[key]
+        return result, False
+
+    def stats(self):
+        return {
+            "in_flight": len(self._in_flight),
+            "leaders": self.leaders,
+            "followers": self.followers
+        }
+
+
+class CoalescingMiddleware:
+    """routes 경로의 POST 요청 중 본문(과 Content-Type)이 같은 동시 요청을 coalescer로 합치는 ASGI 미들웨어
+
+    응답 전체를 모았다가 보내므로 스트리밍하지 않는 JSON 응답 라우트에만 쓴다.
+    max_body보다 큰 본문은 합치지 않는다.
+    """
+
+    def __init__(self, app, coalescer, routes, max_body=65536):
+        self.app = app
+        self.coalescer = coalescer
+        self.routes = frozenset(routes)
+        self.max_body = max_body
+
+    async def _capture(self, scope, body):
+        """본문을 넘겨 앱을 실행하고 응답 메시지 목록 반환"""
+        messages = []
+        pending = [{'type': 'http.request', 'body': body, 'more_body': False}]
+
+        async def receive():
+            if pending:
+                return pending.pop()
+            # 본문 뒤로는 메시지 없음 (공유 응답이 한 클라이언트의 연결 종료에 영향받지 않게)
+            await asyncio.get_running_loop().create_future()
+
+        async def send(message):
+            messages.append(message)
+
+        await self.app(scope, receive, send)
+        return messages
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] != 'POST' or scope['path'] not in self.routes:
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message['type'] != 'http.request':
+                return
+            chunks.append(message.get('body', b''))
+            more_body = message.get('more_body', False)
+        body = b''.join(chunks)
+
+        if len(body) > self.max_body:
+            messages = await self._capture(scope, body)
+        else:
+            content_type = next((value for name, value in scope['headers'] if name == b'content-type'), None)
+            messages, _ = await self.coalescer.run(
+                (scope['path'], content_type, body), lambda: self._capture(scope, body)
+            )
+        for message in messages:
+            await send(message)
+
+
+class RateLimiter:
+    """클라이언트별 토큰 버킷 (rate가 0이면 사용 안 함)
+
+    버킷은 최근 사용 순서로 최대 max_clients개만 보관한다. 가장 오래 쓰지 않은 버킷을 버리면
+    그 클라이언트는 다음 요청 때 가득 찬 버킷으로 다시 시작한다 (오래 쉬었다면 어차피 다시 찼을 버킷).
+    """
+
+    def __init__(self, rate=20.0, burst=40, max_clients=100000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets = OrderedDict()  # 클라이언트 → [남은 토큰, 마지막 충전 시각]
+        self.allowed = 0
+        self.limited = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self):
+        return self.rate > 0
+
+    def acquire(self, client, now=None):
+        """토큰 하나 사용: 허용이면 0.0, 한도 초과면 다음 토큰까지 남은 시간(초)"""
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = [float(self.burst), now]
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._buckets.move_to_end(client)
+            bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            self.allowed += 1
+            return 0.0
+        self.limited += 1
+        return (1.0 - bucket[0]) / self.rate
+
+    def stats(self):
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "clients": len(self._buckets),
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "evictions": self.evictions
+        }
+
+
+class RateLimitMiddleware:
+    """routes 경로 요청에 클라이언트 IP별 속도 제한을 적용하는 ASGI 미들웨어 (초과 시 429 + Retry-After)
+
+    trust_forwarded면 X-Forwarded-For의 첫 주소를 클라이언트로 본다 (리버스 프록시 뒤에서만 켤 것).
+    """
+
+    def __init__(self, app, limiter, routes, trust_forwarded=False):
+        self.app = app
+        self.limiter = limiter
+        self.routes = frozenset(routes)
+        self.trust_forwarded = trust_forwarded
+
+    def _client(self, scope):
+        if self.trust_forwarded:
+            for name, value in scope['headers']:
+                if name == b'x-forwarded-for':
+                    return value.split(b',')[0].strip().decode('latin-1')
+        client = scope.get('client')
+        return client[0] if client else 'unknown'
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not self.limiter.enabled or scope['path'] not in self.routes:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = self.limiter.acquire(self._client(scope))
+        if not retry_after:
+            await self.app(scope, receive, send)
+            return
+
+        await send({
+            'type': 'http.response.start',
+            'status': 429,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(RATE_LIMITED_BODY)).encode()),
+                (b'retry-after', str(math.ceil(retry_after)).encode())
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': RATE_LIMITED_BODY})
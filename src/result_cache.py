@@ -0,0 +1,76 @@
+# 사주 분석 응답 캐시
+# 정규화된 출생 정보를 키로, 직렬화가 끝난 JSON 바이트를 LRU + TTL 방식으로 보관한다.
+
+import json
+import time
+from collections import OrderedDict
+
+
+def dump_json(content):
+    """FastAPI JSONResponse와 같은 형식으로 JSON 바이트 직렬화"""
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def prepend_fields(fields, cached_body):
+    """캐시된 JSON 객체 바이트 앞에 요청마다 달라지는 필드를 붙여 응답 바이트 생성"""
+    return dump_json(fields)[:-1] + b"," + cached_body[1:]
+
+
+class ResultCache:
+    """크기 제한(LRU)과 만료 시간(TTL)이 있는 응답 캐시"""
+
+    def __init__(self, max_size=10000, ttl_seconds=3600):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key → (만료 시각, 값)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """캐시 조회 (없거나 만료되면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """캐시 저장 (가득 차면 가장 오래 쓰지 않은 항목 제거)"""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        """캐시 비우기"""
+        self._entries.clear()
+
+    def stats(self):
+        """캐시 통계 반환"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
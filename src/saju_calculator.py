@@ -1,227 +1,642 @@
 # 만세력 기반 사주 계산기
 # 생년월일시를 입력하면 만세력에 기반한 사주 분석을 제공
 
+import os
+import re
+import struct
+from collections import namedtuple
+from datetime import date, time
+
+from saju_calendar import BASE_DAY_INDEX, BASE_ORDINAL, CALENDAR_PATH, days_from_civil, open_shared_calendar
+import solar_terms
+from solar_time import resolve_birth_time
+
+# 정수 코드 표
+# 천간 0~9 (갑~계), 지지 0~11 (자~해), 오행 0~4 (상생 순서: 나무→불→흙→금→물),
+# 십성 0~9 (비견~정인). 문자열/한자는 직렬화할 때만 아래 이름 표로 변환한다.
+HEAVENLY_STEMS = ('갑', '을', '병', '정', '무', '기', '경', '신', '임', '계')
+EARTHLY_BRANCHES = ('자', '축', '인', '묘', '진', '사', '오', '미', '신', '유', '술', '해')
+HEAVENLY_STEMS_HANJA = ('甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸')
+EARTHLY_BRANCHES_HANJA = ('子', '丑', '寅', '卯', '辰', '巳', '午', '未', '申', '酉', '戌', '亥')
+FIVE_ELEMENTS = ('나무', '불', '흙', '금', '물')
+TEN_GODS = ('비견', '겁재', '식신', '상관', '편재', '정재', '편관', '정관', '편인', '정인')
+
+STEM_CODES = {name: code for code, name in enumerate(HEAVENLY_STEMS)}
+BRANCH_CODES = {name: code for code, name in enumerate(EARTHLY_BRANCHES)}
+ELEMENT_CODES = {name: code for code, name in enumerate(FIVE_ELEMENTS)}
+
+# 천간/지지 → 오행 코드, 음양 (양=0, 음=1)
+STEM_ELEMENTS = tuple(code // 2 for code in range(10))
+BRANCH_ELEMENTS = (4, 2, 0, 0, 2, 1, 1, 2, 3, 3, 2, 4)
+STEM_POLARITY = tuple(code % 2 for code in range(10))
+BRANCH_POLARITY = tuple(code % 2 for code in range(12))  # 자, 인, 진, 오, 신, 술이 양
+
+
+# 조회 전용 표 (모듈 로드 시 한 번만 생성, 모든 계산기 인스턴스와
+# preload 후 fork된 워커 프로세스가 같은 객체를 공유)
+FIVE_ELEMENT_NAMES = dict(zip(HEAVENLY_STEMS, (FIVE_ELEMENTS[code] for code in STEM_ELEMENTS)))
+BRANCH_ELEMENT_NAMES = dict(zip(EARTHLY_BRANCHES, (FIVE_ELEMENTS[code] for code in BRANCH_ELEMENTS)))
+STEM_HANJA = dict(zip(HEAVENLY_STEMS, HEAVENLY_STEMS_HANJA))
+BRANCH_HANJA = dict(zip(EARTHLY_BRANCHES, EARTHLY_BRANCHES_HANJA))
+
+# 십성 계산을 위한 오행 관계
+TEN_GOD_RELATIONS = {
+    '비견': '같은 오행, 같은 음양',
+    '겁재': '같은 오행, 다른 음양', 
+    '식신': '생하는 오행, 같은 음양',
+    '상관': '생하는 오행, 다른 음양',
+    '편재': '극하는 오행, 같은 음양',
+    '정재': '극하는 오행, 다른 음양',
+    '편관': '극당하는 오행, 같은 음양',
+    '정관': '극당하는 오행, 다른 음양',
+    '편인': '생당하는 오행, 같은 음양',
+    '정인': '생당하는 오행, 다른 음양'
+}
+
+# 십성 계산을 위한 오행 상생/상극 관계
+FIVE_ELEMENT_RELATIONS = {
+    '나무': {'생': '불', '극': '흙', '생당': '물', '극당': '금'},
+    '불': {'생': '흙', '극': '금', '생당': '나무', '극당': '물'},
+    '흙': {'생': '금', '극': '물', '생당': '불', '극당': '나무'},
+    '금': {'생': '물', '극': '나무', '생당': '흙', '극당': '불'},
+    '물': {'생': '나무', '극': '불', '생당': '금', '극당': '흙'}
+}
+
+# 오행별 성향과 특징
+FIVE_ELEMENT_TRAITS = {
+    '나무': {
+        'name': '목(木)',
+        'emoji': '🌳',
+        'traits': ['성장', '창의성', '리더십', '도전정신', '활발함'],
+        'description': '성장과 발전을 추구하는 활발한 성격으로, 새로운 도전을 즐기고 창의적인 사고를 합니다. 리더십이 강하고 팀을 이끌어가는 능력이 뛰어납니다.',
+        'strengths': '창의적 사고, 리더십, 도전정신, 성장 지향적',
+        'weaknesses': '성급함, 완벽주의 경향, 타인의 의견을 무시할 수 있음'
+    },
+    '불': {
+        'name': '화(火)',
+        'emoji': '🔥',
+        'traits': ['열정', '추진력', '활동성', '표현력', '에너지'],
+        'description': '강한 열정과 추진력을 가진 활발한 성격으로, 목표를 향해 끊임없이 전진합니다. 표현력이 뛰어나고 주변 사람들에게 에너지를 전달합니다.',
+        'strengths': '강한 추진력, 열정, 빠른 실행력, 에너지 전달',
+        'weaknesses': '성급함, 인내심 부족, 감정적 기복이 클 수 있음'
+    },
+    '흙': {
+        'name': '토(土)',
+        'emoji': '🪨',
+        'traits': ['안정성', '신중함', '책임감', '관리능력', '균형감각'],
+        'description': '안정적이고 신중한 성격으로, 책임감이 강하고 체계적인 관리 능력이 뛰어납니다. 균형감각이 좋아 팀의 조화를 이끌어냅니다.',
+        'strengths': '안정성, 신중함, 책임감, 체계적 관리, 균형감각',
+        'weaknesses': '보수적 성향, 변화에 둔감, 결정이 느릴 수 있음'
+    },
+    '금': {
+        'name': '금(金)',
+        'emoji': '⚙️',
+        'traits': ['논리성', '분석력', '정확성', '체계성', '객관성'],
+        'description': '논리적이고 분석적인 사고를 하는 성격으로, 객관적 데이터를 바탕으로 정확한 판단을 내립니다. 체계적이고 정확한 작업을 선호합니다.',
+        'strengths': '논리적 사고, 분석력, 정확성, 체계성, 객관성',
+        'weaknesses': '감정 표현 부족, 유연성 부족, 완벽주의 경향'
+    },
+    '물': {
+        'name': '수(水)',
+        'emoji': '💧',
+        'traits': ['유연성', '공감능력', '소통능력', '적응력', '직관력'],
+        'description': '유연하고 공감능력이 뛰어난 성격으로, 타인의 감정을 잘 이해하고 소통 능력이 뛰어납니다. 변화에 잘 적응하고 직관력이 강합니다.',
+        'strengths': '공감능력, 소통능력, 유연성, 적응력, 직관력',
+        'weaknesses': '결정력 부족, 우유부단함, 타인의 의견에 쉽게 휩쓸림'
+    }
+}
+
+
+def _ten_god_code(day_element, day_polarity, target_element, target_polarity):
+    # 오행 차이: 0 같음, 1 생함, 2 극함, 3 극당함, 4 생당함 → 같은 음양이면 편(짝수), 다르면 정(홀수)
+    return ((target_element - day_element) % 5) * 2 + (day_polarity != target_polarity)
+
+
+# 십성 표: [일간 코드][대상 천간 코드] (10×10), [일간 코드][대상 지지 코드] (10×12)
+STEM_TEN_GODS = tuple(
+    tuple(
+        _ten_god_code(STEM_ELEMENTS[day], STEM_POLARITY[day], STEM_ELEMENTS[target], STEM_POLARITY[target])
+        for target in range(10)
+    )
+    for day in range(10)
+)
+BRANCH_TEN_GODS = tuple(
+    tuple(
+        _ten_god_code(STEM_ELEMENTS[day], STEM_POLARITY[day], BRANCH_ELEMENTS[target], BRANCH_POLARITY[target])
+        for target in range(12)
+    )
+    for day in range(10)
+)
+
+# 지장간 (지지 속 천간: 여기/중기/정기) - 지지마다 (천간 코드, 절기 한 달 30일 중 맡는 일수)
+HIDDEN_STEMS = (
+    ((8, 10), (9, 20)),            # 자: 임 계
+    ((9, 9), (7, 3), (5, 18)),     # 축: 계 신 기
+    ((4, 7), (2, 7), (0, 16)),     # 인: 무 병 갑
+    ((0, 10), (1, 20)),            # 묘: 갑 을
+    ((1, 9), (9, 3), (4, 18)),     # 진: 을 계 무
+    ((4, 7), (6, 7), (2, 16)),     # 사: 무 경 병
+    ((2, 10), (5, 9), (3, 11)),    # 오: 병 기 정
+    ((3, 9), (1, 3), (5, 18)),     # 미: 정 을 기
+    ((4, 7), (8, 7), (6, 16)),     # 신: 무 임 경
+    ((6, 10), (7, 20)),            # 유: 경 신
+    ((7, 9), (3, 3), (4, 18)),     # 술: 신 정 무
+    ((4, 7), (0, 7), (8, 16))      # 해: 무 갑 임
+)
+
+# 월지 계절 기준 오행 세력 (왕상휴수사) - [(오행 - 월지 오행) % 5] → 이름, 가중치(%)
+SEASON_STRENGTHS = ('왕', '상', '사', '수', '휴')
+SEASON_PERCENTS = (150, 120, 70, 80, 100)
+
+# 60갑자 이름 (인덱스 i → 천간 i % 10, 지지 i % 12)
+SEXAGENARY_CYCLE = tuple(HEAVENLY_STEMS[i % 10] + EARTHLY_BRANCHES[i % 12] for i in range(60))
+PILLAR_NAMES = ('year', 'month', 'day', 'hour')
+
+
+def sexagenary_index(stem, branch):
+    """천간/지지 코드로 60갑자 인덱스 계산"""
+    return (6 * stem - 5 * branch) % 60
+
+
+# 출생일/시각 입력 형식 (API 요청과 배치가 같은 규칙으로 파싱)
+BIRTH_DATE_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+BIRTH_TIME_PATTERN = re.compile(r'[0-9]{2}:[0-9]{2}')
+
+
+def parse_birth_date(text):
+    """'YYYY-MM-DD' 문자열 → date (형식이 다르거나 없는 날짜면 ValueError)"""
+    if not isinstance(text, str) or not BIRTH_DATE_PATTERN.fullmatch(text):
+        raise ValueError("YYYY-MM-DD 형식의 날짜여야 합니다.")
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise ValueError("존재하지 않는 날짜입니다.") from None
+
+
+def parse_birth_time(text):
+    """'HH:MM' 문자열 → time (형식이 다르거나 없는 시각이면 ValueError)"""
+    if not isinstance(text, str) or not BIRTH_TIME_PATTERN.fullmatch(text):
+        raise ValueError("HH:MM 형식의 시각이어야 합니다.")
+    try:
+        return time.fromisoformat(text)
+    except ValueError:
+        raise ValueError("존재하지 않는 시각입니다.") from None
+
+
+def _parse_birth_moment(birth_date, birth_time):
+    """'YYYY-MM-DD', 'HH:MM' 문자열을 (년, 월, 일, 시, 분)으로 파싱, 잘못된 값이나 지원 범위 밖 연도면 None"""
+    try:
+        day, clock = parse_birth_date(birth_date), parse_birth_time(birth_time)
+    except ValueError:
+        return None
+    if not solar_terms.MIN_YEAR <= day.year <= solar_terms.MAX_YEAR:
+        return None
+    return day.year, day.month, day.day, clock.hour, clock.minute
+
+
+def _season_name(year, month, day, hour, minute):
+    """해당 월의 절입 시각이 지났으면 절기 이름, 아니면 빈 문자열"""
+    name, term_moment = solar_terms.month_term(year, month)
+    if solar_terms.moment_minutes(year, month, day, hour, minute) >= term_moment:
+        return name
+    return ''
+
+
+class Pillar(namedtuple('Pillar', ('stem', 'branch'))):
+    """기둥 하나 (천간/지지 정수 코드). 이름, 한자, 십성은 필요할 때 표에서 조회"""
+
+    __slots__ = ()
+
+    @property
+    def index(self):
+        return sexagenary_index(self.stem, self.branch)
+
+    @property
+    def name(self):
+        return SEXAGENARY_CYCLE[self.index]
+
+    @property
+    def stem_name(self):
+        return HEAVENLY_STEMS[self.stem]
+
+    @property
+    def branch_name(self):
+        return EARTHLY_BRANCHES[self.branch]
+
+    @property
+    def stem_hanja(self):
+        return HEAVENLY_STEMS_HANJA[self.stem]
+
+    @property
+    def branch_hanja(self):
+        return EARTHLY_BRANCHES_HANJA[self.branch]
+
+    def ten_god(self, day_stem):
+        """일간 코드 기준 천간 십성 이름"""
+        return TEN_GODS[STEM_TEN_GODS[day_stem][self.stem]]
+
+    def branch_ten_god(self, day_stem):
+        """일간 코드 기준 지지 십성 이름"""
+        return TEN_GODS[BRANCH_TEN_GODS[day_stem][self.branch]]
+
+    def to_dict(self, day_stem=None):
+        """응답용 딕셔너리 (day_stem을 주면 십성/한자 포함 상세 형식)"""
+        if day_stem is None:
+            return dict(_PILLAR_FIELDS[self.stem][self.branch])
+        return dict(_DETAILED_PILLAR_FIELDS[day_stem][self.stem][self.branch])
+
+
+# 60갑자 기둥 객체 표 [천간][지지] (음양이 맞지 않는 조합은 None) - 요청마다 새로 만들지 않고 공유
+PILLARS = tuple(
+    tuple(Pillar(stem, branch) if stem % 2 == branch % 2 else None for branch in range(12))
+    for stem in range(10)
+)
+
+# 직렬화용 기둥 필드 (기존 응답과 같은 키 순서)
+# 기본: [천간][지지] → (stem, branch, pillar), 상세: [일간][천간][지지] → 십성/한자 포함
+_PILLAR_FIELDS = tuple(
+    tuple(
+        pillar and (('stem', pillar.stem_name), ('branch', pillar.branch_name), ('pillar', pillar.name))
+        for pillar in row
+    )
+    for row in PILLARS
+)
+_DETAILED_PILLAR_FIELDS = tuple(
+    tuple(
+        tuple(
+            pillar and _PILLAR_FIELDS[pillar.stem][pillar.branch] + (
+                ('ten_god', pillar.ten_god(day_stem)),
+                ('stem_hanja', pillar.stem_hanja),
+                ('branch_ten_god', pillar.branch_ten_god(day_stem)),
+                ('branch_hanja', pillar.branch_hanja)
+            )
+            for pillar in row
+        )
+        for row in PILLARS
+    )
+    for day_stem in range(10)
+)
+
+
+# 오행 세력 벡터 표: [월지][60갑자 인덱스] → 기둥 하나의 오행별 (가중치, 글자 수)를 16비트 칸 10개에 묶은 정수
+# - 가중치 칸 0~4: 천간 30 + 지장간 일수(합 30)를 월지 계절 가중치(%)로 곱한 값 (기둥 네 개 합도 16비트 안)
+# - 글자 수 칸 5~9: 겉으로 드러난 천간/지지 오행 글자 수
+# 기둥 네 개의 값을 더하기만 하면 다섯 오행이 한 번에 합산된다.
+_ELEMENT_LANE_BITS = 16
+# 칸 10개를 한 번에 푸는 형식 (리틀 엔디언 부호 없는 16비트 × 10)
+_ELEMENT_LANES = struct.Struct('<10H')
+# 가중치 칸 단위 → 글자 수 단위 (천간 하나 = 30일 × 100%)
+_ELEMENT_WEIGHT_UNIT = 30 * 100
+
+
+def _element_vector(pillar_index, season):
+    stem, branch = pillar_index % 10, pillar_index % 12
+    lanes = [0] * 10
+    lanes[STEM_ELEMENTS[stem]] += 30
+    for hidden_stem, days in HIDDEN_STEMS[branch]:
+        lanes[STEM_ELEMENTS[hidden_stem]] += days
+    for element in range(5):
+        lanes[element] *= SEASON_PERCENTS[(element - season) % 5]
+    lanes[5 + STEM_ELEMENTS[stem]] += 1
+    lanes[5 + BRANCH_ELEMENTS[branch]] += 1
+    return sum(value << (lane * _ELEMENT_LANE_BITS) for lane, value in enumerate(lanes))
+
+
+ELEMENT_VECTORS = tuple(
+    tuple(_element_vector(index, BRANCH_ELEMENTS[month_branch]) for index in range(60))
+    for month_branch in range(12)
+)
+
+
+# 월지 오행 → 오행별 왕상휴수사 (응답 필드)
+_SEASON_STRENGTH_FIELDS = tuple(
+    tuple((name, SEASON_STRENGTHS[(element - season) % 5]) for element, name in enumerate(FIVE_ELEMENTS))
+    for season in range(5)
+)
+
+
+class ElementProfile(namedtuple('ElementProfile', ('season', 'counts', 'weights'))):
+    """오행 세력 분포 (season: 월지 오행 코드, counts: 오행별 겉 글자 수, weights: 지장간/계절 반영 세력)"""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_vector(cls, season, vector):
+        """ELEMENT_VECTORS 값(기둥 네 개 합)에서 생성"""
+        lanes = _ELEMENT_LANES.unpack(vector.to_bytes(_ELEMENT_LANES.size, 'little'))
+        return cls(season, lanes[5:], tuple(round(value / _ELEMENT_WEIGHT_UNIT, 2) for value in lanes[:5]))
+
+    def to_dict(self):
+        """응답용 딕셔너리 (percent: 세력 비율, strengths: 월지 기준 왕상휴수사)"""
+        total = sum(self.weights)
+        return {
+            'season': FIVE_ELEMENTS[self.season],
+            'counts': dict(zip(FIVE_ELEMENTS, self.counts)),
+            'weights': dict(zip(FIVE_ELEMENTS, self.weights)),
+            'percent': {name: round(weight * 100 / total, 1) for name, weight in zip(FIVE_ELEMENTS, self.weights)},
+            'strengths': dict(_SEASON_STRENGTH_FIELDS[self.season]),
+            'strongest': FIVE_ELEMENTS[max(range(5), key=self.weights.__getitem__)],
+            'weakest': FIVE_ELEMENTS[min(range(5), key=self.weights.__getitem__)]
+        }
+
+
+class FourPillars(namedtuple('FourPillars', PILLAR_NAMES)):
+    """사주 네 기둥 (불변, 각 기둥은 공유되는 Pillar 객체)"""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_codes(cls, codes):
+        """((년간, 년지), (월간, 월지), (일간, 일지), (시간, 시지)) 정수 코드로 생성"""
+        return cls._make(PILLARS[stem][branch] for stem, branch in codes)
+
+    @property
+    def codes(self):
+        return tuple((pillar.stem, pillar.branch) for pillar in self)
+
+    @property
+    def day_stem(self):
+        return self.day.stem
+
+    @property
+    def five_element(self):
+        """일간 오행 이름"""
+        return FIVE_ELEMENTS[STEM_ELEMENTS[self.day.stem]]
+
+    @property
+    def element_profile(self):
+        """여덟 글자 + 지장간의 오행 세력 분포 (월지 계절 반영, 기둥별 벡터 표 네 번 조회 후 합산)"""
+        table = ELEMENT_VECTORS[self.month.branch]
+        vector = table[self.year.index] + table[self.month.index] + table[self.day.index] + table[self.hour.index]
+        return ElementProfile.from_vector(BRANCH_ELEMENTS[self.month.branch], vector)
+
+    def to_dict(self, detailed=False):
+        """기존 응답 형식 {'year': {'stem', 'branch', 'pillar'[, 십성/한자]}, ...}으로 변환"""
+        fields = _DETAILED_PILLAR_FIELDS[self.day.stem] if detailed else _PILLAR_FIELDS
+        return {
+            name: dict(fields[pillar.stem][pillar.branch])
+            for name, pillar in zip(PILLAR_NAMES, self)
+        }
+
+
+class SajuResult(namedtuple('SajuResult', ('four_pillars', 'moment'))):
+    """사주 계산 결과 (네 기둥 + 출생 시각 (년, 월, 일, 시, 분)). 절기 등 파생 값은 조회 시 계산"""
+
+    __slots__ = ()
+
+    @property
+    def pillar_codes(self):
+        return self.four_pillars.codes
+
+    @property
+    def five_element(self):
+        return self.four_pillars.five_element
+
+    @property
+    def day_stem(self):
+        return self.four_pillars.day.stem_name
+
+    @property
+    def day_branch(self):
+        return self.four_pillars.day.branch_name
+
+    @property
+    def day_pillar(self):
+        return self.four_pillars.day.name
+
+    @property
+    def season(self):
+        return _season_name(*self.moment)
+
+    @property
+    def element_profile(self):
+        return self.four_pillars.element_profile
+
+    @property
+    def lunar_month(self):
+        return (self.four_pillars.month.branch - 2) % 12 + 1
+
+    def to_dict(self, detailed=False):
+        """기존 calculate_saju 딕셔너리 형식으로 변환"""
+        return {
+            'five_element': self.five_element,
+            'day_stem': self.day_stem,
+            'day_branch': self.day_branch,
+            'day_pillar': self.day_pillar,
+            'four_pillars': self.four_pillars.to_dict(detailed),
+            'pillar_codes': self.pillar_codes,
+            'season': self.season,
+            'lunar_month': self.lunar_month
+        }
+
+
 class SajuCalculator:
-    def __init__(self):
+    def __init__(self, load_calendar=True):
         # 천간 10개
-        self.heavenly_stems = ['갑', '을', '병', '정', '무', '기', '경', '신', '임', '계']
+        self.heavenly_stems = list(HEAVENLY_STEMS)
         # 지지 12개
-        self.earthly_branches = ['자', '축', '인', '묘', '진', '사', '오', '미', '신', '유', '술', '해']
-        # 오행 매핑 (천간 기준)
-        self.five_elements = {
-            '갑': '나무', '을': '나무', '병': '불', '정': '불', '무': '흙', '기': '흙',
-            '경': '금', '신': '금', '임': '물', '계': '물'
-        }
-        # 지지 오행 매핑
-        self.earthly_five_elements = {
-            '자': '물', '축': '흙', '인': '나무', '묘': '나무', '진': '흙', '사': '불',
-            '오': '불', '미': '흙', '신': '금', '유': '금', '술': '흙', '해': '물'
-        }
+        self.earthly_branches = list(EARTHLY_BRANCHES)
+        # 오행/한자/십성/성향 표는 모듈 상수를 그대로 참조 (인스턴스마다 복사하지 않음)
+        self.five_elements = FIVE_ELEMENT_NAMES
+        self.earthly_five_elements = BRANCH_ELEMENT_NAMES
+        self.heavenly_stems_hanja = STEM_HANJA
+        self.earthly_branches_hanja = BRANCH_HANJA
+        self.ten_gods = TEN_GOD_RELATIONS
+        self.five_element_relations = FIVE_ELEMENT_RELATIONS
+        self.five_element_traits = FIVE_ELEMENT_TRAITS
         
-        # 천간 한자 매핑
-        self.heavenly_stems_hanja = {
-            '갑': '甲', '을': '乙', '병': '丙', '정': '丁', '무': '戊', 
-            '기': '己', '경': '庚', '신': '辛', '임': '壬', '계': '癸'
-        }
+        # 미리 계산된 만세력/절기 테이블 (프로세스당 한 번만 mmap, 없으면 날짜 연산으로 계산)
+        self.calendar = None
+        if load_calendar and os.path.exists(CALENDAR_PATH):
+            self.calendar = open_shared_calendar(CALENDAR_PATH)
+            solar_terms.load_table(self.calendar)
+    
+    def resolve_month(self, year, month, day, hour=0, minute=0, entry=None):
+        """절기 기준 월지 인덱스(자=0 ... 해=11)와 입춘 기준 년도 반환"""
+        if entry is None and self.calendar:
+            entry = self.calendar.lookup(year, month, day)
+        if not entry:
+            return solar_terms.month_branch_index(year, month, day, hour, minute)
         
-        # 지지 한자 매핑
-        self.earthly_branches_hanja = {
-            '자': '子', '축': '丑', '인': '寅', '묘': '卯', '진': '辰', '사': '巳',
-            '오': '午', '미': '未', '신': '申', '유': '酉', '술': '戌', '해': '亥'
-        }
+        _, branch_index, boundary = entry
+        # 절입일이면 절입 시각 이후부터 다음 달로 넘어감
+        if boundary and solar_terms.moment_minutes(year, month, day, hour, minute) >= solar_terms.month_term(year, month)[1]:
+            branch_index = (branch_index + 1) % 12
+        # 입춘 전(자월/축월)인 1~2월은 전년도
+        saju_year = year - 1 if month <= 2 and branch_index in (0, 1) else year
+        return branch_index, saju_year
+    
+    def get_lunar_month(self, year, month, day, hour=0, minute=0):
+        """절기 기준 월 번호 반환 (인월=1 ... 축월=12)"""
+        branch_index, _ = self.resolve_month(year, month, day, hour, minute)
+        return (branch_index - 2) % 12 + 1
+    
+    def get_season_info(self, year, month, day, hour=0, minute=0):
+        """해당 월의 절입 시각이 지났으면 절기 이름 반환"""
+        return _season_name(year, month, day, hour, minute)
+    
+    def canonical_moment(self, year, month, day, hour, minute=0, solar=None):
+        """결과가 같은 출생 시각을 하나의 키로 정규화 (분은 2시간 단위 시지로, 절입 여부는 월지로 반영)
         
-        # 십성 계산을 위한 오행 관계
-        self.ten_gods = {
-            '비견': '같은 오행, 같은 음양',
-            '겁재': '같은 오행, 다른 음양', 
-            '식신': '생하는 오행, 같은 음양',
-            '상관': '생하는 오행, 다른 음양',
-            '편재': '극하는 오행, 같은 음양',
-            '정재': '극하는 오행, 다른 음양',
-            '편관': '극당하는 오행, 같은 음양',
-            '정관': '극당하는 오행, 다른 음양',
-            '편인': '생당하는 오행, 같은 음양',
-            '정인': '생당하는 오행, 다른 음양'
-        }
+        solar: 진태양시 (년, 월, 일, 시, 분) - 주면 날짜와 시지는 진태양시 기준
+        """
+        month_branch, _ = self.resolve_month(year, month, day, hour, minute)
+        if solar is not None:
+            year, month, day, hour, _ = solar
+        return year, month, day, ((hour + 1) // 2) % 12, month_branch
+    
+    def _day_index(self, year, month, day, entry=None):
+        """일주 60갑자 인덱스 (만세력 테이블, 범위 밖이면 직접 계산)"""
+        if entry is None and self.calendar:
+            entry = self.calendar.lookup(year, month, day)
+        if entry:
+            return entry[0]
+        # 1900년 1월 1일(갑술일)을 기준으로 한 일수 계산
+        days_diff = days_from_civil(year, month, day) - BASE_ORDINAL
+        return (days_diff + BASE_DAY_INDEX) % 60
+    
+    def calculate_pillar_codes(self, year, month, day, hour, minute=0, solar=None):
+        """사주 여덟 글자를 정수 코드로 계산: ((년간, 년지), (월간, 월지), (일간, 일지), (시간, 시지))
         
-        # 십성 계산을 위한 오행 상생/상극 관계
-        self.five_element_relations = {
-            '나무': {'생': '불', '극': '흙', '생당': '물', '극당': '금'},
-            '불': {'생': '흙', '극': '금', '생당': '나무', '극당': '물'},
-            '흙': {'생': '금', '극': '물', '생당': '불', '극당': '나무'},
-            '금': {'생': '물', '극': '나무', '생당': '흙', '극당': '불'},
-            '물': {'생': '나무', '극': '불', '생당': '금', '극당': '흙'}
-        }
+        년월일시는 한국 표준시(절기 비교용), solar는 진태양시 (년, 월, 일, 시, 분)로
+        주면 일주/시주는 진태양시 기준으로 계산한다.
+        """
+        entry = self.calendar.lookup(year, month, day) if self.calendar else None
         
-        # 오행별 성향과 특징
-        self.five_element_traits = {
-            '나무': {
-                'name': '목(木)',
-                'emoji': '🌳',
-                'traits': ['성장', '창의성', '리더십', '도전정신', '활발함'],
-                'description': '성장과 발전을 추구하는 활발한 성격으로, 새로운 도전을 즐기고 창의적인 사고를 합니다. 리더십이 강하고 팀을 이끌어가는 능력이 뛰어납니다.',
-                'strengths': '창의적 사고, 리더십, 도전정신, 성장 지향적',
-                'weaknesses': '성급함, 완벽주의 경향, 타인의 의견을 무시할 수 있음'
-            },
-            '불': {
-                'name': '화(火)',
-                'emoji': '🔥',
-                'traits': ['열정', '추진력', '활동성', '표현력', '에너지'],
-                'description': '강한 열정과 추진력을 가진 활발한 성격으로, 목표를 향해 끊임없이 전진합니다. 표현력이 뛰어나고 주변 사람들에게 에너지를 전달합니다.',
-                'strengths': '강한 추진력, 열정, 빠른 실행력, 에너지 전달',
-                'weaknesses': '성급함, 인내심 부족, 감정적 기복이 클 수 있음'
-            },
-            '흙': {
-                'name': '토(土)',
-                'emoji': '🪨',
-                'traits': ['안정성', '신중함', '책임감', '관리능력', '균형감각'],
-                'description': '안정적이고 신중한 성격으로, 책임감이 강하고 체계적인 관리 능력이 뛰어납니다. 균형감각이 좋아 팀의 조화를 이끌어냅니다.',
-                'strengths': '안정성, 신중함, 책임감, 체계적 관리, 균형감각',
-                'weaknesses': '보수적 성향, 변화에 둔감, 결정이 느릴 수 있음'
-            },
-            '금': {
-                'name': '금(金)',
-                'emoji': '⚙️',
-                'traits': ['논리성', '분석력', '정확성', '체계성', '객관성'],
-                'description': '논리적이고 분석적인 사고를 하는 성격으로, 객관적 데이터를 바탕으로 정확한 판단을 내립니다. 체계적이고 정확한 작업을 선호합니다.',
-                'strengths': '논리적 사고, 분석력, 정확성, 체계성, 객관성',
-                'weaknesses': '감정 표현 부족, 유연성 부족, 완벽주의 경향'
-            },
-            '물': {
-                'name': '수(水)',
-                'emoji': '💧',
-                'traits': ['유연성', '공감능력', '소통능력', '적응력', '직관력'],
-                'description': '유연하고 공감능력이 뛰어난 성격으로, 타인의 감정을 잘 이해하고 소통 능력이 뛰어납니다. 변화에 잘 적응하고 직관력이 강합니다.',
-                'strengths': '공감능력, 소통능력, 유연성, 적응력, 직관력',
-                'weaknesses': '결정력 부족, 우유부단함, 타인의 의견에 쉽게 휩쓸림'
-            }
-        }
+        # 절기 기준 월지와 입춘 기준 년도
+        month_branch, saju_year = self.resolve_month(year, month, day, hour, minute, entry)
         
-        # 만세력 기반 절기 정보 (양력 기준)
-        self.seasons = {
-            1: {'start': 6, 'name': '소한'},      # 1월 6일경
-            2: {'start': 4, 'name': '입춘'},       # 2월 4일경  
-            3: {'start': 6, 'name': '경칩'},      # 3월 6일경
-            4: {'start': 5, 'name': '청명'},      # 4월 5일경
-            5: {'start': 6, 'name': '입하'},      # 5월 6일경
-            6: {'start': 6, 'name': '망종'},      # 6월 6일경
-            7: {'start': 7, 'name': '소서'},      # 7월 7일경
-            8: {'start': 8, 'name': '입추'},     # 8월 8일경
-            9: {'start': 8, 'name': '백로'},      # 9월 8일경
-            10: {'start': 8, 'name': '한로'},     # 10월 8일경
-            11: {'start': 7, 'name': '입동'},     # 11월 7일경
-            12: {'start': 7, 'name': '대설'}      # 12월 7일경
-        }
-    
-    def get_lunar_month(self, year, month, day):
-        """양력을 음력으로 변환하는 간단한 계산"""
-        # 실제로는 복잡한 음력 변환 알고리즘이 필요하지만, 
-        # 여기서는 간단한 근사치를 사용
-        lunar_month_offset = {
-            1: 0, 2: 1, 3: 1, 4: 2, 5: 2, 6: 3,
-            7: 3, 8: 4, 9: 4, 10: 5, 11: 5, 12: 6
-        }
+        # 일주 인덱스 (진태양시 날짜가 다르면 그 날짜로 조회)
+        if solar is not None and solar[:3] != (year, month, day):
+            day_index = self._day_index(*solar[:3])
+        else:
+            day_index = self._day_index(year, month, day, entry)
+        if solar is not None:
+            hour = solar[3]
+        
+        # 년주 계산 (입춘 기준 년도, 1984년이 갑자년 기준)
+        year_stem = (saju_year - 4) % 10
+        year_branch = (saju_year - 4) % 12
+        
+        # 월주 계산 (년간 기준 인월 천간에서 출발: 갑기년 → 병인월)
+        month_stem = (year_stem * 2 + 2 + (month_branch - 2) % 12) % 10
+        
+        # 일간 (10일 주기), 일지 (12일 주기)
+        day_stem = day_index % 10
+        day_branch = day_index % 12
+        
+        # 시주 계산 (2시간 단위)
+        hour_branch = ((hour + 1) // 2) % 12
+        hour_stem = (day_stem * 2 + hour_branch) % 10
         
-        # 간단한 음력 월 계산 (실제로는 더 복잡함)
-        lunar_month = month + lunar_month_offset.get(month, 0)
-        if lunar_month > 12:
-            lunar_month -= 12
-            
-        return lunar_month
+        return (
+            (year_stem, year_branch), (month_stem, month_branch),
+            (day_stem, day_branch), (hour_stem, hour_branch)
+        )
     
-    def get_season_info(self, month, day):
-        """절기 정보 반환"""
-        season_info = self.seasons.get(month, {})
-        if day >= season_info.get('start', 1):
-            return season_info.get('name', '')
-        return ''
+    def pillars_from_codes(self, codes):
+        """정수 코드를 기존 사주 응답 형식(천간/지지/기둥 문자열)으로 변환"""
+        return FourPillars.from_codes(codes).to_dict()
     
-    def calculate_four_pillars(self, year, month, day, hour, minute=0):
-        """만세력 기반 사주 계산 (년주, 월주, 일주, 시주)"""
+    def detailed_pillars_from_codes(self, codes):
+        """정수 코드를 십성/한자가 포함된 상세 사주 응답 형식으로 변환"""
+        return FourPillars.from_codes(codes).to_dict(detailed=True)
+    
+    def calculate_four_pillars(self, year, month, day, hour, minute=0, solar=None):
+        """만세력 기반 사주 계산 (년주, 월주, 일주, 시주) - FourPillars 반환, 실패 시 None"""
         try:
-            from datetime import datetime
-            
-            # 년주 계산 (년도 기준)
-            year_stem_index = (year - 4) % 10  # 1900년이 경자년 기준
-            year_branch_index = (year - 4) % 12
-            year_stem = self.heavenly_stems[year_stem_index]
-            year_branch = self.earthly_branches[year_branch_index]
-            
-            # 월주 계산 (음력 월 기준)
-            lunar_month = self.get_lunar_month(year, month, day)
-            month_stem_index = (year_stem_index * 2 + lunar_month) % 10
-            month_branch_index = (lunar_month + 1) % 12
-            month_stem = self.heavenly_stems[month_stem_index]
-            month_branch = self.earthly_branches[month_branch_index]
-            
-            # 일주 계산 (만세력 기준)
-            # 1900년 1월 1일을 기준으로 한 정확한 일수 계산
-            base_date = datetime(1900, 1, 1)
-            target_date = datetime(year, month, day)
-            days_diff = (target_date - base_date).days
-            
-            # 일간 계산 (10일 주기)
-            day_stem_index = (days_diff + 1) % 10
-            day_stem = self.heavenly_stems[day_stem_index]
-            
-            # 일지 계산 (12일 주기)
-            day_branch_index = (days_diff + 1) % 12
-            day_branch = self.earthly_branches[day_branch_index]
-            
-            # 시주 계산 (시간 기준)
-            hour_branch_index = ((hour + 1) // 2) % 12  # 2시간 단위
-            hour_stem_index = (day_stem_index * 2 + hour_branch_index) % 10
-            hour_stem = self.heavenly_stems[hour_stem_index]
-            hour_branch = self.earthly_branches[hour_branch_index]
-            
-            return {
-                'year': {'stem': year_stem, 'branch': year_branch, 'pillar': year_stem + year_branch},
-                'month': {'stem': month_stem, 'branch': month_branch, 'pillar': month_stem + month_branch},
-                'day': {'stem': day_stem, 'branch': day_branch, 'pillar': day_stem + day_branch},
-                'hour': {'stem': hour_stem, 'branch': hour_branch, 'pillar': hour_stem + hour_branch}
-            }
-            
+            return FourPillars.from_codes(self.calculate_pillar_codes(year, month, day, hour, minute, solar))
         except Exception as e:
             return None
     
-    def calculate_saju(self, year, month, day, hour, minute=0):
-        """만세력 기반 사주 정보를 계산"""
-        try:
-            # 만세력 기반 사주 계산
-            four_pillars = self.calculate_four_pillars(year, month, day, hour, minute)
-            
-            if not four_pillars:
-                return None
-            
-            # 일주 정보 추출
-            day_stem = four_pillars['day']['stem']
-            day_branch = four_pillars['day']['branch']
-            day_pillar = four_pillars['day']['pillar']
-            
-            # 오행 계산 (일간 기준)
-            five_element = self.five_elements[day_stem]
-            
-            # 절기 정보
-            season = self.get_season_info(month, day)
-            
-            return {
-                'five_element': five_element,
-                'day_stem': day_stem,
-                'day_branch': day_branch,
-                'day_pillar': day_pillar,
-                'four_pillars': four_pillars,
-                'season': season,
-                'lunar_month': self.get_lunar_month(year, month, day)
-            }
-            
-        except Exception as e:
+    def calculate_saju(self, year, month, day, hour, minute=0, solar=None):
+        """만세력 기반 사주 정보를 계산 - SajuResult 반환 (기존 딕셔너리 형식은 to_dict()), 실패 시 None"""
+        four_pillars = self.calculate_four_pillars(year, month, day, hour, minute, solar)
+        if four_pillars is None:
             return None
+        return SajuResult(four_pillars, (year, month, day, hour, minute))
     
-    def get_five_element(self, year, month, day, hour, minute=0):
+    def calculate_saju_batch(self, birth_dates, birth_times, element_profile=False):
+        """여러 명의 생년월일시(YYYY-MM-DD, HH:MM)를 열(column) 단위 정수 연산으로 한 번에 계산
+
+        element_profile이면 행마다 오행 세력 분포(ElementProfile.to_dict())를 'element_profile'로 추가한다.
+        """
+        if len(birth_dates) != len(birth_times):
+            raise ValueError("birth_dates와 birth_times의 길이가 다릅니다.")
+        
+        # 1단계: 입력 파싱 (실패한 행은 None)
+        moments = [_parse_birth_moment(d, t) for d, t in zip(birth_dates, birth_times)]
+        valid = [i for i, moment in enumerate(moments) if moment is not None]
+        # 표준시 변천/서머타임 보정 (출생지 없는 /saju/detailed와 같은 규칙)
+        # 절기/월지는 한국 표준시, 일주/시주는 서머타임을 뺀 현지 표준시 기준
+        resolved = [resolve_birth_time(*moments[i]) for i in valid]
+        moments = [standard for standard, _ in resolved]
+        solars = [solar for _, solar in resolved]
+        
+        # 2단계: 만세력 테이블 조회 → 일주 60갑자 인덱스 열, 월지/년도 열
+        entries = [self.calendar.lookup(y, m, d) if self.calendar else None for y, m, d, _, _ in moments]
+        day_index = [
+            self._day_index(*solar[:3], entry if solar[:3] == moment[:3] else None)
+            for entry, moment, solar in zip(entries, moments, solars)
+        ]
+        months = [
+            self.resolve_month(y, m, d, h, mi, entry)
+            for entry, (y, m, d, h, mi) in zip(entries, moments)
+        ]
+        
+        # 3단계: 천간/지지 인덱스 열 (정수 연산)
+        year_stem = [(saju_year - 4) % 10 for _, saju_year in months]
+        year_branch = [(saju_year - 4) % 12 for _, saju_year in months]
+        month_branch = [branch for branch, _ in months]
+        month_stem = [(ys * 2 + 2 + (mb - 2) % 12) % 10 for ys, mb in zip(year_stem, month_branch)]
+        day_stem = [i % 10 for i in day_index]
+        day_branch = [i % 12 for i in day_index]
+        hour_branch = [((h + 1) // 2) % 12 for _, _, _, h, _ in solars]
+        hour_stem = [(ds * 2 + hb) % 10 for ds, hb in zip(day_stem, hour_branch)]
+        
+        stems = {'year': year_stem, 'month': month_stem, 'day': day_stem, 'hour': hour_stem}
+        branches = {'year': year_branch, 'month': month_branch, 'day': day_branch, 'hour': hour_branch}
+        
+        # 4단계: 기둥/십성/오행 열 (정수 코드 표 조회 후 이름 변환)
+        pillars = {
+            name: [SEXAGENARY_CYCLE[sexagenary_index(s, b)] for s, b in zip(stems[name], branches[name])]
+            for name in stems
+        }
+        ten_gods = {
+            name: [TEN_GODS[STEM_TEN_GODS[ds][s]] for ds, s in zip(day_stem, stems[name])]
+            for name in stems
+        }
+        branch_ten_gods = {
+            name: [TEN_GODS[BRANCH_TEN_GODS[ds][b]] for ds, b in zip(day_stem, branches[name])]
+            for name in branches
+        }
+        elements = [FIVE_ELEMENTS[STEM_ELEMENTS[ds]] for ds in day_stem]
+        if element_profile:
+            profiles = []
+            for row, mb in enumerate(month_branch):
+                table = ELEMENT_VECTORS[mb]
+                vector = sum(table[sexagenary_index(stems[name][row], branches[name][row])] for name in stems)
+                profiles.append(ElementProfile.from_vector(BRANCH_ELEMENTS[mb], vector).to_dict())
+        
+        # 5단계: 행 단위 결과 조립
+        results = [None] * len(birth_dates)
+        for row, i in enumerate(valid):
+            results[i] = {
+                'five_element': elements[row],
+                'day_pillar': pillars['day'][row],
+                'four_pillars': {name: pillars[name][row] for name in pillars},
+                'ten_gods': {name: ten_gods[name][row] for name in ten_gods},
+                'branch_ten_gods': {name: branch_ten_gods[name][row] for name in branch_ten_gods}
+            }
+            if element_profile:
+                results[i]['element_profile'] = profiles[row]
+        return results
+    
+    def get_five_element(self, year, month, day, hour, minute=0, solar=None):
         """생년월일시분을 입력받아 해당하는 오행을 반환 (기존 호환성 유지)"""
-        result = self.calculate_saju(year, month, day, hour, minute)
+        result = self.calculate_saju(year, month, day, hour, minute, solar)
         if result:
-            return result['five_element']
+            return result.five_element
         return None
     
     def get_five_element_traits(self, five_element):
@@ -232,89 +647,11 @@ class SajuCalculator:
     
     def calculate_ten_god(self, day_stem, target_stem):
         """일간을 기준으로 타겟 천간의 십성 계산"""
-        day_element = self.five_elements[day_stem]
-        target_element = self.five_elements[target_stem]
-        
-        # 음양 판단 (갑, 병, 무, 경, 임은 양, 나머지는 음)
-        day_yin_yang = '양' if day_stem in ['갑', '병', '무', '경', '임'] else '음'
-        target_yin_yang = '양' if target_stem in ['갑', '병', '무', '경', '임'] else '음'
-        
-        # 같은 오행인 경우
-        if day_element == target_element:
-            if day_yin_yang == target_yin_yang:
-                return '비견'
-            else:
-                return '겁재'
-        
-        # 오행 관계에 따른 십성 계산
-        relations = self.five_element_relations[day_element]
-        
-        if target_element == relations['생']:
-            if day_yin_yang == target_yin_yang:
-                return '식신'
-            else:
-                return '상관'
-        elif target_element == relations['극']:
-            if day_yin_yang == target_yin_yang:
-                return '편재'
-            else:
-                return '정재'
-        elif target_element == relations['극당']:
-            if day_yin_yang == target_yin_yang:
-                return '편관'
-            else:
-                return '정관'
-        elif target_element == relations['생당']:
-            if day_yin_yang == target_yin_yang:
-                return '편인'
-            else:
-                return '정인'
-        
-        return '알수없음'
+        return TEN_GODS[STEM_TEN_GODS[STEM_CODES[day_stem]][STEM_CODES[target_stem]]]
     
     def calculate_branch_ten_god(self, day_stem, target_branch):
         """일간을 기준으로 타겟 지지의 십성 계산"""
-        day_element = self.five_elements[day_stem]
-        target_element = self.earthly_five_elements[target_branch]
-        
-        # 음양 판단 (갑, 병, 무, 경, 임은 양, 나머지는 음)
-        day_yin_yang = '양' if day_stem in ['갑', '병', '무', '경', '임'] else '음'
-        
-        # 지지의 음양 판단 (자, 인, 진, 오, 신, 술은 양, 나머지는 음)
-        branch_yin_yang = '양' if target_branch in ['자', '인', '진', '오', '신', '술'] else '음'
-        
-        # 같은 오행인 경우
-        if day_element == target_element:
-            if day_yin_yang == branch_yin_yang:
-                return '비견'
-            else:
-                return '겁재'
-        
-        # 오행 관계에 따른 십성 계산
-        relations = self.five_element_relations[day_element]
-        
-        if target_element == relations['생']:
-            if day_yin_yang == branch_yin_yang:
-                return '식신'
-            else:
-                return '상관'
-        elif target_element == relations['극']:
-            if day_yin_yang == branch_yin_yang:
-                return '편재'
-            else:
-                return '정재'
-        elif target_element == relations['극당']:
-            if day_yin_yang == branch_yin_yang:
-                return '편관'
-            else:
-                return '정관'
-        elif target_element == relations['생당']:
-            if day_yin_yang == branch_yin_yang:
-                return '편인'
-            else:
-                return '정인'
-        
-        return '알수없음'
+        return TEN_GODS[BRANCH_TEN_GODS[STEM_CODES[day_stem]][BRANCH_CODES[target_branch]]]
     
 
 # 사용 예시
\ No newline at end of file
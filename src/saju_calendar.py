@@ -0,0 +1,156 @@
+# 만세력 달력 테이블
+# 1900~2100년 일자별 일주(60갑자) 인덱스, 절기 기준 월지, 절입일 플래그와 연도별 24절기 시각을
+# 미리 계산해 둔 바이너리 파일(data/saju_calendar.bin)을 mmap으로 읽어 O(1)로 조회한다.
+# 파일 기반 읽기 전용 mmap이므로 여러 워커 프로세스가 같은 물리 메모리 페이지를 공유한다.
+
+import mmap
+import os
+import struct
+
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data'))
+CALENDAR_PATH = os.path.join(DATA_DIR, 'saju_calendar.bin')
+
+START_YEAR = 1900
+END_YEAR = 2100
+
+# 헤더: 매직, 버전, 시작년도, 종료년도, 일수
+MAGIC = b'SJCL'
+VERSION = 4
+HEADER = struct.Struct('<4sHHHI')
+
+# 일자 레코드 (2바이트): [0] 60갑자 인덱스, [1] 하위 4비트 0시 기준 월지 인덱스 + 최상위 비트 절입일
+RECORD_SIZE = 2
+MONTH_MASK = 0x0F
+BOUNDARY_FLAG = 0x80
+
+# 절기 레코드 (연도별 192바이트): 소한~동지 24절기 시각 (한국 표준시 분 단위 서수)
+TERMS_RECORD = struct.Struct('<24q')
+
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def is_leap_year(year):
+    """윤년 여부"""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year, month):
+    """해당 월의 일수"""
+    if month == 2 and is_leap_year(year):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+def days_from_civil(year, month, day):
+    """양력 날짜를 서수(0001-01-01 = 1)로 변환 (date.toordinal과 동일, 객체 생성 없음)"""
+    if not 1 <= month <= 12 or not 1 <= day <= days_in_month(year, month):
+        raise ValueError(f"잘못된 날짜입니다: {year}-{month}-{day}")
+    y = year - 1
+    days = y * 365 + y // 4 - y // 100 + y // 400 + _DAYS_BEFORE_MONTH[month] + day
+    if month > 2 and is_leap_year(year):
+        days += 1
+    return days
+
+
+# 일주 계산 기준일 (1900년 1월 1일)과 그날의 60갑자 인덱스
+# 1900-01-01은 갑술일 (율리우스 적일 JDN 2415021, 일진 인덱스 = (JDN + 49) % 60 = 10)
+BASE_ORDINAL = days_from_civil(1900, 1, 1)
+BASE_DAY_INDEX = 10
+
+
+class SajuCalendar:
+    """mmap 기반 만세력 일자 테이블"""
+
+    def __init__(self, path=CALENDAR_PATH):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, start_year, end_year, day_count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"만세력 테이블 형식이 올바르지 않습니다: {path}")
+
+        self.start_year = start_year
+        self.end_year = end_year
+        self.day_count = day_count
+        self._start_ordinal = days_from_civil(start_year, 1, 1)
+        records_end = HEADER.size + day_count * RECORD_SIZE
+        self._records = memoryview(self._mmap)[HEADER.size:records_end]
+        self._terms_offset = records_end
+
+    def lookup(self, year, month, day):
+        """(60갑자 인덱스, 0시 기준 월지 인덱스, 절입일 여부) 반환, 테이블 범위 밖이면 None"""
+        offset = days_from_civil(year, month, day) - self._start_ordinal
+        if not 0 <= offset < self.day_count:
+            return None
+        pos = offset * RECORD_SIZE
+        flags = self._records[pos + 1]
+        return self._records[pos], flags & MONTH_MASK, bool(flags & BOUNDARY_FLAG)
+
+    def warm(self):
+        """파일 전체를 페이지 단위로 한 번씩 읽어 메모리에 올림 (첫 조회의 페이지 폴트 제거), 크기(바이트) 반환"""
+        if hasattr(mmap, 'MADV_WILLNEED'):
+            self._mmap.madvise(mmap.MADV_WILLNEED)
+        sum(self._mmap[::mmap.PAGESIZE])
+        return len(self._mmap)
+
+    def solar_terms(self, year):
+        """해당 연도 24절기 시각 튜플, 테이블 범위 밖이면 None"""
+        if not self.start_year <= year <= self.end_year:
+            return None
+        offset = self._terms_offset + (year - self.start_year) * TERMS_RECORD.size
+        return TERMS_RECORD.unpack_from(self._mmap, offset)
+
+
+_shared_calendars = {}
+
+
+def open_shared_calendar(path=CALENDAR_PATH):
+    """경로별로 한 번만 연 SajuCalendar 반환 (프로세스 안의 모든 계산기가 같은 mmap 사용)"""
+    calendar = _shared_calendars.get(path)
+    if calendar is None:
+        calendar = _shared_calendars[path] = SajuCalendar(path)
+    return calendar
+
+
+def build_calendar(path=CALENDAR_PATH, start_year=START_YEAR, end_year=END_YEAR):
+    """절기 엔진으로 일자/절기 테이블을 생성해 바이너리 파일로 저장"""
+    from solar_terms import compute_solar_terms, month_branch_index, month_term
+
+    start_ordinal = days_from_civil(start_year, 1, 1)
+    day_count = days_from_civil(end_year, 12, 31) - start_ordinal + 1
+    records = bytearray(day_count * RECORD_SIZE)
+
+    pos = 0
+    for year in range(start_year, end_year + 1):
+        for month in range(1, 13):
+            # 절입 시각이 속한 날 (정각 0시 절입은 그날 0시 월지에 이미 반영됨)
+            term_days, term_minute = divmod(month_term(year, month)[1], 1440)
+            for day in range(1, days_in_month(year, month) + 1):
+                ordinal = days_from_civil(year, month, day)
+                branch_index, _ = month_branch_index(year, month, day)
+                boundary = ordinal == term_days and term_minute > 0
+                records[pos] = (ordinal - BASE_ORDINAL + BASE_DAY_INDEX) % 60
+                records[pos + 1] = branch_index | (BOUNDARY_FLAG if boundary else 0)
+                pos += RECORD_SIZE
+
+    terms = b''.join(
+        TERMS_RECORD.pack(*compute_solar_terms(year)) for year in range(start_year, end_year + 1)
+    )
+
+    # 실행 중인 워커가 mmap한 파일을 덮어쓰지 않도록 새 파일로 교체
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, start_year, end_year, day_count))
+        f.write(records)
+        f.write(terms)
+    os.replace(tmp_path, path)
+    return day_count
+
+
+if __name__ == "__main__":
+    # 테이블 재생성: python src/saju_calendar.py
+    count = build_calendar()
+    print(f"만세력 테이블 생성 완료: {count}일 ({START_YEAR}~{END_YEAR}) → {CALENDAR_PATH}")
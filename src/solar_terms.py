@@ -0,0 +1,236 @@
+# 24절기 계산 엔진
+# 태양의 겉보기 황경(VSOP87 축약항 + 장동 + 광행차)을 뉴턴법으로 풀어
+# 절기 시각을 분 단위(한국 표준시)로 구한다. 연도별 결과는 LRU 캐시에 보관한다.
+# 만세력 테이블(load_table)이 연결되면 범위 안 연도는 계산 없이 테이블 값을 쓴다.
+
+import math
+from datetime import date
+from functools import lru_cache
+
+from saju_calendar import days_from_civil
+
+# 소한부터 동지까지 양력 순서 (황경 285도부터 15도 간격)
+SOLAR_TERM_NAMES = (
+    '소한', '대한', '입춘', '우수', '경칩', '춘분', '청명', '곡우',
+    '입하', '소만', '망종', '하지', '소서', '대서', '입추', '처서',
+    '백로', '추분', '한로', '상강', '입동', '소설', '대설', '동지'
+)
+
+# 월을 여는 절(節) 12개의 인덱스 (SOLAR_TERM_NAMES 기준 짝수 번째)
+MONTH_TERM_INDEXES = tuple(range(0, 24, 2))
+
+# 한국 표준시 (UTC+9)
+KST_OFFSET_MINUTES = 9 * 60
+
+# 계산 가능한 연도 범위 (delta_t 근사식 적용 범위, 밖에서는 절기 시각 오차가 커짐)
+MIN_YEAR = 1860
+MAX_YEAR = 2150
+
+# 지구 일심 황경 VSOP87 축약항 (Meeus, Astronomical Algorithms 32.A) - (A, B, C), 단위 1e-8 rad
+_L0 = (
+    (175347046, 0, 0), (3341656, 4.6692568, 6283.07585), (34894, 4.6261, 12566.1517),
+    (3497, 2.7441, 5753.3849), (3418, 2.8289, 3.5231), (3136, 3.6277, 77713.7715),
+    (2676, 4.4181, 7860.4194), (2343, 6.1352, 3930.2097), (1324, 0.7425, 11506.7698),
+    (1273, 2.0371, 529.691), (1199, 1.1096, 1577.3435), (990, 5.233, 5884.927),
+    (902, 2.045, 26.298), (857, 3.508, 398.149), (780, 1.179, 5223.694),
+    (753, 2.533, 5507.553), (505, 4.583, 18849.228), (492, 4.205, 775.523),
+    (357, 2.92, 0.067), (317, 5.849, 11790.629), (284, 1.899, 796.298),
+    (271, 0.315, 10977.079), (243, 0.345, 5486.778), (206, 4.806, 2544.314),
+    (205, 1.869, 5573.143), (202, 2.458, 6069.777), (156, 0.833, 213.299),
+    (132, 3.411, 2942.463), (126, 1.083, 20.775), (115, 0.645, 0.98),
+    (103, 0.636, 4694.003), (102, 0.976, 15720.839), (102, 4.267, 7.114),
+    (99, 6.21, 2146.17), (98, 0.68, 155.42), (86, 5.98, 161000.69),
+    (85, 1.3, 6275.96), (85, 3.67, 71430.7), (80, 1.81, 17260.15),
+    (79, 3.04, 12036.46), (75, 1.76, 5088.63), (74, 3.5, 3154.69),
+    (74, 4.68, 801.82), (70, 0.83, 9437.76), (62, 3.98, 8827.39),
+    (61, 1.82, 7084.9), (57, 2.78, 6286.6), (56, 4.39, 14143.5),
+    (56, 3.47, 6279.55), (52, 0.19, 12139.55), (52, 1.33, 1748.02),
+    (51, 0.28, 5856.48), (49, 0.49, 1194.45), (41, 5.37, 8429.24),
+    (41, 2.4, 19651.05), (39, 6.17, 10447.39), (37, 6.04, 10213.29),
+    (37, 2.57, 1059.38), (36, 1.71, 2352.87), (36, 1.78, 6812.77),
+    (33, 0.59, 17789.85), (30, 0.44, 83996.85), (30, 2.74, 1349.87),
+    (25, 3.16, 4690.48)
+)
+_L1 = (
+    (628331966747, 0, 0), (206059, 2.678235, 6283.07585), (4303, 2.6351, 12566.1517),
+    (425, 1.59, 3.523), (119, 5.796, 26.298), (109, 2.966, 1577.344),
+    (93, 2.59, 18849.23), (72, 1.14, 529.69), (68, 1.87, 398.15),
+    (67, 4.41, 5507.55), (59, 2.89, 5223.69), (56, 2.17, 155.42),
+    (45, 0.4, 796.3), (36, 0.47, 775.52), (29, 2.65, 7.11),
+    (21, 5.34, 0.98), (19, 1.85, 5486.78), (19, 4.97, 213.3),
+    (17, 2.99, 6275.96), (16, 0.03, 2544.31), (16, 1.43, 2146.17),
+    (15, 1.21, 10977.08), (12, 2.83, 1748.02), (12, 3.26, 5088.63),
+    (12, 5.27, 1194.45), (12, 2.08, 4694.0), (11, 0.77, 553.57),
+    (10, 1.3, 6286.6), (10, 4.24, 1349.87), (9, 2.7, 242.73),
+    (9, 5.64, 951.72), (8, 5.3, 2352.87), (6, 2.65, 9437.76),
+    (6, 4.67, 4690.48)
+)
+_L2 = (
+    (52919, 0, 0), (8720, 1.0721, 6283.0758), (309, 0.867, 12566.152),
+    (27, 0.05, 3.52), (16, 5.19, 26.3), (16, 3.68, 155.42),
+    (10, 0.76, 18849.23), (9, 2.06, 77713.77), (7, 0.83, 775.52),
+    (5, 4.66, 1577.34), (4, 1.03, 7.11), (4, 3.44, 5573.14),
+    (3, 5.14, 796.3), (3, 6.05, 5507.55), (3, 1.19, 242.73),
+    (3, 6.12, 529.69), (3, 0.31, 398.15), (3, 2.28, 553.57),
+    (2, 4.38, 5223.69), (2, 3.75, 0.98)
+)
+_L3 = (
+    (289, 5.844, 6283.076), (35, 0, 0), (17, 5.49, 12566.15),
+    (3, 5.2, 155.42), (1, 4.72, 3.52), (1, 5.3, 18849.23),
+    (1, 5.97, 242.73)
+)
+_L4 = ((114, 3.142, 0), (8, 4.13, 6283.08), (1, 3.84, 12566.15))
+_L5 = ((1, 3.14, 0),)
+_L_SERIES = (_L0, _L1, _L2, _L3, _L4, _L5)
+
+# 지구 동경 벡터 주요항 (광행차 계산용)
+_R0 = ((100013989, 0, 0), (1670700, 3.0984635, 6283.07585), (13956, 3.05525, 12566.1517))
+_R1 = ((103019, 1.10749, 6283.07585),)
+
+_J2000 = 2451545.0
+_MEAN_TROPICAL_YEAR = 365.242189
+
+
+def julian_day(year, month, day, hour=0, minute=0):
+    """양력 날짜/시각(UT)을 율리우스일로 변환"""
+    return days_from_civil(year, month, day) + 1721424.5 + (hour * 60 + minute) / 1440
+
+
+def delta_t(year):
+    """지구시(TT)와 세계시(UT)의 차이(초) - Espenak & Meeus 다항식 근사"""
+    if year < 1900:
+        t = year - 1860
+        return 7.62 + 0.5737 * t - 0.251754 * t ** 2 + 0.01680668 * t ** 3 - 0.0004473624 * t ** 4 + t ** 5 / 233174
+    if year < 1920:
+        t = year - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t ** 2 + 0.0061966 * t ** 3 - 0.000197 * t ** 4
+    if year < 1941:
+        t = year - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t ** 2 + 0.0020936 * t ** 3
+    if year < 1961:
+        t = year - 1950
+        return 29.07 + 0.407 * t - t ** 2 / 233 + t ** 3 / 2547
+    if year < 1986:
+        t = year - 1975
+        return 45.45 + 1.067 * t - t ** 2 / 260 - t ** 3 / 718
+    if year < 2005:
+        t = year - 2000
+        return (63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3
+                + 0.000651814 * t ** 4 + 0.00002373599 * t ** 5)
+    if year < 2050:
+        t = year - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t ** 2
+    return -20 + 32 * ((year - 1820) / 100) ** 2 - 0.5628 * (2150 - year)
+
+
+def _series(terms, tau):
+    return sum(a * math.cos(b + c * tau) for a, b, c in terms)
+
+
+def sun_apparent_longitude(jde):
+    """지구시(TT) 율리우스일에서 태양의 겉보기 황경(도)"""
+    tau = (jde - _J2000) / 365250
+    earth_l = 0.0
+    for power, terms in enumerate(_L_SERIES):
+        earth_l += _series(terms, tau) * tau ** power
+    earth_l /= 1e8
+    radius = (_series(_R0, tau) + _series(_R1, tau) * tau) / 1e8
+
+    # 지심 황경 + FK5 보정
+    longitude = math.degrees(earth_l) + 180 - 0.09033 / 3600
+
+    # 장동 (황경 방향 주요항)
+    t = tau * 10
+    omega = math.radians(125.04452 - 1934.136261 * t)
+    sun_mean = math.radians(280.4665 + 36000.7698 * t)
+    moon_mean = math.radians(218.3165 + 481267.8813 * t)
+    nutation = (-17.20 * math.sin(omega) - 1.32 * math.sin(2 * sun_mean)
+                - 0.23 * math.sin(2 * moon_mean) + 0.21 * math.sin(2 * omega))
+
+    # 광행차
+    aberration = -20.4898 / radius
+
+    return (longitude + (nutation + aberration) / 3600) % 360
+
+
+def solar_term_jd(year, term_index):
+    """해당 연도 절기(SOLAR_TERM_NAMES 인덱스)의 시각을 율리우스일(UT)로 반환"""
+    target = (285 + 15 * term_index) % 360
+    # 소한(1월 6일경)부터 평균 15.22일 간격으로 초기값 설정 후 뉴턴법
+    jde = julian_day(year, 1, 6) + term_index * _MEAN_TROPICAL_YEAR / 24
+    for _ in range(10):
+        diff = (target - sun_apparent_longitude(jde) + 180) % 360 - 180
+        jde += diff * _MEAN_TROPICAL_YEAR / 360
+        if abs(diff) < 1e-6:
+            break
+    return jde - delta_t(year) / 86400
+
+
+def jd_to_kst_minutes(jd):
+    """율리우스일(UT)을 한국 표준시 기준 분 단위 서수(서수일 * 1440 + 분)로 변환"""
+    return int(math.floor((jd - 1721424.5) * 1440 + 0.5)) + KST_OFFSET_MINUTES
+
+
+def moment_minutes(year, month, day, hour=0, minute=0):
+    """한국 표준시 날짜/시각을 분 단위 서수로 변환 (절기 시각과 비교용)"""
+    return days_from_civil(year, month, day) * 1440 + hour * 60 + minute
+
+
+# 미리 계산된 절기 테이블 (saju_calendar.SajuCalendar, 없으면 직접 계산)
+_table = None
+
+
+def load_table(calendar):
+    """절기 조회에 쓸 만세력 테이블 연결 (None이면 연결 해제)"""
+    global _table
+    _table = calendar
+    solar_terms.cache_clear()
+
+
+def compute_solar_terms(year):
+    """해당 연도 24절기 시각(한국 표준시 분 단위 서수) 튜플을 천문 계산으로 구함"""
+    return tuple(jd_to_kst_minutes(solar_term_jd(year, index)) for index in range(24))
+
+
+@lru_cache(maxsize=512)
+def solar_terms(year):
+    """해당 연도 24절기 시각 튜플 - 연도별 1회만 조회/계산"""
+    if _table is not None:
+        terms = _table.solar_terms(year)
+        if terms is not None:
+            return terms
+    return compute_solar_terms(year)
+
+
+def minutes_to_datetime_tuple(minutes):
+    """분 단위 서수를 (년, 월, 일, 시, 분) 튜플로 변환"""
+    days, minute_of_day = divmod(minutes, 1440)
+    d = date.fromordinal(days)
+    return d.year, d.month, d.day, minute_of_day // 60, minute_of_day % 60
+
+
+def month_branch_index(year, month, day, hour=0, minute=0):
+    """절기 기준 월지 인덱스(자=0 ... 해=11)와 입춘 기준 년도를 반환"""
+    moment = moment_minutes(year, month, day, hour, minute)
+    terms = solar_terms(year)
+
+    # 이번 해 소한 이전이면 전년도 대설(자월)
+    if moment < terms[0]:
+        return 0, year - 1
+
+    # 가장 마지막으로 지난 절(節) 찾기
+    term_order = 0
+    for order, term_index in enumerate(MONTH_TERM_INDEXES):
+        if moment >= terms[term_index]:
+            term_order = order
+        else:
+            break
+    branch = (term_order + 1) % 12
+    saju_year = year if moment >= terms[2] else year - 1
+    return branch, saju_year
+
+
+def month_term(year, month):
+    """해당 양력 월에 드는 절(節)의 (이름, 시각 분 단위 서수) 반환"""
+    term_index = MONTH_TERM_INDEXES[month - 1]
+    return SOLAR_TERM_NAMES[term_index], solar_terms(year)[term_index]
@@ -0,0 +1,120 @@
+# 진태양시 변환
+# 출생 당시 현지 시계 시각을 (1) 절기 비교용 한국 표준시(UTC+9)와 (2) 시주/일주 계산용 진태양시로 바꾼다.
+# - 한국 표준시 변천 (1908 UTC+8:30, 1912 UTC+9, 1954 UTC+8:30, 1961 UTC+9)과 서머타임 (1948~1960, 1987~1988)
+# - 진태양시 = UTC + 경도 × 4분 + 균시차
+# 내부 계산은 분 단위 서수 (서수일 * 1440 + 분, solar_terms.moment_minutes와 같은 기준)로 한다.
+
+import math
+from bisect import bisect_right
+from datetime import date
+
+from saju_calendar import is_leap_year
+from solar_terms import KST_OFFSET_MINUTES, minutes_to_datetime_tuple, moment_minutes
+
+
+# 현지 시각 구간: (구간 시작 UTC 시각, UTC 오프셋(분), 서머타임 여부) - IANA tz 데이터베이스 Asia/Seoul 기준
+# 1908년 4월 1일 0시(현지) 이전은 지방평균시(LMT)로 본다.
+KOREA_TIME_PERIODS = tuple(
+    (moment_minutes(*start), offset, dst)
+    for start, offset, dst in (
+        ((1908, 3, 31, 15, 30), 510, False),
+        ((1911, 12, 31, 15, 30), 540, False),
+        ((1948, 5, 31, 15, 0), 600, True),
+        ((1948, 9, 12, 14, 0), 540, False),
+        ((1949, 4, 2, 15, 0), 600, True),
+        ((1949, 9, 10, 14, 0), 540, False),
+        ((1950, 3, 31, 15, 0), 600, True),
+        ((1950, 9, 9, 14, 0), 540, False),
+        ((1951, 5, 5, 15, 0), 600, True),
+        ((1951, 9, 8, 14, 0), 540, False),
+        ((1954, 3, 20, 15, 0), 510, False),
+        ((1955, 5, 4, 15, 30), 570, True),
+        ((1955, 9, 8, 14, 30), 510, False),
+        ((1956, 5, 19, 15, 30), 570, True),
+        ((1956, 9, 29, 14, 30), 510, False),
+        ((1957, 5, 4, 15, 30), 570, True),
+        ((1957, 9, 21, 14, 30), 510, False),
+        ((1958, 5, 3, 15, 30), 570, True),
+        ((1958, 9, 20, 14, 30), 510, False),
+        ((1959, 5, 2, 15, 30), 570, True),
+        ((1959, 9, 19, 14, 30), 510, False),
+        ((1960, 4, 30, 15, 30), 570, True),
+        ((1960, 9, 17, 14, 30), 510, False),
+        ((1961, 8, 9, 15, 30), 540, False),
+        ((1987, 5, 9, 17, 0), 600, True),
+        ((1987, 10, 10, 17, 0), 540, False),
+        ((1988, 5, 7, 17, 0), 600, True),
+        ((1988, 10, 8, 17, 0), 540, False)
+    )
+)
+
+# 구간별 현지 시계 기준 시작/끝 (끝은 다음 구간 시작 UTC 시각 + 이 구간 오프셋)
+_LOCAL_TIME_START = KOREA_TIME_PERIODS[0][0] + KOREA_TIME_PERIODS[0][1]
+_LOCAL_PERIOD_ENDS = tuple(
+    next_start + offset
+    for (_, offset, _), (next_start, _, _) in zip(KOREA_TIME_PERIODS, KOREA_TIME_PERIODS[1:])
+)
+
+
+def utc_offset(local_moment):
+    """현지 시계 시각의 (UTC 오프셋(분), 서머타임 여부), 표준시 도입 전이면 None
+
+    서머타임 종료로 같은 시각이 두 번 있으면 앞(서머타임) 쪽, 오프셋 변경으로 건너뛴 시각은 바뀐 뒤 오프셋으로 본다.
+    """
+    if local_moment < _LOCAL_TIME_START:
+        return None
+    _, offset, dst = KOREA_TIME_PERIODS[bisect_right(_LOCAL_PERIOD_ENDS, local_moment)]
+    return offset, dst
+
+
+def _equation_of_time_table(year_days):
+    """하루 0시(UTC)마다의 균시차(분) 표 (NOAA 근사식, 오차 약 30초) - 다음 해 1월 1일 값까지 year_days + 1개"""
+    table = []
+    for day_of_year in range(year_days + 1):
+        gamma = 2 * math.pi / year_days * (day_of_year - 0.5)
+        table.append(229.18 * (
+            0.000075 + 0.001868 * math.cos(gamma) - 0.032077 * math.sin(gamma)
+            - 0.014615 * math.cos(2 * gamma) - 0.040849 * math.sin(2 * gamma)
+        ))
+    return tuple(table)
+
+
+# 평년/윤년 균시차 표 (요청마다 삼각함수를 계산하지 않도록 미리 계산)
+_EQUATION_OF_TIME = (_equation_of_time_table(365), _equation_of_time_table(366))
+
+
+def equation_of_time(utc_moment):
+    """균시차(분): 진태양시 - 평균태양시 (하루 단위 표를 선형 보간)"""
+    days, minute_of_day = divmod(utc_moment, 1440)
+    year = date.fromordinal(days).year
+    day_of_year = days - date(year, 1, 1).toordinal()
+    table = _EQUATION_OF_TIME[is_leap_year(year)]
+    start = table[day_of_year]
+    return start + (table[day_of_year + 1] - start) * minute_of_day / 1440
+
+
+def resolve_birth_time(year, month, day, hour, minute, longitude=None):
+    """현지 시계 시각 → (한국 표준시(UTC+9) 시각, 진태양시 시각), 각각 (년, 월, 일, 시, 분)
+
+    longitude(동경, 도)가 없으면 진태양시 대신 서머타임만 뺀 현지 표준시를 돌려준다.
+    표준시 도입 전(1908년 4월 이전) 시각은 출생지 지방평균시로 본다.
+    """
+    clock = (year, month, day, hour, minute)
+    local = moment_minutes(year, month, day, hour, minute)
+    zone = utc_offset(local)
+    if zone is None:
+        if longitude is None:
+            return clock, clock
+        utc = local - round(longitude * 4)
+        return (
+            minutes_to_datetime_tuple(utc + KST_OFFSET_MINUTES),
+            minutes_to_datetime_tuple(local + round(equation_of_time(utc)))
+        )
+
+    offset, dst = zone
+    utc = local - offset
+    # 현재와 같은 UTC+9 구간이면 시계 시각이 곧 한국 표준시
+    standard = clock if offset == KST_OFFSET_MINUTES else minutes_to_datetime_tuple(utc + KST_OFFSET_MINUTES)
+    if longitude is None:
+        return standard, minutes_to_datetime_tuple(local - 60) if dst else clock
+    return standard, minutes_to_datetime_tuple(utc + round(longitude * 4 + equation_of_time(utc)))
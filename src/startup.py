@@ -0,0 +1,128 @@
+# 기동 단계 측정과 준비 상태(readiness)
+# - StartupProfile: 모듈 로드/앱 생성 단계별 시간(ms)을 기록해 /ready 응답에 싣는다
+# - Lazy: 선택 기능(LLM 클라이언트, 차트 저장소, 프로세스 풀 등)을 처음 사용할 때 만든다
+# - Warmup: 미리 계산된 표(만세력 mmap, 출생지 색인, 계산 경로)를 데우고, 모두 끝나면 준비 완료로 표시한다
+#   gunicorn preload면 마스터가 fork 전에 공유 작업을 한 번 실행(gunicorn.conf.py when_ready), 단독 실행이면 기동 후 백그라운드 스레드에서 실행
+#   per_process 작업(스레드/연결을 만드는 작업)은 fork된 프로세스마다 다시 실행한다
+# 오토스케일링 환경에서는 /ready가 200이 된 인스턴스로만 트래픽을 보내면 첫 요청이 표를 데우는 비용을 떠안지 않는다.
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """기동 단계별 소요 시간 (started부터 누적 측정)"""
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - start) * 1000, 3)
+
+    def mark(self, name):
+        """started부터 지금까지의 시간을 name으로 기록"""
+        self.phases[name] = round((time.perf_counter() - self.started) * 1000, 3)
+
+    def to_dict(self):
+        return dict(self.phases)
+
+
+class Lazy:
+    """처음 get() 할 때 factory로 만드는 객체 (스레드 안전, 만든 뒤에는 잠금 없이 반환)"""
+
+    __slots__ = ('_factory', '_value', '_lock')
+
+    _UNSET = object()
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = self._UNSET
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._value is not self._UNSET
+
+    def get(self):
+        value = self._value
+        if value is self._UNSET:
+            with self._lock:
+                if self._value is self._UNSET:
+                    self._value = self._factory()
+                value = self._value
+        return value
+
+
+class Warmup:
+    """준비 작업 목록 (이름 → 함수)을 순서대로 한 번 실행하고 작업별 시간(ms)을 기록"""
+
+    def __init__(self):
+        self.tasks = {}
+        self.per_process = set()
+        self.timings = {}
+        self.errors = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add(self, name, func, per_process=False):
+        self.tasks[name] = func
+        if per_process:
+            self.per_process.add(name)
+
+    def _check_fork(self):
+        """fork된 프로세스면 per_process 작업을 다시 실행하도록 기록을 지움"""
+        if self._pid != os.getpid():
+            for name in self.per_process:
+                self.timings.pop(name, None)
+                self.errors.pop(name, None)
+            self._lock = threading.Lock()
+            self._thread = None
+            self._pid = os.getpid()
+
+    @property
+    def ready(self):
+        self._check_fork()
+        return len(self.timings) == len(self.tasks)
+
+    def run(self, per_process=True):
+        """아직 끝나지 않은 작업 실행 (실패한 작업은 오류를 남기고 완료로 봄 - 처음 요청 때 다시 만들어짐)
+        per_process=False면 fork 전 공유 작업만 실행"""
+        self._check_fork()
+        with self._lock:
+            for name, func in self.tasks.items():
+                if name in self.timings or (not per_process and name in self.per_process):
+                    continue
+                start = time.perf_counter()
+                try:
+                    func()
+                except Exception as exc:
+                    logger.exception("준비 작업 실패: %s", name)
+                    self.errors[name] = str(exc)
+                self.timings[name] = round((time.perf_counter() - start) * 1000, 3)
+
+    def start(self):
+        """백그라운드 스레드에서 run() (이미 준비됐거나 실행 중이면 무시)"""
+        if self.ready or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._thread = threading.Thread(target=self.run, name='warmup', daemon=True)
+        self._thread.start()
+
+    def status(self):
+        self._check_fork()
+        return {
+            "ready": self.ready,
+            "tasks": {name: self.timings.get(name) for name in self.tasks},
+            "errors": dict(self.errors)
+        }
@@ -0,0 +1,14 @@
+# 테스트 공통 설정
+# - src/를 import 경로에 추가 (저장소 루트에서 python -m pytest로 실행)
+# - 차트 저장소/속도 제한은 끈 상태로 main을 불러온다 (요청 수가 많은 테스트가 429를 받지 않게)
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+os.environ.setdefault("CHART_STORE_PATH", "")
+os.environ.setdefault("RATE_LIMIT_RATE", "0")
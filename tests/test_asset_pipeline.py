@@ -0,0 +1,122 @@
+# tests/test_asset_pipeline.py
+# 정적 파일 빌드: 내용 해시가 붙은 파일 이름과 압축본, 매니페스트, 이전 빌드 정리,
+# HTML 참조 교체(?v= 제거), 해시 파일의 immutable 캐시 헤더와 일반 파일의 no-cache를 확인한다.
+import gzip
+import hashlib
+import json
+import re
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from fastapi.testclient import TestClient
+from main import app
+from asset_pipeline import DIST_DIRNAME, MANIFEST_NAME, build_assets, rewrite_references
+from page_cache import IMMUTABLE_CACHE_CONTROL, CachedStaticFiles, PageCache
+
+CSS = b"body { color: #333; }\n"
+JS = b"console.log('saju');\n"
+
+
+def fingerprint(body):
+    return hashlib.sha256(body).hexdigest()[:10]
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """css/js 원본과 HTML이 있는 정적 디렉터리"""
+    (tmp_path / "css").mkdir()
+    (tmp_path / "js").mkdir()
+    (tmp_path / "css" / "chat.css").write_bytes(CSS)
+    (tmp_path / "js" / "chat.js").write_bytes(JS)
+    (tmp_path / "js" / "notes.txt").write_bytes(b"not an asset")
+    (tmp_path / "chat.html").write_text(
+        '<link rel="stylesheet" href="/static/css/chat.css">\n'
+        '<script src="/static/js/chat.js?v=3"></script>\n'
+        '<img src="/static/img/logo.png">\n'
+        '<a href="https://example.com/static/css/chat.css">', encoding="utf-8"
+    )
+    return tmp_path
+
+
+class TestBuild:
+    """해시 이름 빌드 테스트"""
+
+    def test_fingerprinted_names(self, static_dir):
+        """파일 이름 = 원래 이름.sha256 앞 10자리.확장자, 원본 바이트 그대로 + 같은 내용의 .gz"""
+        manifest = build_assets(str(static_dir))
+        assert manifest == {
+            "/static/css/chat.css": f"/static/{DIST_DIRNAME}/css/chat.{fingerprint(CSS)}.css",
+            "/static/js/chat.js": f"/static/{DIST_DIRNAME}/js/chat.{fingerprint(JS)}.js",
+        }
+        css_path = static_dir / DIST_DIRNAME / "css" / f"chat.{fingerprint(CSS)}.css"
+        assert css_path.read_bytes() == CSS
+        assert gzip.decompress((static_dir / DIST_DIRNAME / "css" / f"{css_path.name}.gz").read_bytes()) == CSS
+        assert json.loads((static_dir / DIST_DIRNAME / MANIFEST_NAME).read_text()) == manifest
+
+    def test_name_changes_with_content(self, static_dir):
+        """내용이 바뀌면 새 이름, 이전 해시 파일은 정리"""
+        old = build_assets(str(static_dir))["/static/css/chat.css"]
+        (static_dir / "css" / "chat.css").write_bytes(CSS + b"p { margin: 0; }\n")
+        new = build_assets(str(static_dir))["/static/css/chat.css"]
+        assert new != old
+        names = {path.name for path in (static_dir / DIST_DIRNAME / "css").iterdir()}
+        assert names == {new.rsplit("/", 1)[1], new.rsplit("/", 1)[1] + ".gz"}
+
+    def test_rebuild_is_stable(self, static_dir):
+        """같은 내용으로 다시 빌드하면 같은 매니페스트, 같은 파일"""
+        first = build_assets(str(static_dir))
+        files = sorted(path.name for path in (static_dir / DIST_DIRNAME).rglob("*"))
+        assert build_assets(str(static_dir)) == first
+        assert sorted(path.name for path in (static_dir / DIST_DIRNAME).rglob("*")) == files
+
+    def test_missing_sources(self, tmp_path):
+        """css/js 디렉터리가 없으면 빈 매니페스트, dist도 만들지 않음"""
+        assert build_assets(str(tmp_path)) == {}
+        assert not (tmp_path / DIST_DIRNAME).exists()
+
+
+class TestRewrite:
+    """HTML 참조 교체 테스트"""
+
+    def test_references(self, static_dir):
+        """매니페스트에 있는 src/href만 해시 경로로 (?v= 제거), 나머지는 그대로"""
+        manifest = build_assets(str(static_dir))
+        html = rewrite_references((static_dir / "chat.html").read_text(encoding="utf-8"), manifest)
+        assert f'href="{manifest["/static/css/chat.css"]}"' in html
+        assert f'src="{manifest["/static/js/chat.js"]}"' in html
+        assert "?v=3" not in html
+        assert '<img src="/static/img/logo.png">' in html
+        assert 'href="https://example.com/static/css/chat.css"' in html
+
+    def test_empty_manifest(self):
+        html = '<script src="/static/js/chat.js?v=3"></script>'
+        assert rewrite_references(html, {}) == html
+
+
+class TestCacheHeaders:
+    """해시 파일 캐시 헤더 테스트"""
+
+    def test_immutable_only_for_hashed(self, static_dir):
+        """dist/ 아래 해시 파일은 1년 immutable, 원본 경로는 no-cache"""
+        manifest = build_assets(str(static_dir))
+        static = CachedStaticFiles(str(static_dir), PageCache(check_interval=0), immutable_prefix=f"{DIST_DIRNAME}/")
+        client = TestClient(Starlette(routes=[Mount("/static", static)]))
+        hashed = client.get(manifest["/static/js/chat.js"])
+        assert hashed.status_code == 200
+        assert hashed.content == JS
+        assert hashed.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        original = client.get("/static/js/chat.js")
+        assert original.headers["cache-control"] == "no-cache"
+
+    def test_app_pages_reference_hashed_assets(self):
+        """앱 페이지의 css/js 참조는 모두 해시 경로이고, 그 경로는 immutable로 서빙"""
+        client = TestClient(app)
+        html = client.get("/chat").text
+        urls = re.findall(r'(?:src|href)="(/static/[^"]+)"', html)
+        assert urls
+        for url in urls:
+            assert re.fullmatch(rf"/static/{DIST_DIRNAME}/(css|js)/[\w-]+\.[0-9a-f]{{10}}\.(css|js)", url)
+            response = client.get(url)
+            assert response.status_code == 200
+            assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert client.get("/static/chat.html").headers["cache-control"] == "no-cache"
@@ -0,0 +1,127 @@
+# tests/test_batch.py
+# 대량 사주 분석: 잘못된 행은 그 행만 error, 청크 경계에서 index가 끊기거나 겹치지 않는지,
+# 프로세스 풀 경로(BATCH_PROCESS_THRESHOLD 초과)와 API 프로세스 경로의 결과가 같은지 확인한다.
+import json
+import pytest
+from fastapi.testclient import TestClient
+import main
+from batch_pool import BatchPool, batch_lines
+from saju_calculator import SajuCalculator
+
+client = TestClient(main.app)
+
+# 정상 행 사이에 형식 오류/없는 날짜/지원 범위 밖 행을 섞은 입력
+BIRTH_DATES = [f"{1950 + index * 2}-{index % 12 + 1:02d}-{index % 28 + 1:02d}" for index in range(40)]
+BIRTH_TIMES = [f"{index * 7 % 24:02d}:{index * 13 % 60:02d}" for index in range(40)]
+INVALID_ROWS = {3: ("1990-5-15", "12:00"), 11: ("1990-02-30", "12:00"), 20: ("1990-05-15", "24:00"),
+                27: ("1800-01-01", "12:00"), 39: ("1990-05-15", "12:00:00")}
+for index, (birth_date, birth_time) in INVALID_ROWS.items():
+    BIRTH_DATES[index], BIRTH_TIMES[index] = birth_date, birth_time
+
+
+def post_batch(birth_dates=BIRTH_DATES, birth_times=BIRTH_TIMES, **extra):
+    return client.post("/saju/batch", json={"birth_dates": birth_dates, "birth_times": birth_times, **extra})
+
+
+def rows(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestInvalidRows:
+    """행 단위 오류 테스트"""
+
+    def test_only_bad_rows_fail(self):
+        """잘못된 행만 error, 나머지는 한 명씩 계산한 결과와 같음"""
+        response = post_batch()
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        result = rows(response)
+        assert [row["index"] for row in result] == list(range(40))
+        for row in result:
+            if row["index"] in INVALID_ROWS:
+                assert row == {"index": row["index"], "status": "error", "error": "사주 계산에 실패했습니다."}
+            else:
+                year, month, day = map(int, BIRTH_DATES[row["index"]].split("-"))
+                hour, minute = map(int, BIRTH_TIMES[row["index"]].split(":"))
+                single = main.saju_calculator.calculate_saju(year, month, day, hour, minute)
+                assert row["status"] == "success"
+                assert row["day_pillar"] == single.day_pillar
+
+    def test_all_rows_invalid(self):
+        response = post_batch(["x", "1990-13-01"], ["12:00", "12:00"])
+        assert [row["status"] for row in rows(response)] == ["error", "error"]
+
+    @pytest.mark.parametrize("birth_dates, birth_times", [
+        (["1990-05-15", "1990-05-16"], ["12:00"]),
+        (["1990-05-15"], []),
+    ])
+    def test_length_mismatch(self, birth_dates, birth_times):
+        """두 배열 길이가 다르면 전체 422"""
+        response = post_batch(birth_dates, birth_times)
+        assert response.status_code == 422
+        assert response.json()["status"] == "error"
+
+    def test_too_many_rows(self):
+        """BATCH_MAX_ROWS 초과는 422"""
+        count = main.BATCH_MAX_ROWS + 1
+        assert post_batch(["1990-05-15"] * count, ["12:00"] * count).status_code == 422
+
+    def test_empty(self):
+        """빈 배치는 빈 응답"""
+        response = post_batch([], [])
+        assert response.status_code == 200
+        assert response.text == ""
+
+
+class TestChunking:
+    """청크 경계 테스트"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 39, 40, 41])
+    def test_chunk_size_does_not_change_output(self, chunk_size, monkeypatch):
+        """청크 크기와 상관없이 index가 0부터 이어지고 결과가 같음 (경계 앞뒤 행 포함)"""
+        expected = post_batch().text
+        monkeypatch.setattr(main, "BATCH_CHUNK_SIZE", chunk_size)
+        assert post_batch().text == expected
+
+    def test_batch_lines_start(self):
+        """batch_lines의 index는 청크 시작 위치부터"""
+        text = batch_lines(SajuCalculator(), BIRTH_DATES[8:12], BIRTH_TIMES[8:12], start=8)
+        assert text.endswith("\n")
+        assert [row["index"] for row in map(json.loads, text.splitlines())] == [8, 9, 10, 11]
+
+
+class TestProcessPool:
+    """프로세스 풀 경로 테스트"""
+
+    def test_should_offload(self):
+        """threshold 초과 + 워커가 있을 때만 풀 사용"""
+        pool = BatchPool(max_workers=2, threshold=10)
+        assert not pool.should_offload(10)
+        assert pool.should_offload(11)
+        assert not BatchPool(max_workers=0, threshold=10).should_offload(11)
+
+    @pytest.mark.parametrize("element_profile", [False, True])
+    def test_pool_matches_inline(self, element_profile, monkeypatch):
+        """threshold를 넘는 배치를 청크 7행씩 풀에서 계산해도 API 프로세스 경로와 같은 바이트"""
+        monkeypatch.setattr(main, "batch_pool", BatchPool(max_workers=0))
+        inline = post_batch(element_profile=element_profile)
+        pool = BatchPool(max_workers=2, threshold=10, chunk_size=7)
+        monkeypatch.setattr(main, "batch_pool", pool)
+        try:
+            pooled = post_batch(element_profile=element_profile)
+            assert pool.running
+            assert pool.offloaded == 1
+        finally:
+            pool.close()
+        assert pooled.status_code == 200
+        assert pooled.headers["content-type"] == inline.headers["content-type"]
+        assert pooled.text == inline.text
+        assert [row["index"] for row in rows(pooled)] == list(range(40))
+
+    def test_below_threshold_stays_inline(self, monkeypatch):
+        """threshold 이하 배치는 풀을 만들지 않음"""
+        pool = BatchPool(max_workers=2, threshold=40, chunk_size=7)
+        monkeypatch.setattr(main, "batch_pool", pool)
+        assert post_batch().status_code == 200
+        assert not pool.running
+        assert pool.offloaded == 0
@@ -0,0 +1,195 @@
+# tests/test_chart_store.py
+# 차트 저장소: 정규화 키 기준 upsert, 스키마 버전이 다르면 테이블 재생성, 코호트 조회 필터/페이지,
+# 궁합 후보 조회(성별, 최근 순, 본인 제외), /saju/charts API 검증을 확인한다.
+import sqlite3
+import pytest
+from fastapi.testclient import TestClient
+import main
+from chart_store import SCHEMA_VERSION, ChartStore, chart_row
+from startup import Lazy
+
+client = TestClient(main.app)
+
+
+def make_row(birth_date, gender="남", birth_place="서울", birth_time="12:00", hour_branch=6, body=b"{}"):
+    """저장할 행 (기둥은 실제 계산값, 키는 진태양시 날짜 = 출생일)"""
+    year, month, day = map(int, birth_date.split("-"))
+    result = main.saju_calculator.calculate_saju(year, month, day, 12, 0)
+    return chart_row(
+        birth_date, birth_time, birth_date, hour_branch, result.pillar_codes[1][1], gender, birth_place,
+        result.five_element, result.four_pillars.to_dict(detailed=True), 0, body
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    chart_store = ChartStore(str(tmp_path / "charts.sqlite3"), flush_interval=0.01)
+    yield chart_store
+    chart_store.close()
+
+
+def save(store, *rows):
+    for row in rows:
+        store.enqueue(row)
+    store.flush()
+
+
+class TestUpsert:
+    """정규화 키 upsert 테스트"""
+
+    def test_same_key_updates(self, store):
+        """(진태양시 날짜, 시지, 월지, 성별, 출생지)가 같으면 한 행을 갱신"""
+        first = make_row("1990-05-15", birth_time="11:10", body=b'{"v": 1}')
+        second = make_row("1990-05-15", birth_time="12:50", body=b'{"v": 2}')
+        save(store, first)
+        save(store, second)
+        total, charts = store.query()
+        assert total == 1
+        assert charts[0]["birth_time"] == "12:50"
+        assert store.get_body("1990-05-15", 6, first[4], "남", "서울") == b'{"v": 2}'
+
+    @pytest.mark.parametrize("changes", [
+        {"gender": "여"}, {"birth_place": "부산"}, {"hour_branch": 7}
+    ])
+    def test_different_key_inserts(self, store, changes):
+        """키 항목 하나라도 다르면 새 행"""
+        save(store, make_row("1990-05-15"), make_row("1990-05-15", **changes))
+        assert store.query()[0] == 2
+
+    def test_get_body_miss(self, store):
+        """없는 키는 None, 적중/실패 횟수 집계"""
+        save(store, make_row("1990-05-15"))
+        assert store.get_body("1990-05-16", 6, 5, "남", "서울") is None
+        assert store.stats()["misses"] == 1
+        assert store.stats()["written"] == 1
+
+
+class TestSchemaVersion:
+    """스키마 버전 테스트"""
+
+    def test_old_version_dropped(self, tmp_path):
+        """user_version이 다르면 기존 차트 테이블을 버리고 새로 만듦"""
+        path = str(tmp_path / "charts.sqlite3")
+        connection = sqlite3.connect(path)
+        connection.executescript(
+            "CREATE TABLE charts (id INTEGER PRIMARY KEY, old TEXT); INSERT INTO charts (old) VALUES ('x');"
+            f"PRAGMA user_version = {SCHEMA_VERSION - 1};"
+        )
+        connection.close()
+        store = ChartStore(path, flush_interval=0.01)
+        try:
+            assert store.query() == (0, [])
+            save(store, make_row("1990-05-15"))
+            assert store.query()[0] == 1
+        finally:
+            store.close()
+        connection = sqlite3.connect(path)
+        assert connection.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        connection.close()
+
+    def test_same_version_kept(self, tmp_path):
+        """같은 버전이면 다시 열어도 차트 유지"""
+        path = str(tmp_path / "charts.sqlite3")
+        store = ChartStore(path, flush_interval=0.01)
+        save(store, make_row("1990-05-15"))
+        store.close()
+        reopened = ChartStore(path)
+        try:
+            assert reopened.query()[0] == 1
+        finally:
+            reopened.close()
+
+
+class TestQuery:
+    """코호트 조회 테스트"""
+
+    DATES = ("1985-03-01", "1990-05-15", "1990-07-20", "1995-12-31", "2001-01-01")
+
+    @pytest.fixture
+    def filled(self, store):
+        rows = [make_row(birth_date, gender="남" if index % 2 else "여") for index, birth_date in enumerate(self.DATES)]
+        save(store, *rows)
+        return store, rows
+
+    def test_order_and_paging(self, filled):
+        """생년월일 순, limit/offset으로 나눠도 전체 건수는 그대로"""
+        store, _ = filled
+        total, first = store.query(limit=2)
+        _, second = store.query(limit=2, offset=2)
+        _, rest = store.query(limit=2, offset=4)
+        assert total == 5
+        assert [chart["birth_date"] for chart in first + second + rest] == list(self.DATES)
+        assert "body" not in first[0] and "features" not in first[0]
+
+    def test_filters(self, filled):
+        """성별, 생년월일 범위(양 끝 포함), 일주, 오행 필터 (None은 무시)"""
+        store, rows = filled
+        assert store.query(gender="남")[0] == 2
+        assert store.query(gender=None)[0] == 5
+        total, charts = store.query(birth_date_from="1990-05-15", birth_date_to="1995-12-31")
+        assert [chart["birth_date"] for chart in charts] == ["1990-05-15", "1990-07-20", "1995-12-31"]
+        day_pillar = rows[1][9]
+        assert all(chart["day_pillar"] == day_pillar for chart in store.query(day_pillar=day_pillar)[1])
+        five_element = rows[2][11]
+        expected = sum(1 for row in rows if row[11] == five_element)
+        assert store.query(five_element=five_element)[0] == expected
+
+    def test_combined_filters(self, filled):
+        """필터는 AND로 결합"""
+        store, _ = filled
+        total, charts = store.query(gender="여", birth_date_from="1990-01-01")
+        assert [chart["birth_date"] for chart in charts] == ["1990-07-20", "2001-01-01"]
+        assert total == 2
+
+
+class TestMatchCandidates:
+    """궁합 후보 조회 테스트"""
+
+    def test_gender_recent_first_exclude(self, store):
+        """성별 필터, 최근 저장 순, limit, 기준 본인 제외"""
+        rows = [make_row(f"1990-05-{day:02d}", gender="여") for day in range(10, 16)]
+        save(store, make_row("1990-05-01", gender="남"), *rows)
+        candidates = store.match_candidates("여", limit=10)
+        assert len(candidates) == 6
+        ids = [chart_id for chart_id, _ in candidates]
+        assert ids == sorted(ids, reverse=True)
+        assert len(store.match_candidates("여", limit=3)) == 3
+
+        self_row = rows[-1]
+        exclude = (self_row[2], self_row[3], self_row[4], self_row[5], self_row[6])
+        excluded = store.match_candidates("여", limit=10, exclude=exclude)
+        assert len(excluded) == 5
+        assert ids[0] not in [chart_id for chart_id, _ in excluded]
+        charts = store.get_charts([chart_id for chart_id, _ in excluded])
+        assert self_row[0] not in {chart["birth_date"] for chart in charts.values()}
+
+
+class TestChartsApi:
+    """/saju/charts API 테스트"""
+
+    @pytest.mark.parametrize("query", [
+        "gender=x", "five_element=나", "birth_date_from=1990-5-1", "birth_date_from=0",
+        "birth_date_to=1990-02-30", "limit=0", "offset=-1"
+    ])
+    def test_bad_filters(self, query):
+        """형식이 틀린 날짜, 목록 밖 성별/오행은 빈 결과가 아니라 422"""
+        response = client.get(f"/saju/charts?{query}")
+        assert response.status_code == 422
+        assert response.json()["status"] == "error"
+
+    def test_disabled_store(self):
+        """저장소가 꺼져 있으면 503"""
+        assert client.get("/saju/charts").status_code == 503
+
+    def test_detailed_then_query(self, store, monkeypatch):
+        """/saju/detailed로 저장한 차트를 날짜/성별로 조회"""
+        monkeypatch.setattr(main, "chart_store", Lazy(lambda: store))
+        response = client.post("/saju/detailed", json={
+            "birth_date": "1963-09-09", "birth_time": "09:09", "gender": "여", "birth_place": "광주"
+        })
+        assert response.status_code == 200
+        store.flush()
+        data = client.get("/saju/charts?gender=여&birth_date_from=1963-09-09&birth_date_to=1963-09-09").json()
+        assert data["total"] == 1
+        assert data["charts"][0]["day_pillar"] == response.json()["day_pillar"]
+        assert client.get("/saju/charts?gender=남&birth_date_from=1963-09-09").json()["total"] == 0
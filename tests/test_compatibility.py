@@ -0,0 +1,200 @@
+# tests/test_compatibility.py
+# 궁합 점수: 천간합/육합/육충/삼합 판정과 점수, 비트마스크 점수기 = 글자 단위로 센 기준 점수,
+# 후보 순위, /saju/compatibility(/matches) API를 확인한다.
+import random
+import pytest
+from fastapi.testclient import TestClient
+from main import MATCH_MAX_POOL, app
+from compatibility import (
+    BASE_SCORE, BRANCH_CLASH_MIN, BRANCH_CLASH_POINTS, BRANCH_HARMONY_MAX, BRANCH_HARMONY_POINTS,
+    BRANCH_TRIAD_POINTS, BRANCH_TRIADS, DAY_BRANCH_CLASH_POINTS, DAY_BRANCH_HARMONY_POINTS,
+    DAY_MASTER_POINTS, DAY_STEM_COMBINATION_POINTS, ELEMENT_BALANCE_MAX, STEM_COMBINATION_MAX,
+    STEM_COMBINATION_POINTS, ChartFeatures, MatchScorer, compatibility_details
+)
+from saju_calculator import BRANCH_ELEMENTS, PILLARS, STEM_ELEMENTS, STEM_TEN_GODS, FourPillars
+
+client = TestClient(app)
+
+
+def features(*codes):
+    """(천간, 지지) 코드 네 개(년, 월, 일, 시) → 특징 값"""
+    return ChartFeatures.from_four_pillars(FourPillars.from_codes(codes))
+
+
+def reference_score(a_codes, b_codes):
+    """글자 단위로 센 궁합 점수 (비교 기준)"""
+    a_stems, b_stems = {stem for stem, _ in a_codes}, {stem for stem, _ in b_codes}
+    a_branches, b_branches = {branch for _, branch in a_codes}, {branch for _, branch in b_codes}
+    (a_day_stem, a_day_branch), (b_day_stem, b_day_branch) = a_codes[2], b_codes[2]
+
+    score = BASE_SCORE
+    score += DAY_MASTER_POINTS[STEM_TEN_GODS[a_day_stem][b_day_stem]]
+    score += DAY_MASTER_POINTS[STEM_TEN_GODS[b_day_stem][a_day_stem]]
+    if (a_day_stem - b_day_stem) % 10 == 5:
+        score += DAY_STEM_COMBINATION_POINTS
+    if (a_day_branch + b_day_branch) % 12 == 1:
+        score += DAY_BRANCH_HARMONY_POINTS
+    if (a_day_branch - b_day_branch) % 12 == 6:
+        score += DAY_BRANCH_CLASH_POINTS
+
+    combinations = sum(1 for stem in b_stems if (stem + 5) % 10 in a_stems)
+    score += min(combinations * STEM_COMBINATION_POINTS, STEM_COMBINATION_MAX)
+    harmonies = sum(1 for branch in b_branches if (1 - branch) % 12 in a_branches)
+    score += min(harmonies * BRANCH_HARMONY_POINTS, BRANCH_HARMONY_MAX)
+    clashes = sum(1 for branch in b_branches if (branch + 6) % 12 in a_branches)
+    score += max(clashes * BRANCH_CLASH_POINTS, BRANCH_CLASH_MIN)
+    for triad in map(set, BRANCH_TRIADS):
+        if a_branches & triad and not triad <= a_branches and not triad <= b_branches \
+                and triad <= a_branches | b_branches:
+            score += BRANCH_TRIAD_POINTS
+
+    counts = [0] * 5
+    for stem, branch in list(a_codes) + list(b_codes):
+        counts[STEM_ELEMENTS[stem]] += 1
+        counts[BRANCH_ELEMENTS[branch]] += 1
+    imbalance = sum(abs(count - 16 / 5) for count in counts)
+    score += round(ELEMENT_BALANCE_MAX * (1 - imbalance / (16 - 16 / 5 + 4 * 16 / 5)))
+    return max(0, min(100, score))
+
+
+def random_codes(rng):
+    pillars = [pillar for row in PILLARS for pillar in row if pillar]
+    return tuple(tuple(rng.choice(pillars)) for _ in range(4))
+
+
+class TestRelations:
+    """합/충/삼합 판정과 점수 테스트"""
+
+    # 기준 사주: 무진 네 기둥 (지지 진 하나, 천간 무 하나)
+    BASE = ((4, 4),) * 4
+
+    def test_day_stem_combination(self):
+        """일간 갑 + 기 = 천간합 (합화 흙)"""
+        details = compatibility_details(
+            features((2, 2), (2, 2), (0, 0), (2, 2)),
+            features((3, 3), (3, 3), (5, 5), (3, 3))
+        )
+        assert details["day_master"]["combined"]
+        assert {"pair": "갑기", "element": "흙"} in details["stem_combinations"]
+
+    def test_branch_harmony(self):
+        """진 + 유 = 육합, 점수 +BRANCH_HARMONY_POINTS (같은 금 오행 신과 비교)"""
+        with_harmony = ((2, 2), (2, 2), (2, 2), (7, 9))    # 시주 신유
+        without = ((2, 2), (2, 2), (2, 2), (6, 8))         # 시주 경신
+        details = compatibility_details(features(*self.BASE), features(*with_harmony))
+        assert details["branch_harmonies"] == ["진유"]
+        score = MatchScorer(features(*self.BASE)).score
+        assert score(features(*with_harmony)) - score(features(*without)) == BRANCH_HARMONY_POINTS
+
+    def test_branch_clash(self):
+        """진 + 술 = 육충, 점수 BRANCH_CLASH_POINTS (같은 흙 오행 진과 비교)"""
+        with_clash = ((2, 2), (2, 2), (2, 2), (0, 10))     # 시주 갑술
+        without = ((2, 2), (2, 2), (2, 2), (0, 4))         # 시주 갑진
+        details = compatibility_details(features(*self.BASE), features(*with_clash))
+        assert details["branch_clashes"] == ["진술"]
+        score = MatchScorer(features(*self.BASE)).score
+        assert score(features(*with_clash)) - score(features(*without)) == BRANCH_CLASH_POINTS
+
+    def test_day_branch_clash(self):
+        """일지끼리 충이면 일지 감점도 더해짐"""
+        a = features((2, 2), (2, 2), (0, 0), (2, 2))        # 일주 갑자
+        b = features((2, 2), (2, 2), (0, 6), (2, 2))        # 일주 갑오
+        assert compatibility_details(a, b)["branch_clashes"] == ["자오"]
+        assert MatchScorer(a).score(b) == reference_score(
+            ((2, 2), (2, 2), (0, 0), (2, 2)), ((2, 2), (2, 2), (0, 6), (2, 2))
+        )
+
+    def test_triad_across_two_charts(self):
+        """신자진 삼합: 두 사람이 나눠 가지면 인정, 한 사람이 다 가지면 아님"""
+        shared = compatibility_details(
+            features(*self.BASE), features((6, 8), (2, 0), (6, 8), (2, 0))   # 경신, 병자
+        )
+        assert shared["branch_triads"] == ["신자진"]
+        alone = compatibility_details(
+            features((2, 0), (2, 0), (2, 0), (2, 0)),                        # 병자 네 기둥
+            features((6, 8), (2, 0), (4, 4), (6, 8))                         # 경신, 병자, 무진
+        )
+        assert alone["branch_triads"] == []
+
+    def test_element_balance(self):
+        """합친 오행 분포는 두 사람 글자 수의 합 (16글자)"""
+        details = compatibility_details(features(*self.BASE), features(*((2, 2),) * 4))
+        assert details["element_balance"] == {"나무": 4, "불": 4, "흙": 8, "금": 0, "물": 0}
+
+
+class TestScorer:
+    """비트마스크 점수기 = 기준 점수 테스트"""
+
+    def test_matches_reference(self):
+        """무작위 사주 2000쌍의 점수가 글자 단위 계산과 같음"""
+        rng = random.Random(20240204)
+        for _ in range(2000):
+            a_codes, b_codes = random_codes(rng), random_codes(rng)
+            assert MatchScorer(features(*a_codes)).score(features(*b_codes)) == \
+                reference_score(a_codes, b_codes), (a_codes, b_codes)
+
+    def test_pack_round_trip(self):
+        """묶은 정수를 풀면 같은 특징 값"""
+        rng = random.Random(1)
+        for _ in range(200):
+            chart = features(*random_codes(rng))
+            assert ChartFeatures.unpack(chart.pack()) == chart
+
+    def test_rank(self):
+        """rank = 점수 내림차순 상위 limit개, 점수가 같으면 입력 순서"""
+        rng = random.Random(7)
+        scorer = MatchScorer(features(*random_codes(rng)))
+        candidates = [(index, features(*random_codes(rng)).pack()) for index in range(500)]
+        expected = sorted(
+            ((scorer.score_packed(packed), key) for key, packed in candidates),
+            key=lambda item: (-item[0], item[1])
+        )
+        assert scorer.rank(candidates, 20) == expected[:20]
+
+
+class TestCompatibilityApi:
+    """/saju/compatibility, /saju/compatibility/matches API 테스트"""
+
+    PERSON = {"birth_date": "1990-05-15", "birth_time": "14:30", "gender": "남", "birth_place": "서울"}
+    CANDIDATES = [
+        {"birth_date": "1992-03-08", "birth_time": "09:20", "gender": "여", "birth_place": "부산"},
+        {"birth_date": "1988-11-21", "birth_time": "22:05", "gender": "여", "birth_place": "대구"},
+        {"birth_date": "1991-07-30", "birth_time": "05:45", "gender": "여", "birth_place": "해외"},
+    ]
+
+    def test_compatibility(self):
+        """두 사람 궁합 점수 = 매칭 결과의 같은 후보 점수"""
+        response = client.post("/saju/compatibility", json={
+            "person_a": self.PERSON, "person_b": self.CANDIDATES[0]
+        })
+        assert response.status_code == 200
+        data = response.json()
+        assert 0 <= data["score"] <= 100
+        assert set(data["details"]) == {
+            "day_master", "stem_combinations", "branch_harmonies", "branch_triads",
+            "branch_clashes", "element_balance"
+        }
+        assert sum(data["details"]["element_balance"].values()) == 16
+
+        matches = client.post("/saju/compatibility/matches", json={
+            "person": self.PERSON, "candidates": self.CANDIDATES, "limit": 3
+        }).json()["matches"]
+        assert [match["score"] for match in matches] == sorted((match["score"] for match in matches), reverse=True)
+        first = next(match for match in matches if match["index"] == 0)
+        assert first["score"] == data["score"]
+        assert first["details"] == data["details"]
+
+    def test_matches_limit(self):
+        """limit개만 반환"""
+        response = client.post("/saju/compatibility/matches", json={
+            "person": self.PERSON, "candidates": self.CANDIDATES, "limit": 2
+        })
+        assert response.status_code == 200
+        assert response.json()["candidates"] == 3
+        assert len(response.json()["matches"]) == 2
+
+    @pytest.mark.parametrize("field, value", [("pool_size", MATCH_MAX_POOL + 1), ("limit", 0)])
+    def test_matches_bounds(self, field, value):
+        """pool_size/limit 범위 밖이면 422"""
+        response = client.post("/saju/compatibility/matches", json={"person": self.PERSON, field: value})
+        assert response.status_code == 422
@@ -0,0 +1,132 @@
+# tests/test_element_profile.py
+# 오행 세력 분포: 지장간 일수/계절 가중치 표의 합, 묶은 벡터 합산 = 글자 단위로 더한 기준 값,
+# /saju/detailed, /saju/batch 응답의 element_profile을 확인한다.
+import json
+import random
+from fastapi.testclient import TestClient
+from main import app, saju_calculator
+from saju_calculator import (
+    BRANCH_ELEMENTS, ELEMENT_VECTORS, FIVE_ELEMENTS, HIDDEN_STEMS, PILLARS, SEASON_PERCENTS,
+    SEASON_STRENGTHS, STEM_ELEMENTS, FourPillars
+)
+
+client = TestClient(app)
+
+ALL_PILLARS = [pillar for row in PILLARS for pillar in row if pillar]
+
+
+def reference_profile(four_pillars):
+    """글자 단위로 더한 (오행별 글자 수, 세력) - 비교 기준"""
+    season = BRANCH_ELEMENTS[four_pillars.month.branch]
+    counts = [0] * 5
+    days = [0] * 5
+    for pillar in four_pillars:
+        counts[STEM_ELEMENTS[pillar.stem]] += 1
+        counts[BRANCH_ELEMENTS[pillar.branch]] += 1
+        days[STEM_ELEMENTS[pillar.stem]] += 30
+        for hidden_stem, hidden_days in HIDDEN_STEMS[pillar.branch]:
+            days[STEM_ELEMENTS[hidden_stem]] += hidden_days
+    weights = tuple(
+        round(days[element] * SEASON_PERCENTS[(element - season) % 5] / 100 / 30, 2)
+        for element in range(5)
+    )
+    return season, tuple(counts), weights
+
+
+def random_four_pillars(rng):
+    return FourPillars(*(rng.choice(ALL_PILLARS) for _ in range(4)))
+
+
+class TestTables:
+    """지장간/계절 가중치 표 테스트"""
+
+    def test_hidden_stem_days(self):
+        """지지마다 지장간 일수 합은 30일, 정기(마지막)는 지지와 같은 오행"""
+        for branch, hidden_stems in enumerate(HIDDEN_STEMS):
+            assert sum(days for _, days in hidden_stems) == 30, branch
+            assert STEM_ELEMENTS[hidden_stems[-1][0]] == BRANCH_ELEMENTS[branch], branch
+
+    def test_season_percents(self):
+        """왕상휴수사 가중치: 왕 > 상 > 휴 > 수 > 사, 다섯 오행 합 520%"""
+        strengths = dict(zip(SEASON_STRENGTHS, SEASON_PERCENTS))
+        assert strengths['왕'] > strengths['상'] > strengths['휴'] > strengths['수'] > strengths['사']
+        assert sum(SEASON_PERCENTS) == 520
+
+    def test_vector_weight_sums(self):
+        """기둥 하나의 세력 칸 합 = 천간 30일 + 지장간 30일을 오행별 계절 가중치(%)로 곱한 값, 글자 수 칸 합 = 2"""
+        for month_branch, table in enumerate(ELEMENT_VECTORS):
+            season = BRANCH_ELEMENTS[month_branch]
+            for pillar in ALL_PILLARS:
+                lanes = [table[pillar.index] >> (lane * 16) & 0xFFFF for lane in range(10)]
+                assert sum(lanes[5:]) == 2
+                days = [0] * 5
+                days[STEM_ELEMENTS[pillar.stem]] += 30
+                for hidden_stem, hidden_days in HIDDEN_STEMS[pillar.branch]:
+                    days[STEM_ELEMENTS[hidden_stem]] += hidden_days
+                assert sum(days) == 60
+                expected = sum(days[element] * SEASON_PERCENTS[(element - season) % 5] for element in range(5))
+                assert sum(lanes[:5]) == expected, (month_branch, pillar)
+
+
+class TestElementProfile:
+    """묶은 벡터 합산 = 기준 값 테스트"""
+
+    def test_matches_reference(self):
+        """무작위 사주 5000개의 글자 수/세력이 글자 단위 계산과 같음"""
+        rng = random.Random(518)
+        for _ in range(5000):
+            four_pillars = random_four_pillars(rng)
+            assert tuple(four_pillars.element_profile) == reference_profile(four_pillars), four_pillars
+
+    def test_lane_does_not_overflow(self):
+        """한 오행에 몰린 사주(왕인 오행 기둥 네 개)도 16비트 칸 안에서 정확"""
+        for pillar in ALL_PILLARS:
+            four_pillars = FourPillars(pillar, pillar, pillar, pillar)
+            assert tuple(four_pillars.element_profile) == reference_profile(four_pillars), pillar
+
+    def test_to_dict(self):
+        """비율 합 약 100, 월지 오행이 왕, 가장 강한/약한 오행은 세력 기준"""
+        rng = random.Random(2)
+        for _ in range(200):
+            profile = random_four_pillars(rng).element_profile
+            data = profile.to_dict()
+            assert abs(sum(data['percent'].values()) - 100) < 0.5
+            assert data['strengths'][data['season']] == '왕'
+            assert data['weights'][data['strongest']] == max(profile.weights)
+            assert data['weights'][data['weakest']] == min(profile.weights)
+
+
+class TestProfileApi:
+    """API 응답의 element_profile 테스트"""
+
+    def test_detailed(self):
+        """/saju/detailed의 element_profile = 같은 기둥의 기준 값"""
+        response = client.post("/saju/detailed", json={
+            "birth_date": "1990-05-15",
+            "birth_time": "14:30",
+            "gender": "여",
+            "birth_place": "해외"
+        })
+        assert response.status_code == 200
+        data = response.json()["element_profile"]
+        four_pillars = saju_calculator.calculate_saju(1990, 5, 15, 14, 30).four_pillars
+        season, counts, weights = reference_profile(four_pillars)
+        assert data["season"] == FIVE_ELEMENTS[season]
+        assert data["counts"] == dict(zip(FIVE_ELEMENTS, counts))
+        assert data["weights"] == dict(zip(FIVE_ELEMENTS, weights))
+
+    def test_batch(self):
+        """/saju/batch element_profile 행 = 한 명씩 계산한 값"""
+        birth_dates = ["1990-05-15", "1984-02-04", "2001-11-30"]
+        birth_times = ["14:30", "03:10", "23:45"]
+        response = client.post("/saju/batch", json={
+            "birth_dates": birth_dates, "birth_times": birth_times, "element_profile": True
+        })
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 3
+        for row, birth_date, birth_time in zip(rows, birth_dates, birth_times):
+            year, month, day = map(int, birth_date.split('-'))
+            hour, minute = map(int, birth_time.split(':'))
+            expected = saju_calculator.calculate_saju(year, month, day, hour, minute).element_profile.to_dict()
+            assert row["element_profile"] == expected
@@ -0,0 +1,152 @@
+# tests/test_interpret.py
+# 사주 해석: 로컬 OpenAI 스텁 서버(scripts/openai_stub_server.py)를 띄워 /saju/interpret의 SSE 형식,
+# 같은 사주 재요청 시 캐시 적중(업스트림 호출 없음), 동시 업스트림 호출 수 제한을 확인한다.
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+import main
+from openai_service import OpenAIService
+from startup import Lazy
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STUB_SCRIPT = os.path.join(ROOT_DIR, "scripts", "openai_stub_server.py")
+
+PERSON = {"birth_date": "1990-05-15", "birth_time": "14:30", "gender": "남", "birth_place": "서울"}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def stub_url():
+    """스텁 서버를 별도 프로세스로 띄우고 base URL 반환"""
+    pytest.importorskip("uvicorn")
+    pytest.importorskip("openai")
+    port = _free_port()
+    env = dict(os.environ, STUB_PORT=str(port), STUB_CHUNK_DELAY="0.02")
+    process = subprocess.Popen([sys.executable, STUB_SCRIPT], env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{base_url}/stats")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        else:
+            pytest.fail("스텁 서버가 뜨지 않음")
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def _stub_calls(stub_url):
+    return httpx.get(f"{stub_url}/stats").json()["chat_completions"]
+
+
+def _events(text):
+    """SSE 본문 → 이벤트 목록 [(이벤트 이름 또는 None, data), ...]"""
+    events = []
+    for block in text.split("\n\n")[:-1]:
+        name = None
+        data = []
+        for line in block.split("\n"):
+            field, _, value = line.partition(": ")
+            if field == "event":
+                name = value
+            elif field == "data":
+                data.append(value)
+        events.append((name, "\n".join(data)))
+    return events
+
+
+class TestInterpretEndpoint:
+    """/saju/interpret SSE와 캐시 테스트"""
+
+    @pytest.fixture
+    def client(self, stub_url, monkeypatch):
+        service = Lazy(lambda: OpenAIService(api_key="stub", base_url=f"{stub_url}/v1"))
+        monkeypatch.setattr(main, "openai_service", service)
+        return TestClient(main.app)
+
+    def test_sse_framing(self, client):
+        """text/event-stream, 'data: {"delta": ...}' 이벤트들 뒤에 'data: [DONE]'"""
+        response = client.post("/saju/interpret", json=PERSON)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.text.endswith("\n\n")
+        events = _events(response.text)
+        assert events[-1] == (None, "[DONE]")
+        deltas = [json.loads(data)["delta"] for name, data in events[:-1]]
+        assert all(name is None for name, _ in events)
+        assert len(deltas) > 1
+        assert "".join(deltas).startswith("스텁 해석입니다.")
+
+    def test_repeat_hits_cache(self, client, stub_url):
+        """같은 사주 재요청은 업스트림 호출 없이 캐시된 해석 전체를 한 이벤트로"""
+        first = client.post("/saju/interpret", json=PERSON)
+        calls = _stub_calls(stub_url)
+        second = client.post("/saju/interpret", json=PERSON)
+        assert _stub_calls(stub_url) == calls
+        first_text = "".join(json.loads(data)["delta"] for _, data in _events(first.text)[:-1])
+        assert _events(second.text) == [
+            (None, json.dumps({"delta": first_text}, ensure_ascii=False)), (None, "[DONE]")
+        ]
+
+    def test_upstream_error(self, monkeypatch):
+        """업스트림 연결 실패는 고정 문구의 error 이벤트 (오류 내용은 노출하지 않음)"""
+        service = Lazy(lambda: OpenAIService(api_key="stub", base_url=f"http://127.0.0.1:{_free_port()}/v1"))
+        monkeypatch.setattr(main, "openai_service", service)
+        service.get().client.max_retries = 0
+        response = TestClient(main.app).post("/saju/interpret", json=PERSON)
+        assert response.status_code == 200
+        assert _events(response.text) == [("error", json.dumps({"error": main.INTERPRET_ERROR}, ensure_ascii=False))]
+
+
+class TestConcurrencyLimit:
+    """동시 업스트림 호출 수 제한 테스트"""
+
+    def test_semaphore_bounds_upstream_streams(self, stub_url):
+        """서로 다른 사주 6개를 동시에 요청해도 스트리밍 중인 업스트림 호출은 max_concurrency개 이하"""
+        service = OpenAIService(api_key="stub", base_url=f"{stub_url}/v1", max_concurrency=2)
+        intervals = []
+
+        async def consume(index):
+            saju_result = {
+                "five_element": "나무", "day_pillar": f"테스트{index}",
+                "four_pillars": {name: {"pillar": "갑자"} for name in ("year", "month", "day", "hour")}
+            }
+            loop = asyncio.get_running_loop()
+            first = None
+            async for _ in service.stream_interpretation(saju_result):
+                if first is None:
+                    first = loop.time()
+            intervals.append((first, loop.time()))
+
+        async def run():
+            try:
+                await asyncio.gather(*(consume(index) for index in range(6)))
+            finally:
+                await service.close()
+
+        asyncio.run(run())
+        assert len(intervals) == 6
+        moments = sorted([(start, 1) for start, _ in intervals] + [(end, -1) for _, end in intervals])
+        active = peak = 0
+        for _, change in moments:
+            active += change
+            peak = max(peak, active)
+        assert peak == 2
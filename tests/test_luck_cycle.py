@@ -0,0 +1,177 @@
+# tests/test_luck_cycle.py
+# 대운/세운: 년간 음양과 성별에 따른 순행/역행, 절입까지 거리로 정하는 대운수(3일 = 1년, 나머지 2일 올림),
+# 대운 구간 길이/60갑자 순서, 세운 년주, /saju/luck 스트리밍 응답을 확인한다.
+import json
+import random
+from bisect import bisect_right
+import pytest
+from fastapi.testclient import TestClient
+from main import app, saju_calculator
+from luck_cycle import MAJOR_LUCK_YEARS, LuckCycle, luck_direction, start_age
+from saju_calculator import HEAVENLY_STEMS
+from solar_terms import minutes_to_datetime_tuple, moment_minutes, month_term
+
+client = TestClient(app)
+
+# 2024년 입춘 2024-02-04 17:27, 경칩 2024-03-05 11:23 (한국 표준시)
+IPCHUN_2024 = month_term(2024, 2)[1]
+GYEONGCHIP_2024 = month_term(2024, 3)[1]
+
+
+def moment_at(minutes):
+    return minutes_to_datetime_tuple(minutes)
+
+
+def reference_start_age(moment, direction, terms):
+    """정렬된 절입 시각 목록에서 다음/이전 절입을 찾아 계산한 대운수 (비교 기준)"""
+    birth = moment_minutes(*moment)
+    if direction > 0:
+        boundary = terms[bisect_right(terms, birth)]
+    else:
+        boundary = terms[bisect_right(terms, birth) - 1]
+    days = abs(boundary - birth) // 1440
+    years, remainder = divmod(days, 3)
+    return min(max(years + (remainder == 2), 1), 10)
+
+
+def luck_cycle(birth_date, birth_time, gender):
+    year, month, day = map(int, birth_date.split("-"))
+    hour, minute = map(int, birth_time.split(":"))
+    return LuckCycle(saju_calculator.calculate_saju(year, month, day, hour, minute), gender)
+
+
+class TestDirection:
+    """대운 방향 테스트"""
+
+    @pytest.mark.parametrize("stem", range(10))
+    def test_polarity_and_gender(self, stem):
+        """양년생(갑병무경임) 남자/음년생 여자는 순행, 그 반대는 역행"""
+        yang = HEAVENLY_STEMS[stem] in ('갑', '병', '무', '경', '임')
+        assert luck_direction(stem, '남') == (1 if yang else -1)
+        assert luck_direction(stem, '여') == (-1 if yang else 1)
+
+    def test_unknown_gender(self):
+        with pytest.raises(ValueError):
+            luck_direction(0, '기타')
+
+    def test_year_stem_follows_ipchun(self):
+        """입춘 전 출생은 전년도 년간으로 방향을 정함 (2024 갑진년 입춘 전 = 계묘년, 음)"""
+        assert luck_cycle("2024-02-04", "17:26", "남").direction == -1
+        assert luck_cycle("2024-02-04", "17:27", "남").direction == 1
+
+
+class TestStartAge:
+    """대운수 테스트 (2024 입춘/경칩 기준)"""
+
+    @pytest.mark.parametrize("days, minutes, expected", [
+        (0, 0, 1),       # 절입 시각 출생 → 최소 1
+        (3, 0, 1),
+        (4, 0, 1),       # 나머지 1일은 버림
+        (5, -1, 1),      # 4일 23시간 59분 → 4일
+        (5, 0, 2),       # 나머지 2일은 올림
+        (6, 0, 2),
+        (29, 0, 10),     # 최대 10 (경칩 전날)
+    ])
+    def test_backward_from_ipchun(self, days, minutes, expected):
+        """역행: 입춘 뒤 출생은 입춘까지 거리"""
+        moment = moment_at(IPCHUN_2024 + days * 1440 + minutes)
+        assert start_age(moment, -1) == expected
+
+    @pytest.mark.parametrize("days, expected", [(1, 1), (8, 3), (14, 5), (20, 7)])
+    def test_forward_to_gyeongchip(self, days, expected):
+        """순행: 경칩 전 출생은 경칩까지 거리"""
+        moment = moment_at(GYEONGCHIP_2024 - days * 1440)
+        assert start_age(moment, 1) == expected
+
+    def test_forward_after_term_in_same_month(self):
+        """순행: 그 달 절입 뒤 출생은 다음 달 절입까지 (2024-02-05 → 경칩)"""
+        moment = moment_at(IPCHUN_2024 + 1440)
+        days = (GYEONGCHIP_2024 - IPCHUN_2024 - 1440) // 1440
+        assert start_age(moment, 1) == min((days + 1) // 3, 10)
+
+    def test_backward_across_year(self):
+        """역행: 1월 소한 전 출생은 전년도 12월 대설까지"""
+        moment = (2024, 1, 3, 12, 0)
+        previous = month_term(2023, 12)[1]
+        days = (moment_minutes(*moment) - previous) // 1440
+        assert start_age(moment, -1) == min(max((days + 1) // 3, 1), 10)
+
+    def test_matches_reference(self):
+        """무작위 출생 시각 2000개 × 두 방향: 절입 목록에서 찾은 기준 값과 같음"""
+        terms = sorted(month_term(year, month)[1] for year in range(1949, 2052) for month in range(1, 13))
+        rng = random.Random(15)
+        start, end = terms[12], terms[-13]
+        for _ in range(2000):
+            moment = moment_at(rng.randrange(start, end))
+            for direction in (1, -1):
+                assert start_age(moment, direction) == reference_start_age(moment, direction, terms), moment
+
+
+class TestTimeline:
+    """대운 구간/세운 테스트"""
+
+    @pytest.mark.parametrize("years", [1, 7, 10, 100, 120])
+    def test_covers_every_age_once(self, years):
+        """구간 나이가 0부터 years-1까지 빠짐없이 이어지고, 세운도 해마다 하나"""
+        cycle = luck_cycle("1990-05-15", "14:30", "남")
+        periods = list(cycle.timeline(years))
+        ages = [entry["age"] for period in periods for entry in period["years"]]
+        assert ages == list(range(years))
+        assert periods[0]["start_age"] == 0
+        assert periods[-1]["end_age"] == years - 1
+        for previous, period in zip(periods, periods[1:]):
+            assert period["start_age"] == previous["end_age"] + 1
+
+    def test_first_period_and_lengths(self):
+        """0번 구간은 대운 전(기둥 없음, 0 ~ 대운수-1), 이후 10년씩"""
+        cycle = luck_cycle("1990-05-15", "14:30", "남")
+        periods = list(cycle.timeline(100))
+        assert periods[0]["pillar"] is None
+        assert periods[0]["end_age"] == cycle.start_age - 1
+        assert periods[1]["start_age"] == cycle.start_age
+        for period in periods[1:-1]:
+            assert period["end_age"] - period["start_age"] + 1 == MAJOR_LUCK_YEARS
+
+    @pytest.mark.parametrize("gender", ["남", "여"])
+    def test_pillar_sequence(self, gender):
+        """대운 기둥은 월주에서 방향대로 60갑자 한 칸씩"""
+        result = saju_calculator.calculate_saju(1990, 5, 15, 14, 30)
+        cycle = LuckCycle(result, gender)
+        month_index = result.four_pillars.month.index
+        periods = [period for _, period in zip(range(13), cycle.periods())][1:]
+        indexes = [period.pillar.index for period in periods]
+        assert indexes == [(month_index + cycle.direction * step) % 60 for step in range(1, 13)]
+
+    def test_yearly_pillars(self):
+        """세운은 그 해 년주 (입춘 뒤 날짜로 계산한 년주와 같음), 1984년은 갑자"""
+        cycle = luck_cycle("1980-08-01", "10:00", "여")
+        for period in cycle.timeline(60):
+            for entry in period["years"]:
+                year_pillar = saju_calculator.calculate_saju(entry["year"], 7, 1, 12, 0).four_pillars.year.name
+                assert entry["pillar"] == year_pillar
+                assert entry["year"] == 1980 + entry["age"]
+        assert next(cycle.yearly(4, 4))["pillar"] == "갑자"
+
+
+class TestLuckApi:
+    """/saju/luck 스트리밍 테스트"""
+
+    def test_stream(self):
+        """첫 줄 요약(방향/대운수), 이후 구간 줄의 세운 합이 years"""
+        response = client.post("/saju/luck", json={
+            "birth_date": "1990-05-15", "birth_time": "14:30", "gender": "여", "birth_place": "서울", "years": 35
+        })
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        summary, periods = lines[0], lines[1:]
+        assert summary["direction"] in ("순행", "역행")
+        assert 1 <= summary["start_age"] <= 10
+        assert sum(len(period["years"]) for period in periods) == 35
+        assert periods[1]["start_age"] == summary["start_age"]
+
+    def test_years_bound(self):
+        """years 범위 밖이면 422"""
+        response = client.post("/saju/luck", json={
+            "birth_date": "1990-05-15", "birth_time": "14:30", "gender": "여", "birth_place": "서울", "years": 0
+        })
+        assert response.status_code == 422
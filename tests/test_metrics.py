@@ -0,0 +1,157 @@
+# tests/test_metrics.py
+# 성능 지표: Prometheus 텍스트 형식의 HELP/TYPE 줄, 누적 히스토그램 구간(le="+Inf" = _count),
+# 라벨 값 이스케이프, /metrics 응답과 요청 집계를 확인한다.
+import re
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+from metrics import MetricsRegistry, StageTimer, handler_stage_duration_seconds
+
+client = TestClient(app)
+
+SAMPLE_PATTERN = re.compile(r'([a-zA-Z_:][a-zA-Z0-9_:]*)(\{.*\})? (\S+)')
+LABEL_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\\n]|\\[\\"n])*)"(,|$)')
+
+
+def _unescape(value):
+    return re.sub(r'\\(.)', lambda match: {'n': '\n'}.get(match.group(1), match.group(1)), value)
+
+
+def parse(text):
+    """텍스트 형식 → ({이름: (help, type)}, [(이름, {라벨: 값}, 값)]) (형식이 어긋나면 AssertionError)"""
+    assert text.endswith("\n")
+    metadata = {}
+    samples = []
+    for line in text[:-1].split("\n"):
+        if line.startswith("# HELP "):
+            name, _, documentation = line[7:].partition(" ")
+            metadata[name] = [documentation, None]
+        elif line.startswith("# TYPE "):
+            name, _, kind = line[7:].partition(" ")
+            assert name in metadata, f"HELP 없는 TYPE: {line}"
+            assert kind in ("counter", "gauge", "histogram")
+            metadata[name][1] = kind
+        else:
+            match = SAMPLE_PATTERN.fullmatch(line)
+            assert match, f"잘못된 줄: {line!r}"
+            name, labels, value = match.groups()
+            parsed = {}
+            if labels:
+                body = labels[1:-1]
+                pairs = list(LABEL_PATTERN.finditer(body))
+                assert "".join(pair.group(0) for pair in pairs) == body, f"잘못된 라벨: {labels}"
+                parsed = {pair.group(1): _unescape(pair.group(2)) for pair in pairs}
+            samples.append((name, parsed, float(value)))
+    return {name: tuple(value) for name, value in metadata.items()}, samples
+
+
+def check_histograms(metadata, samples):
+    """히스토그램마다 구간이 le 오름차순 누적이고 마지막이 +Inf = _count"""
+    for name, (_, kind) in metadata.items():
+        if kind != "histogram":
+            continue
+        series = {}
+        for sample_name, labels, value in samples:
+            base = {key: value for key, value in labels.items() if key != "le"}
+            key = tuple(sorted(base.items()))
+            if sample_name == f"{name}_bucket":
+                series.setdefault(key, {"buckets": []})["buckets"].append((labels["le"], value))
+            elif sample_name == f"{name}_count":
+                series.setdefault(key, {"buckets": []})["count"] = value
+        for key, entry in series.items():
+            bounds = [float(le) for le, _ in entry["buckets"]]
+            counts = [count for _, count in entry["buckets"]]
+            assert bounds == sorted(bounds), key
+            assert entry["buckets"][-1][0] == "+Inf", key
+            assert counts == sorted(counts), key
+            assert counts[-1] == entry["count"], key
+
+
+class TestTextFormat:
+    """텍스트 형식 테스트"""
+
+    def test_help_and_type_before_samples(self):
+        """지표마다 HELP, TYPE 줄 다음에 그 지표의 샘플"""
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "작업 수", ("kind",)).inc("a")
+        registry.gauge("queue_size", "대기열 크기").set(value=3)
+        lines = registry.render().splitlines()
+        assert lines == [
+            "# HELP jobs_total 작업 수",
+            "# TYPE jobs_total counter",
+            'jobs_total{kind="a"} 1',
+            "# HELP queue_size 대기열 크기",
+            "# TYPE queue_size gauge",
+            "queue_size 3",
+        ]
+
+    def test_histogram_cumulative(self):
+        """구간 개수는 누적, le="+Inf"는 전체 개수, _sum은 관측값 합"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "지연", ("route",), buckets=(0.1, 0.5, 1.0))
+        for value in (0.05, 0.1, 0.3, 0.7, 2.0, 5.0):
+            histogram.observe(value, "/a")
+        histogram.observe(0.2, "/b")
+        metadata, samples = parse(registry.render())
+        assert metadata["latency_seconds"][1] == "histogram"
+        buckets = [(labels["le"], value) for name, labels, value in samples
+                   if name == "latency_seconds_bucket" and labels["route"] == "/a"]
+        assert buckets == [("0.1", 2), ("0.5", 3), ("1.0", 4), ("+Inf", 6)]
+        values = {(name, labels.get("route")): value for name, labels, value in samples if "le" not in labels}
+        assert values[("latency_seconds_count", "/a")] == 6
+        assert values[("latency_seconds_sum", "/a")] == pytest.approx(8.15)
+        assert values[("latency_seconds_count", "/b")] == 1
+        check_histograms(metadata, samples)
+
+    @pytest.mark.parametrize("value, escaped", [
+        ('say "hi"', r'say \"hi\"'),
+        ("C:\\saju", r"C:\\saju"),
+        ("line1\nline2", r"line1\nline2"),
+        ('\\"\n', r'\\\"\n'),
+        ("한글 라벨", "한글 라벨"),
+    ])
+    def test_label_escaping(self, value, escaped):
+        """라벨 값의 역슬래시, 큰따옴표, 줄바꿈은 이스케이프 (한 샘플은 한 줄)"""
+        registry = MetricsRegistry()
+        registry.counter("events_total", "이벤트", ("name", "other")).inc(value, "x")
+        text = registry.render()
+        assert f'events_total{{name="{escaped}",other="x"}} 1\n' in text
+        _, samples = parse(text)
+        assert samples == [("events_total", {"name": value, "other": "x"}, 1.0)]
+
+
+class TestMetricsEndpoint:
+    """/metrics 응답 테스트"""
+
+    def test_exposition(self):
+        """content-type 0.0.4, 모든 줄이 형식에 맞고 히스토그램은 누적, 요청이 집계됨"""
+        assert client.get("/saju/places").status_code == 200
+        client.post("/saju/analyze", json={
+            "birth_date": "1990-05-15", "birth_time": "14:30", "gender": "남", "birth_place": "서울"
+        })
+        with StageTimer("/test", 'stage "quoted"'):
+            pass
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        metadata, samples = parse(response.text)
+        for name in ("http_requests_total", "http_request_duration_seconds", "handler_stage_duration_seconds",
+                     "saju_calculations_total"):
+            assert name in metadata
+            assert metadata[name][0]
+        assert metadata["http_requests_total"][1] == "counter"
+        assert metadata["http_request_duration_seconds"][1] == "histogram"
+        check_histograms(metadata, samples)
+
+        places = [value for name, labels, value in samples if name == "http_requests_total"
+                  and labels == {"method": "GET", "route": "/saju/places", "status": "200"}]
+        assert places and places[0] >= 1
+        stages = [labels for name, labels, _ in samples if name == "handler_stage_duration_seconds_count"]
+        assert {"route": "/test", "stage": 'stage "quoted"'} in stages
+        assert handler_stage_duration_seconds.count("/test", 'stage "quoted"') >= 1
+
+    def test_not_counted_itself(self):
+        """/metrics 요청은 http_requests_total에 넣지 않음"""
+        client.get("/metrics")
+        _, samples = parse(client.get("/metrics").text)
+        assert not any(labels.get("route") == "/metrics" for _, labels, _ in samples)
@@ -0,0 +1,177 @@
+# tests/test_page_cache.py
+# 페이지/정적 파일 캐시: Accept-Encoding q 값에 따른 변형 선택(br;q=0, gzip;q=0, *),
+# ETag/If-None-Match·If-Modified-Since 조건부 요청의 304, Vary 헤더, 파일 수정 시 재렌더링을 확인한다.
+import gzip
+import os
+import time
+import pytest
+from email.utils import formatdate
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from fastapi.testclient import TestClient
+from main import app
+from page_cache import CachedAsset, CachedStaticFiles, PageCache, choose_encoding, is_not_modified
+
+BODY = ("<p>사주 분석</p>\n" * 100).encode("utf-8")
+
+
+@pytest.fixture
+def asset():
+    """gzip보다 br이 작은 미리 압축된 변형이 있는 파일"""
+    return CachedAsset("page.html", "text/html", 1700000000.0, BODY,
+                       precompressed={"gzip": gzip.compress(BODY, mtime=0), "br": b"br"})
+
+
+@pytest.fixture
+def static_client(tmp_path):
+    """tmp_path를 /static으로 서빙하는 앱 (page.html + 미리 압축된 .gz/.br)"""
+    (tmp_path / "page.html").write_bytes(BODY)
+    (tmp_path / "page.html.gz").write_bytes(gzip.compress(BODY, mtime=0))
+    (tmp_path / "page.html.br").write_bytes(b"br")
+    (tmp_path / "small.txt").write_bytes(b"small")
+    static = CachedStaticFiles(str(tmp_path), PageCache(check_interval=0))
+    return TestClient(Starlette(routes=[Mount("/static", static)]))
+
+
+class TestChooseEncoding:
+    """Accept-Encoding 협상 테스트"""
+
+    @pytest.mark.parametrize("header, expected", [
+        ("", "identity"),
+        ("identity", "identity"),
+        ("gzip", "gzip"),
+        ("gzip, br", "br"),                     # 둘 다 되면 더 작은 변형
+        ("GZIP, BR", "br"),
+        ("br;q=0, gzip", "gzip"),               # q=0은 거절
+        ("br; q=0.0, gzip;q=0.5", "gzip"),
+        ("gzip;q=0, br;q=0", "identity"),
+        ("gzip;q=0", "identity"),
+        ("gzip;q=abc", "identity"),             # 잘못된 q는 0
+        ("*", "br"),                            # 목록에 없는 인코딩은 *의 q 값
+        ("*;q=0", "identity"),
+        ("br;q=0, *", "gzip"),
+        ("gzip;q=0, *", "br"),
+        ("gzip, *;q=0", "gzip"),
+        ("deflate", "identity"),
+    ])
+    def test_q_values(self, asset, header, expected):
+        assert choose_encoding(asset, header) == expected
+
+    def test_missing_variant(self):
+        """작은 파일은 압축본이 없어 항상 identity"""
+        small = CachedAsset("small.txt", "text/plain", 0.0, b"small")
+        assert set(small.variants) == {"identity"}
+        assert choose_encoding(small, "br, gzip, *") == "identity"
+
+
+class TestConditional:
+    """조건부 요청 판정 테스트"""
+
+    @pytest.mark.parametrize("if_none_match, expected", [
+        ('"{etag}"', True),
+        ('W/"{etag}"', True),                   # 압축본에 준 약한 ETag
+        ('"other", "{etag}"', True),
+        ('*', True),
+        ('"other"', False),
+    ])
+    def test_if_none_match(self, asset, if_none_match, expected):
+        headers = {"if-none-match": if_none_match.format(etag=asset.etag)}
+        assert is_not_modified(asset, headers) is expected
+
+    def test_if_none_match_wins(self, asset):
+        """If-None-Match가 있으면 If-Modified-Since는 보지 않음"""
+        headers = {"if-none-match": '"other"', "if-modified-since": formatdate(asset.mtime + 60, usegmt=True)}
+        assert not is_not_modified(asset, headers)
+
+    @pytest.mark.parametrize("offset, expected", [(0, True), (60, True), (-60, False)])
+    def test_if_modified_since(self, asset, offset, expected):
+        headers = {"if-modified-since": formatdate(asset.mtime + offset, usegmt=True)}
+        assert is_not_modified(asset, headers) is expected
+
+    def test_bad_date(self, asset):
+        assert not is_not_modified(asset, {"if-modified-since": "어제"})
+
+
+class TestResponses:
+    """CachedStaticFiles 응답 헤더 테스트"""
+
+    def test_variants_and_etag(self, static_client):
+        """원본은 강한 ETag, 압축본은 같은 해시의 약한 ETag, 항상 Vary: Accept-Encoding"""
+        plain = static_client.get("/static/page.html", headers={"Accept-Encoding": "identity"})
+        assert plain.status_code == 200
+        assert "content-encoding" not in plain.headers
+        assert plain.content == BODY
+        assert plain.headers["vary"] == "Accept-Encoding"
+        etag = plain.headers["etag"]
+        assert etag.startswith('"')
+
+        gzipped = static_client.get("/static/page.html", headers={"Accept-Encoding": "br;q=0, gzip"})
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert gzipped.headers["etag"] == f"W/{etag}"
+        assert gzipped.headers["vary"] == "Accept-Encoding"
+
+        brotli = static_client.get("/static/page.html", headers={"Accept-Encoding": "*"})
+        assert brotli.headers["content-encoding"] == "br"
+        assert brotli.headers["content-length"] == "2"
+
+    @pytest.mark.parametrize("accept_encoding", ["identity", "gzip"])
+    def test_not_modified(self, static_client, accept_encoding):
+        """받은 ETag를 If-None-Match로 보내면 본문 없는 304 (ETag/Vary/Cache-Control 유지)"""
+        headers = {"Accept-Encoding": accept_encoding}
+        first = static_client.get("/static/page.html", headers=headers)
+        second = static_client.get("/static/page.html", headers={**headers, "If-None-Match": first.headers["etag"]})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert "content-encoding" not in second.headers
+        for name in ("etag", "vary", "cache-control", "last-modified"):
+            assert second.headers[name] == first.headers[name]
+
+    def test_if_modified_since(self, static_client):
+        first = static_client.get("/static/page.html")
+        second = static_client.get("/static/page.html", headers={"If-Modified-Since": first.headers["last-modified"]})
+        assert second.status_code == 304
+
+    def test_not_found_and_method(self, static_client):
+        """없는 파일은 404, GET/HEAD 외에는 405"""
+        assert static_client.get("/static/missing.html").status_code == 404
+        assert static_client.post("/static/page.html").status_code == 405
+
+    def test_outside_directory(self, tmp_path):
+        """디렉터리 밖을 가리키는 경로는 404"""
+        (tmp_path / "secret.txt").write_bytes(b"secret")
+        (tmp_path / "public").mkdir()
+        static = CachedStaticFiles(str(tmp_path / "public"))
+        assert static.resolve("../secret.txt") is None
+        assert static.get_response("../secret.txt", {}).status_code == 404
+
+
+class TestReload:
+    """파일 수정 시 재렌더링 테스트"""
+
+    def test_changed_file(self, tmp_path):
+        """수정 시각이 바뀌면 새 내용과 새 ETag, 이전 ETag로는 200"""
+        path = tmp_path / "page.html"
+        path.write_bytes(BODY)
+        cache = PageCache(check_interval=0.001)
+        old = cache.register("page", str(path), transform=lambda text: text.replace("사주", "四柱"))
+        assert "四柱".encode("utf-8") in old.variants["identity"]
+        path.write_bytes(b"<p>new</p>")
+        os.utime(path, (old.mtime + 10, old.mtime + 10))
+        time.sleep(0.01)
+        new = cache.get("page")
+        assert new.variants["identity"] == b"<p>new</p>"
+        assert new.etag != old.etag
+        assert not is_not_modified(new, {"if-none-match": f'"{old.etag}"'})
+
+
+class TestPages:
+    """앱 페이지 조건부 요청 테스트"""
+
+    @pytest.mark.parametrize("path", ["/chat", "/saju/analysis"])
+    def test_page_304(self, path):
+        client = TestClient(app)
+        first = client.get(path)
+        assert first.status_code == 200
+        assert first.headers["vary"] == "Accept-Encoding"
+        second = client.get(path, headers={"If-None-Match": first.headers["etag"]})
+        assert second.status_code == 304
@@ -0,0 +1,232 @@
+# tests/test_request_guard.py
+# 요청 보호: 같은 키 동시 요청이 계산 한 번을 나눠 받는지(RequestCoalescer, CoalescingMiddleware),
+# 토큰 버킷 계산과 한도 초과 시 429 + Retry-After 응답(RateLimiter, RateLimitMiddleware)을 확인한다.
+import asyncio
+import json
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from request_guard import (
+    RATE_LIMITED_BODY, CoalescingMiddleware, RateLimiter, RateLimitMiddleware, RequestCoalescer
+)
+
+CONCURRENCY = 20
+
+
+class TestRequestCoalescer:
+    """같은 키 작업 공유 테스트"""
+
+    def test_concurrent_callers_share_one_computation(self):
+        """같은 키 동시 호출 N개 → factory 한 번, 모두 같은 결과 (하나만 공유 아님)"""
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 42}
+
+        async def main():
+            return await asyncio.gather(*(coalescer.run("key", factory) for _ in range(CONCURRENCY)))
+
+        results = asyncio.run(main())
+        assert len(calls) == 1
+        assert all(result is results[0][0] for result, _ in results)
+        assert sorted(shared for _, shared in results) == [False] + [True] * (CONCURRENCY - 1)
+        assert coalescer.stats() == {"in_flight": 0, "leaders": 1, "followers": CONCURRENCY - 1}
+
+    def test_different_keys_run_separately(self):
+        """키가 다르면 따로 계산"""
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def main():
+            async def factory(key):
+                calls.append(key)
+                return key
+            return await asyncio.gather(*(coalescer.run(key, lambda key=key: factory(key)) for key in "abc"))
+
+        assert asyncio.run(main()) == [("a", False), ("b", False), ("c", False)]
+        assert calls == ["a", "b", "c"]
+
+    def test_exception_shared(self):
+        """작업이 실패하면 기다리던 호출 모두 같은 예외"""
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise ValueError("실패")
+
+        async def main():
+            return await asyncio.gather(
+                *(coalescer.run("key", factory) for _ in range(CONCURRENCY)), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert len(calls) == 1
+        assert all(isinstance(result, ValueError) for result in results)
+        assert coalescer.stats()["in_flight"] == 0
+
+    def test_sequential_calls_not_shared(self):
+        """앞 작업이 끝난 뒤 온 호출은 다시 계산"""
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            return len(calls)
+
+        async def main():
+            return [await coalescer.run("key", factory) for _ in range(3)]
+
+        assert asyncio.run(main()) == [(1, False), (2, False), (3, False)]
+
+
+class TestCoalescingMiddleware:
+    """본문이 같은 동시 POST 합치기 테스트"""
+
+    def _middleware(self, calls):
+        async def app(scope, receive, send):
+            message = await receive()
+            calls.append(message["body"])
+            await asyncio.sleep(0.01)
+            body = json.dumps({"echo": message["body"].decode(), "call": len(calls)}).encode()
+            await send({"type": "http.response.start", "status": 200,
+                        "headers": [(b"content-type", b"application/json")]})
+            await send({"type": "http.response.body", "body": body})
+
+        return CoalescingMiddleware(app, RequestCoalescer(), routes=["/saju/analyze"])
+
+    def _request(self, middleware, body, path="/saju/analyze"):
+        scope = {"type": "http", "method": "POST", "path": path,
+                 "headers": [(b"content-type", b"application/json")]}
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        async def run():
+            await middleware(scope, receive, send)
+            return messages
+
+        return run()
+
+    def test_same_body_shares_response(self):
+        """같은 본문 동시 요청 N개 → 앱 실행 한 번, 모두 같은 응답 바이트"""
+        calls = []
+        middleware = self._middleware(calls)
+
+        async def main():
+            return await asyncio.gather(*(self._request(middleware, b'{"a": 1}') for _ in range(CONCURRENCY)))
+
+        responses = asyncio.run(main())
+        assert len(calls) == 1
+        assert all(messages == responses[0] for messages in responses)
+        assert responses[0][0]["status"] == 200
+        assert middleware.coalescer.stats()["followers"] == CONCURRENCY - 1
+
+    def test_different_body_or_route(self):
+        """본문이 다르거나 대상 라우트가 아니면 각각 실행"""
+        calls = []
+        middleware = self._middleware(calls)
+
+        async def main():
+            return await asyncio.gather(
+                self._request(middleware, b'{"a": 1}'),
+                self._request(middleware, b'{"a": 2}'),
+                self._request(middleware, b'{"a": 1}', path="/saju/other"),
+            )
+
+        asyncio.run(main())
+        assert len(calls) == 3
+
+
+class TestRateLimiter:
+    """토큰 버킷 계산 테스트"""
+
+    def test_burst_then_limited(self):
+        """burst개까지 허용, 다음 요청은 다음 토큰까지 남은 시간"""
+        limiter = RateLimiter(rate=2.0, burst=3)
+        assert [limiter.acquire("a", now=0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.acquire("a", now=0.0) == pytest.approx(0.5)
+        assert limiter.acquire("a", now=0.25) == pytest.approx(0.25)
+        assert limiter.stats()["allowed"] == 3
+        assert limiter.stats()["limited"] == 2
+
+    def test_refill(self):
+        """초당 rate개 충전, burst를 넘지 않음"""
+        limiter = RateLimiter(rate=2.0, burst=3)
+        for _ in range(3):
+            limiter.acquire("a", now=0.0)
+        assert limiter.acquire("a", now=0.5) == 0.0
+        assert limiter.acquire("a", now=0.5) > 0
+        # 오래 쉬어도 burst개까지만
+        assert [limiter.acquire("a", now=100.0) for _ in range(4)][-1] > 0
+
+    def test_clients_separate(self):
+        """클라이언트마다 따로 셈"""
+        limiter = RateLimiter(rate=1.0, burst=1)
+        assert limiter.acquire("a", now=0.0) == 0.0
+        assert limiter.acquire("a", now=0.0) > 0
+        assert limiter.acquire("b", now=0.0) == 0.0
+
+    def test_max_clients(self):
+        """버킷은 최근 사용 순으로 max_clients개만 보관"""
+        limiter = RateLimiter(rate=1.0, burst=1, max_clients=2)
+        for client in "abc":
+            limiter.acquire(client, now=0.0)
+        assert limiter.stats()["clients"] == 2
+        assert limiter.stats()["evictions"] == 1
+        # 버려진 a는 가득 찬 버킷으로 다시 시작
+        assert limiter.acquire("a", now=0.0) == 0.0
+
+    def test_disabled(self):
+        """rate가 0이면 사용 안 함"""
+        assert not RateLimiter(rate=0).enabled
+
+
+class TestRateLimitMiddleware:
+    """429 응답 테스트"""
+
+    def _client(self, limiter, trust_forwarded=False):
+        app = FastAPI()
+
+        @app.post("/saju/analyze")
+        async def analyze():
+            return {"status": "success"}
+
+        @app.get("/health")
+        async def health():
+            return {"status": "ok"}
+
+        app.add_middleware(
+            RateLimitMiddleware, limiter=limiter, routes=["/saju/analyze"], trust_forwarded=trust_forwarded
+        )
+        return TestClient(app)
+
+    def test_limited_response(self):
+        """burst 초과 시 429 + Retry-After + 오류 본문"""
+        client = self._client(RateLimiter(rate=0.5, burst=2))
+        assert [client.post("/saju/analyze").status_code for _ in range(2)] == [200, 200]
+        response = client.post("/saju/analyze")
+        assert response.status_code == 429
+        assert int(response.headers["retry-after"]) in (1, 2)
+        assert response.content == RATE_LIMITED_BODY
+        assert response.json()["status"] == "error"
+
+    def test_other_routes_not_limited(self):
+        """대상 라우트가 아니면 제한 없음"""
+        client = self._client(RateLimiter(rate=0.5, burst=1))
+        assert all(client.get("/health").status_code == 200 for _ in range(5))
+
+    def test_forwarded_client(self):
+        """trust_forwarded면 X-Forwarded-For 첫 주소별로 셈"""
+        client = self._client(RateLimiter(rate=0.5, burst=1), trust_forwarded=True)
+        assert client.post("/saju/analyze", headers={"X-Forwarded-For": "10.0.0.1, 10.0.0.9"}).status_code == 200
+        assert client.post("/saju/analyze", headers={"X-Forwarded-For": "10.0.0.1"}).status_code == 429
+        assert client.post("/saju/analyze", headers={"X-Forwarded-For": "10.0.0.2"}).status_code == 200
@@ -0,0 +1,91 @@
+# tests/test_request_validation.py
+# 요청 검증: 출생일/시각은 API 요청과 배치 행이 같은 엄격한 형식(YYYY-MM-DD, HH:MM)으로만 파싱되는지,
+# 잘못된 값은 422(배치는 그 행만 error)로 거절되는지 확인한다.
+import json
+import pytest
+from datetime import date, time
+from fastapi.testclient import TestClient
+from main import app
+from saju_calculator import parse_birth_date, parse_birth_time
+
+client = TestClient(app)
+
+BAD_DATES = ["1990-5-15", " 1990-05-15", "1990-05-15 ", "1990_05_15", "19900515", "1990-02-30",
+             "1990-05-15T00:00", "١٩٩٠-٠٥-١٥", 0, 19900515, None]
+BAD_TIMES = ["14:30:00", "14:30+05:00", "14:30Z", "4:30", "1_0:30", " 14:30", "24:00", "14:60", "1430",
+             52200, 14.5, None]
+
+
+def _detailed(birth_date="1990-05-15", birth_time="14:30"):
+    return client.post("/saju/detailed", json={
+        "birth_date": birth_date,
+        "birth_time": birth_time,
+        "gender": "남",
+        "birth_place": "서울"
+    })
+
+
+class TestParsers:
+    """공용 파서 테스트"""
+
+    def test_valid(self):
+        """정확한 형식은 date/time으로"""
+        assert parse_birth_date("1990-05-15") == date(1990, 5, 15)
+        assert parse_birth_time("00:00") == time(0, 0)
+        assert parse_birth_time("23:59") == time(23, 59)
+
+    @pytest.mark.parametrize("value", BAD_DATES)
+    def test_bad_date(self, value):
+        with pytest.raises(ValueError):
+            parse_birth_date(value)
+
+    @pytest.mark.parametrize("value", BAD_TIMES)
+    def test_bad_time(self, value):
+        with pytest.raises(ValueError):
+            parse_birth_time(value)
+
+
+class TestRequestValidation:
+    """API 요청 422 테스트"""
+
+    def test_valid_request(self):
+        assert _detailed().status_code == 200
+
+    @pytest.mark.parametrize("value", BAD_DATES)
+    def test_bad_date(self, value):
+        """형식이 다른 날짜, 숫자, 없는 날짜는 422"""
+        response = _detailed(birth_date=value)
+        assert response.status_code == 422
+        assert response.json()["error"].startswith("birth_date: ")
+
+    @pytest.mark.parametrize("value", BAD_TIMES)
+    def test_bad_time(self, value):
+        """초/오프셋이 붙은 시각, 숫자, 없는 시각은 422"""
+        response = _detailed(birth_time=value)
+        assert response.status_code == 422
+        assert response.json()["error"].startswith("birth_time: ")
+
+    def test_format_message(self):
+        """형식 오류와 없는 날짜는 안내 문구가 다름"""
+        assert _detailed(birth_date="1990-5-15").json()["error"] == "birth_date: YYYY-MM-DD 형식의 날짜여야 합니다."
+        assert _detailed(birth_date="1990-02-30").json()["error"] == "birth_date: 존재하지 않는 날짜입니다."
+        assert _detailed(birth_time="14:30:00").json()["error"] == "birth_time: HH:MM 형식의 시각이어야 합니다."
+
+    def test_year_range(self):
+        """지원 범위 밖 연도는 422"""
+        assert _detailed(birth_date="1800-01-01").status_code == 422
+
+
+class TestBatchRows:
+    """배치 행도 같은 규칙으로 거절되는지 테스트"""
+
+    def test_same_rules(self):
+        """API 요청에서 422인 값은 배치에서도 그 행만 error"""
+        bad_dates = [value for value in BAD_DATES if isinstance(value, str)]
+        bad_times = [value for value in BAD_TIMES if isinstance(value, str)]
+        birth_dates = ["1990-05-15"] + bad_dates + ["1990-05-15"] * len(bad_times)
+        birth_times = ["14:30"] + ["14:30"] * len(bad_dates) + bad_times
+        response = client.post("/saju/batch", json={"birth_dates": birth_dates, "birth_times": birth_times})
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["status"] for row in rows] == ["success"] + ["error"] * (len(rows) - 1)
@@ -0,0 +1,129 @@
+# tests/test_result_cache.py
+# 응답 캐시: 정규화된 출생 시각 키가 같으면 계산 결과도 같은지, 캐시 적중/만료/제거가 맞는지 확인한다.
+import pytest
+from fastapi.testclient import TestClient
+from main import app, saju_calculator
+from result_cache import ResultCache
+from solar_time import resolve_birth_time
+
+client = TestClient(app)
+
+# 서울 경도 (진태양시 보정 확인용)
+SEOUL_LONGITUDE = 126.978
+
+SAMPLE_DATES = (
+    (2024, 2, 4),    # 입춘 당일 (17:27 절입)
+    (2023, 12, 31),  # 연말 자시
+    (1990, 5, 15),
+    (1987, 5, 10),   # 서머타임 시행일
+)
+
+
+def _day_moments(year, month, day):
+    return [(year, month, day, hour, minute) for hour in range(24) for minute in range(60)]
+
+
+class TestCanonicalMoment:
+    """정규화 키 테스트"""
+
+    @pytest.mark.parametrize("moment_date", SAMPLE_DATES)
+    def test_same_key_same_pillars(self, moment_date):
+        """하루 1440분 중 키가 같은 시각은 여덟 글자가 모두 같음 (출생지 보정 없음)"""
+        pillars_by_key = {}
+        for moment in _day_moments(*moment_date):
+            key = saju_calculator.canonical_moment(*moment)
+            codes = saju_calculator.calculate_pillar_codes(*moment)
+            assert pillars_by_key.setdefault(key, codes) == codes, moment
+        # 시지 12개 + 절입으로 월지가 바뀌는 경우
+        assert len(pillars_by_key) <= 14
+
+    @pytest.mark.parametrize("moment_date", SAMPLE_DATES)
+    def test_same_key_same_pillars_solar(self, moment_date):
+        """진태양시 보정을 해도 키가 같으면 여덟 글자가 같음"""
+        pillars_by_key = {}
+        for moment in _day_moments(*moment_date):
+            standard, solar = resolve_birth_time(*moment, SEOUL_LONGITUDE)
+            key = saju_calculator.canonical_moment(*standard, solar=solar)
+            codes = saju_calculator.calculate_pillar_codes(*standard, solar=solar)
+            assert pillars_by_key.setdefault(key, codes) == codes, moment
+
+    def test_term_boundary_splits_key(self):
+        """같은 시지라도 절입 전후는 키가 다름"""
+        before = saju_calculator.canonical_moment(2024, 2, 4, 17, 26)
+        after = saju_calculator.canonical_moment(2024, 2, 4, 17, 27)
+        assert before != after
+        assert before[:4] == after[:4]
+
+    def test_minutes_in_same_hour_branch(self):
+        """같은 시지 안의 분은 같은 키"""
+        assert saju_calculator.canonical_moment(1990, 5, 15, 13, 0) == \
+            saju_calculator.canonical_moment(1990, 5, 15, 14, 59)
+        assert saju_calculator.canonical_moment(1990, 5, 15, 14, 59) != \
+            saju_calculator.canonical_moment(1990, 5, 15, 15, 0)
+
+
+class TestResultCache:
+    """LRU + TTL 캐시 테스트"""
+
+    def test_lru_eviction(self):
+        """가득 차면 가장 오래 쓰지 않은 항목 제거"""
+        cache = ResultCache(max_size=2, ttl_seconds=60)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        assert cache.get("a") == b"1"
+        cache.set("c", b"3")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiration(self):
+        """만료된 항목은 없는 것으로 봄"""
+        cache = ResultCache(max_size=2, ttl_seconds=0)
+        cache.set("a", b"1")
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+
+class TestAnalyzeCache:
+    """/saju/analyze, /saju/detailed 캐시 적중 테스트"""
+
+    def _post(self, route, birth_time):
+        response = client.post(route, json={
+            "birth_date": "1977-07-17",
+            "birth_time": birth_time,
+            "gender": "여",
+            "birth_place": "해외"
+        })
+        assert response.status_code == 200
+        return response.json()
+
+    @pytest.mark.parametrize("route", ["/saju/analyze", "/saju/detailed"])
+    def test_same_hour_branch_hits_cache(self, route):
+        """같은 시지의 다른 분은 캐시된 결과를 쓰고 출생일시 필드만 다름"""
+        hits = client.get("/saju/cache/stats").json()["hits"]
+        first = self._post(route, "13:10")
+        second = self._post(route, "14:50")
+        assert client.get("/saju/cache/stats").json()["hits"] == hits + 1
+        assert first.pop("birth_date") != second.pop("birth_date")
+        assert first == second
+
+    def test_different_hour_branch_misses_cache(self):
+        """시지가 다르면 다시 계산"""
+        misses = client.get("/saju/cache/stats").json()["misses"]
+        first = self._post("/saju/detailed", "16:10")
+        second = self._post("/saju/detailed", "17:10")
+        assert client.get("/saju/cache/stats").json()["misses"] == misses + 2
+        assert first["four_pillars"]["hour"] != second["four_pillars"]["hour"]
+
+    def test_term_day_same_hour_branch_misses_cache(self):
+        """같은 시지라도 절입(1977-07-07 소서) 전후면 다시 계산"""
+        misses = client.get("/saju/cache/stats").json()["misses"]
+        for birth_time in ("13:10", "14:50"):
+            response = client.post("/saju/detailed", json={
+                "birth_date": "1977-07-07",
+                "birth_time": birth_time,
+                "gender": "여",
+                "birth_place": "해외"
+            })
+            assert response.status_code == 200
+        assert client.get("/saju/cache/stats").json()["misses"] == misses + 2
@@ -0,0 +1,109 @@
+# tests/test_serialization.py
+# 기둥 객체 직렬화(to_dict)와 캐시 응답 조립(dump_json/prepend_fields)이
+# 기존 딕셔너리를 json.dumps 한 결과와 바이트 단위로 같은지 확인한다.
+import json
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from main import app, saju_calculator
+from result_cache import dump_json, prepend_fields
+from saju_calculator import EARTHLY_BRANCHES, HEAVENLY_STEMS, PILLARS, FourPillars
+
+client = TestClient(app)
+
+# 기존 계산기의 한자 표 (비교 기준)
+STEM_HANJA = {
+    '갑': '甲', '을': '乙', '병': '丙', '정': '丁', '무': '戊',
+    '기': '己', '경': '庚', '신': '辛', '임': '壬', '계': '癸'
+}
+BRANCH_HANJA = {
+    '자': '子', '축': '丑', '인': '寅', '묘': '卯', '진': '辰', '사': '巳',
+    '오': '午', '미': '未', '신': '申', '유': '酉', '술': '戌', '해': '亥'
+}
+
+PILLAR_NAMES = ('year', 'month', 'day', 'hour')
+
+
+def reference_pillar(stem, branch, day_stem=None):
+    """기존 방식 기둥 딕셔너리 (day_stem을 주면 /saju/detailed처럼 십성/한자 추가)"""
+    pillar = {'stem': stem, 'branch': branch, 'pillar': stem + branch}
+    if day_stem is not None:
+        pillar['ten_god'] = saju_calculator.calculate_ten_god(day_stem, stem)
+        pillar['stem_hanja'] = STEM_HANJA[stem]
+        pillar['branch_ten_god'] = saju_calculator.calculate_branch_ten_god(day_stem, branch)
+        pillar['branch_hanja'] = BRANCH_HANJA[branch]
+    return pillar
+
+
+def dumps(content):
+    return json.dumps(content, ensure_ascii=False).encode('utf-8')
+
+
+class TestPillarSerialization:
+    """기둥 직렬화 테스트"""
+
+    def test_all_pillars_all_day_stems(self):
+        """60갑자 기둥 × 일간 10개: 기본/상세 형식 모두 기존 딕셔너리와 같은 바이트"""
+        pillars = [pillar for row in PILLARS for pillar in row if pillar]
+        for day in range(10):
+            day_pillar = next(pillar for pillar in pillars if pillar.stem == day)
+            day_stem = HEAVENLY_STEMS[day]
+            for pillar in pillars:
+                four_pillars = FourPillars(pillar, pillar, day_pillar, pillar)
+                stem, branch = HEAVENLY_STEMS[pillar.stem], EARTHLY_BRANCHES[pillar.branch]
+                expected = {
+                    name: reference_pillar(*(
+                        (day_stem, EARTHLY_BRANCHES[day_pillar.branch]) if name == 'day' else (stem, branch)
+                    ))
+                    for name in PILLAR_NAMES
+                }
+                assert dumps(four_pillars.to_dict()) == dumps(expected)
+                detailed = {
+                    name: reference_pillar(value['stem'], value['branch'], day_stem)
+                    for name, value in expected.items()
+                }
+                assert dumps(four_pillars.to_dict(detailed=True)) == dumps(detailed)
+
+    def test_to_dict_returns_fresh_dicts(self):
+        """to_dict 결과를 고쳐도 공유 표는 바뀌지 않음"""
+        result = saju_calculator.calculate_saju(1990, 5, 15, 14, 30)
+        first = result.four_pillars.to_dict(detailed=True)
+        first['day']['ten_god'] = '변경'
+        assert result.four_pillars.to_dict(detailed=True)['day']['ten_god'] == '비견'
+
+    def test_saju_result_to_dict(self):
+        """SajuResult.to_dict: 기존 calculate_saju 딕셔너리 키 순서"""
+        result = saju_calculator.calculate_saju(1990, 5, 15, 14, 30)
+        assert list(result.to_dict()) == [
+            'five_element', 'day_stem', 'day_branch', 'day_pillar', 'four_pillars',
+            'pillar_codes', 'season', 'lunar_month'
+        ]
+
+
+class TestCachedBody:
+    """캐시 응답 바이트 조립 테스트"""
+
+    def test_dump_json_matches_json_response(self):
+        """dump_json = FastAPI JSONResponse 본문"""
+        content = {"five_element": "나무", "nested": {"list": [1, 2.5, None, True]}, "text": "따옴표\"와 줄바꿈\n"}
+        assert dump_json(content) == JSONResponse(content=content).body
+
+    def test_prepend_fields(self):
+        """앞에 붙인 필드 + 캐시 본문 = 전체 딕셔너리 직렬화"""
+        fields = {"status": "success", "birth_date": "1990년 5월 15일 14시 30분", "true_solar_time": None}
+        body = {"gender": "남", "four_pillars": {"day": {"stem": "경"}}}
+        assert prepend_fields(fields, dump_json(body)) == dump_json({**fields, **body})
+
+
+class TestResponseBytes:
+    """API 응답 바이트 테스트"""
+
+    @pytest.mark.parametrize("route", ["/saju/analyze", "/saju/detailed"])
+    def test_computed_and_cached_responses(self, route):
+        """계산 응답과 캐시 응답 모두 JSONResponse로 직렬화한 바이트와 같음"""
+        payload = {"birth_date": "1969-08-21", "birth_time": "06:40", "gender": "남", "birth_place": "부산"}
+        computed = client.post(route, json=payload)
+        cached = client.post(route, json=payload)
+        assert computed.status_code == cached.status_code == 200
+        assert computed.content == JSONResponse(content=computed.json()).body
+        assert cached.content == computed.content
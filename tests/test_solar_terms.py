@@ -0,0 +1,135 @@
+# tests/test_solar_terms.py
+# 절기 엔진: 알려진 절입 시각(한국천문연구원 발표, 한국 표준시)과 비교하고,
+# 만세력 테이블 값이 천문 계산 결과와, 일주가 율리우스 적일 기준 일진과 같은지 확인한다.
+import pytest
+from datetime import date, timedelta
+from fastapi.testclient import TestClient
+from main import app
+from saju_calendar import open_shared_calendar
+from saju_calculator import EARTHLY_BRANCHES, HEAVENLY_STEMS, SajuCalculator
+from solar_terms import (
+    SOLAR_TERM_NAMES, compute_solar_terms, minutes_to_datetime_tuple, month_branch_index
+)
+
+client = TestClient(app)
+
+IPCHUN = SOLAR_TERM_NAMES.index('입춘')
+GYEONGCHIP = SOLAR_TERM_NAMES.index('경칩')
+
+
+class TestSolarTermInstants:
+    """절입 시각 테스트"""
+
+    @pytest.mark.parametrize("year, expected", [
+        (1990, (1990, 2, 4, 11, 14)),
+        (2000, (2000, 2, 4, 21, 40)),
+        (2023, (2023, 2, 4, 11, 43)),
+        (2024, (2024, 2, 4, 17, 27)),
+    ])
+    def test_ipchun(self, year, expected):
+        """입춘 시각이 발표값과 분 단위로 같음"""
+        assert minutes_to_datetime_tuple(compute_solar_terms(year)[IPCHUN]) == expected
+
+    @pytest.mark.parametrize("year, expected", [
+        (1990, (1990, 3, 6, 5, 19)),
+        (2000, (2000, 3, 5, 15, 43)),
+        (2023, (2023, 3, 6, 5, 36)),
+        (2024, (2024, 3, 5, 11, 23)),
+    ])
+    def test_gyeongchip(self, year, expected):
+        """경칩 시각이 발표값과 분 단위로 같음"""
+        assert minutes_to_datetime_tuple(compute_solar_terms(year)[GYEONGCHIP]) == expected
+
+    def test_month_branch_at_ipchun(self):
+        """입춘 직전은 전년도 축월, 입춘 시각부터 새해 인월"""
+        assert month_branch_index(2024, 2, 4, 17, 26) == (1, 2023)
+        assert month_branch_index(2024, 2, 4, 17, 27) == (2, 2024)
+
+
+class TestCalendarTable:
+    """만세력 테이블 = 천문 계산 테스트"""
+
+    def test_table_terms_equal_computed(self):
+        """테이블 범위 모든 연도의 24절기가 계산값과 같음"""
+        calendar = open_shared_calendar()
+        for year in range(calendar.start_year, calendar.end_year + 1):
+            assert calendar.solar_terms(year) == compute_solar_terms(year), year
+
+    def test_table_month_branch_equal_computed(self):
+        """테이블 범위 모든 날짜의 0시 월지가 계산값과 같음"""
+        calendar = open_shared_calendar()
+        day = date(calendar.start_year, 1, 1)
+        end = date(calendar.end_year, 12, 31)
+        while day <= end:
+            _, branch, _ = calendar.lookup(day.year, day.month, day.day)
+            assert branch == month_branch_index(day.year, day.month, day.day)[0], day
+            day += timedelta(days=1)
+
+    def test_out_of_range_year(self):
+        """테이블 범위 밖 연도는 None (계산으로 대체)"""
+        calendar = open_shared_calendar()
+        assert calendar.solar_terms(calendar.start_year - 1) is None
+
+
+class TestDayPillar:
+    """일주(일진) 테스트: 율리우스 적일(JDN) 기준 (JDN + 49) % 60 = 60갑자 인덱스"""
+
+    @staticmethod
+    def jdn_index(day):
+        return (day.toordinal() + 1721425 + 49) % 60
+
+    @pytest.mark.parametrize("day, expected", [
+        (date(1899, 12, 31), "계유"),   # 테이블 범위 밖 (직접 계산)
+        (date(1900, 1, 1), "갑술"),
+        (date(1949, 10, 1), "갑자"),
+        (date(1984, 2, 2), "병인"),
+        (date(2000, 1, 1), "무오"),
+        (date(2024, 2, 10), "갑진"),
+        (date(2100, 12, 31), "정미"),
+        (date(2101, 1, 1), "무신"),     # 테이블 범위 밖 (직접 계산)
+    ])
+    def test_known_days(self, day, expected):
+        """알려진 일진과 같음 (테이블 조회와 직접 계산 모두)"""
+        for calculator in (SajuCalculator(), SajuCalculator(load_calendar=False)):
+            index = calculator._day_index(day.year, day.month, day.day)
+            assert HEAVENLY_STEMS[index % 10] + EARTHLY_BRANCHES[index % 12] == expected
+            assert index == self.jdn_index(day)
+
+    def test_table_equal_jdn(self):
+        """테이블 범위 모든 날짜의 일주 인덱스가 JDN 공식과 같음"""
+        calendar = open_shared_calendar()
+        day = date(calendar.start_year, 1, 1)
+        end = date(calendar.end_year, 12, 31)
+        while day <= end:
+            assert calendar.lookup(day.year, day.month, day.day)[0] == self.jdn_index(day), day
+            day += timedelta(days=1)
+
+    def test_detailed_day_pillar(self):
+        """/saju/detailed 일주 (2000-01-01 정오 = 무오일)"""
+        response = client.post("/saju/detailed", json={
+            "birth_date": "2000-01-01", "birth_time": "12:00", "gender": "남", "birth_place": "서울"
+        })
+        assert response.json()["day_pillar"] == "무오"
+
+
+class TestDetailedAtTermBoundary:
+    """절입 경계의 /saju/detailed 테스트 (출생지 보정 없는 지명)"""
+
+    def _pillars(self, birth_time):
+        response = client.post("/saju/detailed", json={
+            "birth_date": "2024-02-04",
+            "birth_time": birth_time,
+            "gender": "남",
+            "birth_place": "해외"
+        })
+        assert response.status_code == 200
+        four_pillars = response.json()["four_pillars"]
+        return four_pillars["year"]["pillar"], four_pillars["month"]["pillar"]
+
+    def test_before_ipchun(self):
+        """입춘 1분 전은 계묘년 을축월"""
+        assert self._pillars("17:26") == ("계묘", "을축")
+
+    def test_after_ipchun(self):
+        """입춘 시각은 갑진년 병인월"""
+        assert self._pillars("17:27") == ("갑진", "병인")
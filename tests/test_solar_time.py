@@ -0,0 +1,140 @@
+# tests/test_solar_time.py
+# 진태양시 변환: 한국 표준시 변천(1908, 1912, 1954, 1961)과 서머타임(1948~1960, 1987~1988) 경계,
+# IANA tz 데이터베이스(Asia/Seoul)와의 일치 여부, /saju/detailed 시주 반영을 확인한다.
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi.testclient import TestClient
+from main import app
+from solar_terms import minutes_to_datetime_tuple, moment_minutes
+from solar_time import KOREA_TIME_PERIODS, resolve_birth_time, utc_offset
+
+client = TestClient(app)
+
+
+def offset_at(year, month, day, hour, minute):
+    return utc_offset(moment_minutes(year, month, day, hour, minute))
+
+
+class TestKoreaTimeHistory:
+    """표준시 변천 경계 테스트"""
+
+    def test_before_standard_time(self):
+        """1908년 4월 1일 0시 이전은 지방평균시"""
+        assert offset_at(1908, 3, 31, 23, 59) is None
+
+    def test_standard_time_1908(self):
+        """1908년 4월 1일 0시(현지)부터 UTC+8:30"""
+        assert offset_at(1908, 4, 1, 0, 0) == (510, False)
+        assert offset_at(1911, 12, 31, 23, 59) == (510, False)
+
+    def test_standard_time_1912(self):
+        """1912년 1월 1일부터 UTC+9"""
+        assert offset_at(1912, 1, 1, 0, 30) == (540, False)
+
+    def test_standard_time_1954(self):
+        """1954년 3월 21일 0시에 UTC+8:30으로 (시계를 30분 되돌림, 겹치는 시각은 앞쪽)"""
+        assert offset_at(1954, 3, 20, 23, 0) == (540, False)
+        assert offset_at(1954, 3, 20, 23, 45) == (540, False)
+        assert offset_at(1954, 3, 21, 0, 0) == (510, False)
+        assert resolve_birth_time(1954, 3, 21, 12, 0)[0] == (1954, 3, 21, 12, 30)
+
+    def test_standard_time_1961(self):
+        """1961년 8월 10일 0시에 UTC+9로"""
+        assert offset_at(1961, 8, 9, 23, 59) == (510, False)
+        assert offset_at(1961, 8, 10, 0, 30) == (540, False)
+
+
+class TestDaylightSaving:
+    """서머타임 경계 테스트 (1987년: 5월 10일 2시 → 3시, 10월 11일 3시 → 2시)"""
+
+    def test_dst_start(self):
+        """시작 직전은 표준시, 건너뛴 2시대는 서머타임으로 봄"""
+        assert offset_at(1987, 5, 10, 1, 59) == (540, False)
+        assert offset_at(1987, 5, 10, 2, 30) == (600, True)
+        assert offset_at(1987, 5, 10, 3, 0) == (600, True)
+
+    def test_dst_end(self):
+        """두 번 있는 2시대는 서머타임 쪽, 3시부터 표준시"""
+        assert offset_at(1987, 10, 11, 2, 30) == (600, True)
+        assert offset_at(1987, 10, 11, 3, 0) == (540, False)
+
+    def test_dst_resolved_to_standard(self):
+        """서머타임 시각은 한 시간 빼서 한국 표준시로 (출생지가 없으면 진태양시도 같은 값)"""
+        assert resolve_birth_time(1987, 7, 1, 14, 0) == ((1987, 7, 1, 13, 0), (1987, 7, 1, 13, 0))
+        assert resolve_birth_time(1986, 7, 1, 14, 0) == ((1986, 7, 1, 14, 0), (1986, 7, 1, 14, 0))
+
+    def test_1950s_dst_on_utc_830(self):
+        """1955~1960년 서머타임은 UTC+9:30"""
+        assert offset_at(1955, 7, 1, 12, 0) == (570, True)
+        assert resolve_birth_time(1955, 7, 1, 12, 0)[0] == (1955, 7, 1, 11, 30)
+
+
+class TestMatchesTzDatabase:
+    """IANA tz 데이터베이스 비교 테스트"""
+
+    def test_offsets_match_zoneinfo(self):
+        """1908~1995년 6시간 간격, 각 전환 전후 3시간은 10분 간격 시각의 UTC 오프셋이 Asia/Seoul과 같음
+        (되돌린 시계로 두 번 있는 시각의 뒤쪽은 제외)"""
+        zoneinfo = pytest.importorskip("zoneinfo")
+        try:
+            seoul = zoneinfo.ZoneInfo("Asia/Seoul")
+        except zoneinfo.ZoneInfoNotFoundError:
+            pytest.skip("tz 데이터베이스 없음")
+
+        # 지방평균시(LMT) 구간은 비교하지 않음
+        start = datetime(1908, 4, 1, tzinfo=timezone.utc)
+        moments = [start + timedelta(hours=hours) for hours in range(0, 87 * 366 * 24, 6)]
+        for period_start, _, _ in KOREA_TIME_PERIODS:
+            year, month, day, hour, minute = minutes_to_datetime_tuple(period_start)
+            transition = datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+            moments.extend(transition + timedelta(minutes=minutes) for minutes in range(-180, 181, 10))
+
+        for moment in moments:
+            local = moment.astimezone(seoul)
+            if moment >= start and not local.fold:
+                expected = int(local.utcoffset().total_seconds() // 60)
+                assert offset_at(local.year, local.month, local.day, local.hour, local.minute)[0] == expected, local
+
+
+class TestDetailedHourPillar:
+    """서머타임이 /saju/detailed 시주에 반영되는지 테스트"""
+
+    def _hour_branch(self, birth_date):
+        response = client.post("/saju/detailed", json={
+            "birth_date": birth_date,
+            "birth_time": "14:00",
+            "gender": "남",
+            "birth_place": "서울"
+        })
+        assert response.status_code == 200
+        return response.json()["four_pillars"]["hour"]["branch"]
+
+    def test_dst_moves_hour_branch(self):
+        """서울 14시: 서머타임(1987)이면 진태양시 12시대(오시), 아니면 13시대(미시)"""
+        assert self._hour_branch("1987-07-01") == "오"
+        assert self._hour_branch("1986-07-01") == "미"
+
+
+class TestBatchMatchesDetailed:
+    """/saju/batch도 /saju/detailed와 같은 표준시/서머타임 보정을 하는지 테스트"""
+
+    @pytest.mark.parametrize("birth_date, birth_time", [
+        ("1987-07-01", "00:30"),   # 서머타임 (자정 넘김 → 전날 일주)
+        ("1955-06-05", "23:40"),   # UTC+8:30 시기 서머타임
+        ("1958-02-04", "16:30"),   # UTC+8:30 시계 16:30 = 표준시 17:00, 입춘(16:49) 이후
+    ])
+    def test_same_pillars(self, birth_date, birth_time):
+        """출생지 보정 없는 상세 분석과 배치의 네 기둥이 같음"""
+        detailed = client.post("/saju/detailed", json={
+            "birth_date": birth_date,
+            "birth_time": birth_time,
+            "gender": "남",
+            "birth_place": "해외"
+        })
+        assert detailed.status_code == 200
+        batch = client.post("/saju/batch", json={"birth_dates": [birth_date], "birth_times": [birth_time]})
+        assert batch.status_code == 200
+        row = json.loads(batch.text)
+        expected = {name: pillar["pillar"] for name, pillar in detailed.json()["four_pillars"].items()}
+        assert row["four_pillars"] == expected
@@ -0,0 +1,155 @@
+# tests/test_startup.py
+# 기동/준비 상태: 준비 작업이 끝나기 전 /ready는 503, 끝나면 200인지,
+# Lazy 초기화 함수가 동시에 불려도 한 번만 실행되는지, 준비 작업의 실패/프로세스별 재실행을 확인한다.
+import threading
+import time
+import pytest
+from fastapi.testclient import TestClient
+import main
+from startup import Lazy, Warmup
+
+THREADS = 16
+
+
+class TestReady:
+    """/ready 준비 상태 테스트"""
+
+    def test_503_until_warm(self, monkeypatch):
+        """기동 후 준비 작업이 도는 동안 503(warming), 끝나면 200(ready)과 작업별 시간"""
+        release = threading.Event()
+        warmup = Warmup()
+        warmup.add("fast", lambda: None)
+        warmup.add("slow", release.wait)
+        monkeypatch.setattr(main, "warmup", warmup)
+
+        with TestClient(main.app) as client:
+            warming = client.get("/ready")
+            assert warming.status_code == 503
+            assert warming.json()["status"] == "warming"
+            assert warming.json()["warmup_ms"]["slow"] is None
+
+            release.set()
+            warmup._thread.join(timeout=10)
+            ready = client.get("/ready")
+            assert ready.status_code == 200
+            data = ready.json()
+            assert data["status"] == "ready"
+            assert set(data["warmup_ms"]) == {"fast", "slow"}
+            assert all(value is not None for value in data["warmup_ms"].values())
+            assert data["warmup_errors"] == {}
+            assert "startup" in data["startup_ms"]
+
+    def test_failed_task_still_ready(self, monkeypatch):
+        """실패한 준비 작업은 오류를 남기고 완료로 봄 (첫 사용 때 다시 만들어짐)"""
+        def broken():
+            raise RuntimeError("표 없음")
+
+        warmup = Warmup()
+        warmup.add("broken", broken)
+        monkeypatch.setattr(main, "warmup", warmup)
+        client = TestClient(main.app)
+        assert client.get("/ready").status_code == 503
+        warmup.run()
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["warmup_errors"] == {"broken": "표 없음"}
+
+    def test_app_warmup(self):
+        """앱의 실제 준비 작업이 모두 끝나면 200"""
+        main.warmup.run()
+        response = TestClient(main.app).get("/ready")
+        assert response.status_code == 200
+        assert set(response.json()["warmup_ms"]) == set(main.warmup.tasks)
+
+
+class TestWarmup:
+    """Warmup 실행 테스트"""
+
+    def test_runs_once(self):
+        """run()/start()를 여러 번 불러도 작업은 한 번"""
+        calls = []
+        warmup = Warmup()
+        warmup.add("task", lambda: calls.append(1))
+        threads = [threading.Thread(target=warmup.run) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        warmup.start()
+        assert calls == [1]
+        assert warmup.ready
+
+    def test_shared_then_per_process(self):
+        """fork 전에는 공유 작업만, fork된 프로세스에서는 프로세스별 작업만 다시 실행"""
+        calls = []
+        warmup = Warmup()
+        warmup.add("shared", lambda: calls.append("shared"))
+        warmup.add("local", lambda: calls.append("local"), per_process=True)
+        warmup.run(per_process=False)
+        assert calls == ["shared"]
+        assert not warmup.ready
+        warmup.run()
+        assert warmup.ready
+        # fork된 프로세스처럼 pid를 바꿔 봄
+        warmup._pid = -1
+        assert not warmup.ready
+        warmup.run()
+        assert calls == ["shared", "local", "local"]
+        assert warmup.ready
+
+
+class TestLazy:
+    """Lazy 초기화 테스트"""
+
+    def test_factory_runs_once_under_contention(self):
+        """여러 스레드가 동시에 get() 해도 factory는 한 번, 모두 같은 객체"""
+        calls = []
+        barrier = threading.Barrier(THREADS)
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        lazy = Lazy(factory)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(lazy.get())
+
+        threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert calls == [1]
+        assert len(results) == THREADS
+        assert all(result is results[0] for result in results)
+
+    def test_loaded_and_none(self):
+        """get() 전에는 loaded가 False, None도 만든 값으로 보관 (다시 만들지 않음)"""
+        calls = []
+        lazy = Lazy(lambda: calls.append(1))
+        assert not lazy.loaded
+        assert lazy.get() is None
+        assert lazy.get() is None
+        assert lazy.loaded
+        assert calls == [1]
+
+    def test_failed_factory_retries(self):
+        """factory가 실패하면 값을 남기지 않고 다음 get()에서 다시 시도"""
+        attempts = []
+
+        def factory():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError("일시 오류")
+            return "ok"
+
+        lazy = Lazy(factory)
+        with pytest.raises(OSError):
+            lazy.get()
+        assert not lazy.loaded
+        assert lazy.get() == "ok"
+        assert len(attempts) == 2
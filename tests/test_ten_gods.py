@@ -0,0 +1,116 @@
+# tests/test_ten_gods.py
+# 십성 정수 표가 기존 문자열 비교 방식(오행 상생/상극 + 음양)과 모든 조합에서 같은지 확인한다.
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+from saju_calculator import (
+    BRANCH_CODES, BRANCH_TEN_GODS, EARTHLY_BRANCHES, HEAVENLY_STEMS, PILLARS, STEM_CODES,
+    STEM_TEN_GODS, TEN_GODS, SajuCalculator
+)
+
+client = TestClient(app)
+
+# 기존 계산기의 문자열 표 (비교 기준)
+STEM_ELEMENT_NAMES = {
+    '갑': '나무', '을': '나무', '병': '불', '정': '불', '무': '흙', '기': '흙',
+    '경': '금', '신': '금', '임': '물', '계': '물'
+}
+BRANCH_ELEMENT_NAMES = {
+    '자': '물', '축': '흙', '인': '나무', '묘': '나무', '진': '흙', '사': '불',
+    '오': '불', '미': '흙', '신': '금', '유': '금', '술': '흙', '해': '물'
+}
+ELEMENT_RELATIONS = {
+    '나무': {'생': '불', '극': '흙', '생당': '물', '극당': '금'},
+    '불': {'생': '흙', '극': '금', '생당': '나무', '극당': '물'},
+    '흙': {'생': '금', '극': '물', '생당': '불', '극당': '나무'},
+    '금': {'생': '물', '극': '나무', '생당': '흙', '극당': '불'},
+    '물': {'생': '나무', '극': '불', '생당': '금', '극당': '흙'}
+}
+YANG_STEMS = ('갑', '병', '무', '경', '임')
+YANG_BRANCHES = ('자', '인', '진', '오', '신', '술')
+
+
+def reference_ten_god(day_stem, target_element, target_is_yang):
+    """기존 문자열 비교 방식 십성"""
+    day_element = STEM_ELEMENT_NAMES[day_stem]
+    same = (day_stem in YANG_STEMS) == target_is_yang
+    if day_element == target_element:
+        return '비견' if same else '겁재'
+    relations = ELEMENT_RELATIONS[day_element]
+    if target_element == relations['생']:
+        return '식신' if same else '상관'
+    if target_element == relations['극']:
+        return '편재' if same else '정재'
+    if target_element == relations['극당']:
+        return '편관' if same else '정관'
+    if target_element == relations['생당']:
+        return '편인' if same else '정인'
+    return '알수없음'
+
+
+def reference_stem_ten_god(day_stem, target_stem):
+    return reference_ten_god(day_stem, STEM_ELEMENT_NAMES[target_stem], target_stem in YANG_STEMS)
+
+
+def reference_branch_ten_god(day_stem, target_branch):
+    return reference_ten_god(day_stem, BRANCH_ELEMENT_NAMES[target_branch], target_branch in YANG_BRANCHES)
+
+
+class TestTenGodTables:
+    """십성 표 = 기존 방식 테스트"""
+
+    def test_stem_matrix(self):
+        """천간 10×10 모든 조합"""
+        for day_stem in HEAVENLY_STEMS:
+            for target_stem in HEAVENLY_STEMS:
+                code = STEM_TEN_GODS[STEM_CODES[day_stem]][STEM_CODES[target_stem]]
+                assert TEN_GODS[code] == reference_stem_ten_god(day_stem, target_stem), (day_stem, target_stem)
+
+    def test_branch_matrix(self):
+        """지지 10×12 모든 조합"""
+        for day_stem in HEAVENLY_STEMS:
+            for target_branch in EARTHLY_BRANCHES:
+                code = BRANCH_TEN_GODS[STEM_CODES[day_stem]][BRANCH_CODES[target_branch]]
+                assert TEN_GODS[code] == reference_branch_ten_god(day_stem, target_branch), (day_stem, target_branch)
+
+    def test_calculator_methods(self):
+        """문자열을 받는 계산기 메서드도 같은 결과"""
+        calculator = SajuCalculator()
+        for day_stem in HEAVENLY_STEMS:
+            for target_stem in HEAVENLY_STEMS:
+                assert calculator.calculate_ten_god(day_stem, target_stem) == reference_stem_ten_god(day_stem, target_stem)
+            for target_branch in EARTHLY_BRANCHES:
+                assert calculator.calculate_branch_ten_god(day_stem, target_branch) == \
+                    reference_branch_ten_god(day_stem, target_branch)
+
+    def test_pillar_ten_gods(self):
+        """60갑자 기둥 객체의 십성 (일간 10개 × 기둥 60개)"""
+        pillars = [pillar for row in PILLARS for pillar in row if pillar]
+        assert len(pillars) == 60
+        for day_code, day_stem in enumerate(HEAVENLY_STEMS):
+            for pillar in pillars:
+                assert pillar.ten_god(day_code) == reference_stem_ten_god(day_stem, pillar.stem_name)
+                assert pillar.branch_ten_god(day_code) == reference_branch_ten_god(day_stem, pillar.branch_name)
+
+
+class TestDetailedTenGods:
+    """/saju/detailed 응답의 십성 테스트"""
+
+    @pytest.mark.parametrize("birth_date, birth_time", [
+        ("1990-05-15", "14:30"),
+        ("1984-02-09", "03:10"),
+        ("2001-11-30", "23:45"),
+    ])
+    def test_response_matches_reference(self, birth_date, birth_time):
+        """응답의 기둥별 십성이 기존 방식과 같음"""
+        response = client.post("/saju/detailed", json={
+            "birth_date": birth_date,
+            "birth_time": birth_time,
+            "gender": "여",
+            "birth_place": "서울"
+        })
+        assert response.status_code == 200
+        data = response.json()
+        for pillar in data["four_pillars"].values():
+            assert pillar["ten_god"] == reference_stem_ten_god(data["day_stem"], pillar["stem"])
+            assert pillar["branch_ten_god"] == reference_branch_ten_god(data["day_stem"], pillar["branch"])